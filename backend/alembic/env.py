@@ -21,7 +21,7 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 
 from app.db.base import Base
-from app.models import user, schedule, attendance, score, announcement  # noqa: F401
+from app.models import user, schedule, attendance, score, announcement, announcement_read_state, schedule_rule  # noqa: F401
 
 target_metadata = Base.metadata
 
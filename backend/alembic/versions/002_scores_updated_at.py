@@ -0,0 +1,24 @@
+"""Add updated_at to scores
+
+Revision ID: 002_scores_updated_at
+Revises: 001_initial
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_scores_updated_at'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('scores', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.execute("UPDATE scores SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column('scores', 'updated_at')
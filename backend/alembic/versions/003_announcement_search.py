@@ -0,0 +1,48 @@
+"""Add full-text search to announcements
+
+Revision ID: 003_announcement_search
+Revises: 002_scores_updated_at
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003_announcement_search'
+down_revision = '002_scores_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        'announcements',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', content), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index('ix_announcements_search_vector', 'announcements', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'ix_announcements_title_trgm', 'announcements', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_announcements_content_trgm', 'announcements', ['content'],
+        postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_announcements_content_trgm', table_name='announcements')
+    op.drop_index('ix_announcements_title_trgm', table_name='announcements')
+    op.drop_index('ix_announcements_search_vector', table_name='announcements')
+    op.drop_column('announcements', 'search_vector')
@@ -0,0 +1,41 @@
+"""Add stored summary and content length to announcements
+
+Revision ID: 004_announcement_summary
+Revises: 003_announcement_search
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_announcement_summary'
+down_revision = '003_announcement_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('announcements', sa.Column('summary', sa.String(length=200), server_default='', nullable=False))
+    op.add_column('announcements', sa.Column('content_length', sa.Integer(), server_default='0', nullable=False))
+    # Same shape as announcement_service.summarize(), minus the word-boundary cut.
+    op.execute(
+        """
+        UPDATE announcements
+        SET content_length = char_length(content),
+            summary = CASE
+                WHEN char_length(normalized) <= 200 THEN normalized
+                ELSE rtrim(left(normalized, 199)) || '…'
+            END
+        FROM (
+            SELECT id AS normalized_id, btrim(regexp_replace(content, '\\s+', ' ', 'g')) AS normalized
+            FROM announcements
+        ) AS n
+        WHERE announcements.id = n.normalized_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('announcements', 'content_length')
+    op.drop_column('announcements', 'summary')
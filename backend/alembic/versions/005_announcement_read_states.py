@@ -0,0 +1,37 @@
+"""Add announcement read watermarks
+
+Revision ID: 005_announcement_read_states
+Revises: 004_announcement_summary
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005_announcement_read_states'
+down_revision = '004_announcement_summary'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('announcement_read_states',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('read_through', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('read_ids', postgresql.ARRAY(postgresql.UUID(as_uuid=True)), server_default=sa.text("'{}'"), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    # Unread counts scan only the live announcements newer than a member's watermark.
+    op.create_index(
+        'ix_announcements_live_created_at', 'announcements', ['created_at'],
+        postgresql_where=sa.text('is_deleted IS false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_announcements_live_created_at', table_name='announcements')
+    op.drop_table('announcement_read_states')
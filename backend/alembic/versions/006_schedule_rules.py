@@ -0,0 +1,54 @@
+"""Add recurring schedule rules
+
+Revision ID: 006_schedule_rules
+Revises: 005_announcement_read_states
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '006_schedule_rules'
+down_revision = '005_announcement_read_states'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TYPE recurrence_frequency AS ENUM ('WEEKLY', 'MONTHLY')")
+
+    op.create_table('schedule_rules',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('number', sa.Integer(), sa.Identity(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('location', sa.String(length=200), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('frequency', postgresql.ENUM('WEEKLY', 'MONTHLY', name='recurrence_frequency', create_type=False), nullable=False),
+        sa.Column('interval', sa.Integer(), server_default='1', nullable=False),
+        sa.Column('starts_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('timezone', sa.String(length=64), server_default='Asia/Seoul', nullable=False),
+        sa.Column('exdates', postgresql.ARRAY(sa.DateTime(timezone=True)), server_default=sa.text("'{}'"), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('number')
+    )
+
+    op.add_column('schedules', sa.Column('rule_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('schedules', sa.Column('occurrence_index', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_schedules_rule_id', 'schedules', 'schedule_rules', ['rule_id'], ['id'])
+    op.create_index('ix_schedules_rule_occurrence', 'schedules', ['rule_id', 'occurrence_index'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedules_rule_occurrence', table_name='schedules')
+    op.drop_constraint('fk_schedules_rule_id', 'schedules', type_='foreignkey')
+    op.drop_column('schedules', 'occurrence_index')
+    op.drop_column('schedules', 'rule_id')
+    op.drop_table('schedule_rules')
+    op.execute("DROP TYPE recurrence_frequency")
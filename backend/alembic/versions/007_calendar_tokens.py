@@ -0,0 +1,25 @@
+"""Add calendar feed tokens
+
+Revision ID: 007_calendar_tokens
+Revises: 006_schedule_rules
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_calendar_tokens'
+down_revision = '006_schedule_rules'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('calendar_token', sa.String(length=64), nullable=True))
+    op.create_unique_constraint('uq_users_calendar_token', 'users', ['calendar_token'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_users_calendar_token', 'users', type_='unique')
+    op.drop_column('users', 'calendar_token')
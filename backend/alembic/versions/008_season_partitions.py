@@ -0,0 +1,119 @@
+"""Partition attendance and scores by season
+
+Revision ID: 008_season_partitions
+Revises: 007_calendar_tokens
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import get_settings
+
+# revision identifiers, used by Alembic.
+revision = '008_season_partitions'
+down_revision = '007_calendar_tokens'
+branch_labels = None
+depends_on = None
+
+# Unique indexes are named schema-wide, so the old tables' ones move aside before the new tables take the names.
+UNIQUE_INDEXES = {
+    'attendance': ('attendance_pkey', 'uq_attendance_schedule_user'),
+    'scores': ('scores_pkey', 'uq_score_schedule_user_game'),
+}
+
+
+def _season_columns(table: str) -> list[sa.Column]:
+    if table == 'attendance':
+        return [
+            sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('season', sa.SmallInteger(), nullable=False),
+            sa.Column('schedule_id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('status', postgresql.ENUM('UNKNOWN', 'ATTEND', 'ABSENT', name='attendance_status', create_type=False), nullable=False),
+            sa.Column('comment', sa.String(length=300), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        ]
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('season', sa.SmallInteger(), nullable=False),
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('game_no', sa.SmallInteger(), server_default='1', nullable=False),
+        sa.Column('score', sa.SmallInteger(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    ]
+
+
+def _move_aside(table: str, suffix: str) -> None:
+    op.rename_table(table, f'{table}_{suffix}')
+    for index in UNIQUE_INDEXES[table]:
+        op.execute(f'ALTER INDEX {index} RENAME TO {index}_{suffix}')
+
+
+def _copy_columns(table: str) -> list[str]:
+    return [column.name for column in _season_columns(table) if column.name != 'season']
+
+
+def upgrade() -> None:
+    tz = get_settings().club_timezone
+    op.add_column('schedules', sa.Column(
+        'season', sa.SmallInteger(),
+        sa.Computed(f"(EXTRACT(YEAR FROM starts_at AT TIME ZONE '{tz}'))::smallint", persisted=True),
+        nullable=False,
+    ))
+    op.create_unique_constraint('uq_schedules_id_season', 'schedules', ['id', 'season'])
+
+    current = datetime.now(ZoneInfo(tz)).year
+    seasons = {row[0] for row in op.get_bind().execute(sa.text('SELECT DISTINCT season FROM schedules'))}
+    seasons |= {current, current + 1}
+
+    unique_columns = {'attendance': ['schedule_id', 'user_id', 'season'], 'scores': ['schedule_id', 'user_id', 'game_no', 'season']}
+    for table, (_pkey, unique_name) in UNIQUE_INDEXES.items():
+        _move_aside(table, 'unpartitioned')
+        op.create_table(table,
+            *_season_columns(table),
+            sa.ForeignKeyConstraint(
+                ['schedule_id', 'season'], ['schedules.id', 'schedules.season'],
+                name=f'fk_{table}_schedule_season', onupdate='CASCADE',
+            ),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+            sa.PrimaryKeyConstraint('id', 'season'),
+            sa.UniqueConstraint(*unique_columns[table], name=unique_name),
+            postgresql_partition_by='RANGE (season)',
+        )
+        for season in sorted(seasons):
+            op.execute(f'CREATE TABLE {table}_y{season} PARTITION OF {table} FOR VALUES FROM ({season}) TO ({season + 1})')
+        columns = _copy_columns(table)
+        op.execute(
+            f'INSERT INTO {table} ({", ".join(columns)}, season) '
+            f'SELECT {", ".join(f"old.{name}" for name in columns)}, schedules.season '
+            f'FROM {table}_unpartitioned AS old JOIN schedules ON schedules.id = old.schedule_id'
+        )
+        op.drop_table(f'{table}_unpartitioned')
+        op.execute(f'ANALYZE {table}')
+
+
+def downgrade() -> None:
+    unique_columns = {'attendance': ['schedule_id', 'user_id'], 'scores': ['schedule_id', 'user_id', 'game_no']}
+    for table, (_pkey, unique_name) in UNIQUE_INDEXES.items():
+        _move_aside(table, 'partitioned')
+        op.create_table(table,
+            *(column for column in _season_columns(table) if column.name != 'season'),
+            sa.ForeignKeyConstraint(['schedule_id'], ['schedules.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint(*unique_columns[table], name=unique_name),
+        )
+        columns = ', '.join(_copy_columns(table))
+        op.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_partitioned')
+        # Dropping the parent drops every season partition with it.
+        op.drop_table(f'{table}_partitioned')
+
+    op.drop_constraint('uq_schedules_id_season', 'schedules', type_='unique')
+    op.drop_column('schedules', 'season')
@@ -0,0 +1,33 @@
+"""Add member search indexes
+
+Revision ID: 009_member_search
+Revises: 008_season_partitions
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_member_search'
+down_revision = '008_season_partitions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # pg_trgm was created by 003.
+    op.create_index('ix_users_name_key', 'users', [sa.text('(lower(name) COLLATE "C")'), 'id'])
+    op.create_index('ix_users_email_key', 'users', [sa.text('(email COLLATE "C")')])
+    op.create_index('ix_users_name_trgm', 'users', [sa.text('lower(name) gin_trgm_ops')], postgresql_using='gin')
+    op.create_index(
+        'ix_users_email_trgm', 'users', ['email'],
+        postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_name_trgm', table_name='users')
+    op.drop_index('ix_users_email_key', table_name='users')
+    op.drop_index('ix_users_name_key', table_name='users')
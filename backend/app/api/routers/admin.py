@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+
+from app.core.cache import response_cache
+from app.core.deps import get_current_admin
+from app.core.invalidation import invalidation_listener
+from app.core.profiling import render_text, request_profiler
+from app.core.slow_queries import slow_query_log
+from app.core.tracing import otlp_document, tracer
+from app.db.partitions import season_partitions
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(get_current_admin)])
+
+
+@router.get("/cache")
+async def cache_stats() -> dict[str, Any]:
+    return {**response_cache.stats(), "invalidation": invalidation_listener.stats()}
+
+
+@router.delete("/cache", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_cache() -> None:
+    await response_cache.clear()
+
+
+@router.get("/partitions")
+async def partition_stats() -> dict[str, Any]:
+    return season_partitions.stats()
+
+
+@router.get("/slow-queries")
+async def slow_queries() -> dict[str, Any]:
+    return slow_query_log.stats()
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries() -> None:
+    slow_query_log.clear()
+
+
+@router.get("/traces")
+async def recent_traces(limit: int = Query(default=20, ge=1, le=1000)) -> dict[str, Any]:
+    memory = tracer.memory()
+    return otlp_document(tracer.service_name, memory.spans(limit) if memory else [])
+
+
+@router.get("/profiles")
+async def list_profiles() -> list[dict[str, Any]]:
+    return [profile.summary() for profile in reversed(request_profiler.profiles)]
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: int, format: Literal["html", "text", "json"] = "html") -> Response:
+    profile = request_profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "json":
+        return JSONResponse({**profile.summary(), "sql_sites": profile.sql_sites, "call_tree": profile.text})
+    if format == "html" and profile.html is not None:
+        return HTMLResponse(profile.html)
+    return PlainTextResponse(render_text(profile))
@@ -2,28 +2,94 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import ANNOUNCEMENTS_TAG, response_cache
+from app.core.conditional import conditional_response, make_etag
+from app.core.config import get_settings
 from app.core.deps import get_current_active_user, get_current_admin, get_db_session
+from app.core.serialization import dump_rows, to_json
 from app.models.announcement import Announcement
 from app.models.user import User
-from app.schemas.announcement import AnnouncementCreate, AnnouncementRead, AnnouncementUpdate
+from app.schemas.announcement import AnnouncementCreate, AnnouncementListItem, AnnouncementRead, AnnouncementSearchResult, AnnouncementUpdate, UnreadCount
 from app.services.announcement_service import announcement_service
 
 router = APIRouter(prefix="/announcements", tags=["announcements"])
 
 
-@router.get("", response_model=list[AnnouncementRead])
+@router.get("", response_model=list[AnnouncementListItem])
 async def list_announcements(
     *,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+) -> Response:
+    lookup = await response_cache.lookup(request, "announcements.list", current_user.role, page=page, size=size)
+    if lookup.hit is not None:
+        return lookup.hit
+
+    count, last_modified = await announcement_service.get_list_version(db)
+    etag = make_etag("announcements", count, last_modified)
+    if (not_modified := conditional_response(request, response, etag=etag, last_modified=last_modified)) is not None:
+        return not_modified
+
+    if get_settings().fast_path_serialization:
+        body = dump_rows(AnnouncementListItem, await announcement_service.list_announcement_rows(db, page=page, size=size))
+    else:
+        items, _total = await announcement_service.list_announcements(db, page=page, size=size)
+        body = to_json(list[AnnouncementListItem], items)
+    return await lookup.store(body, tags=[ANNOUNCEMENTS_TAG], etag=etag, last_modified=last_modified)
+
+
+@router.get("/search", response_model=list[AnnouncementSearchResult])
+async def search_announcements(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+    q: str = Query(min_length=1, max_length=100),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-) -> list[Announcement]:
-    items, _total = await announcement_service.list_announcements(db, page=page, size=size)
-    return items
+) -> Response:
+    lookup = await response_cache.lookup(request, "announcements.search", current_user.role, q=q, page=page, size=size)
+    if lookup.hit is not None:
+        return lookup.hit
+
+    rows = await announcement_service.search_announcement_rows(db, q=q, page=page, size=size)
+    return await lookup.store(dump_rows(AnnouncementSearchResult, rows), tags=[ANNOUNCEMENTS_TAG])
+
+
+@router.get("/unread-count", response_model=UnreadCount)
+async def get_unread_count(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> UnreadCount:
+    count, has_more = await announcement_service.get_unread_count(db, user=current_user)
+    return UnreadCount(count=count, has_more=has_more)
+
+
+@router.post("/read", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_all_read(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> None:
+    await announcement_service.mark_all_read(db, user=current_user)
+
+
+@router.post("/{announcement_id}/read", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_read(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+    announcement_id: UUID,
+) -> None:
+    await announcement_service.mark_read(db, user=current_user, announcement_id=announcement_id)
 
 
 @router.post("", response_model=AnnouncementRead, status_code=status.HTTP_201_CREATED)
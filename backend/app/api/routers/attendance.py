@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import response_cache, schedule_tag
+from app.core.conditional import conditional_response, is_conditional, make_etag
+from app.core.config import get_settings
 from app.core.deps import get_current_active_user, get_current_admin, get_db_session
+from app.core.serialization import dump_rows, to_json
 from app.models.attendance import Attendance
 from app.models.user import User
 from app.schemas.attendance import AttendanceRead, AttendanceUpsert
@@ -17,11 +21,34 @@ router = APIRouter(tags=["attendance"])
 @router.get("/schedules/{schedule_id}/attendance", response_model=list[AttendanceRead])
 async def list_schedule_attendance(
     *,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
     schedule_id: UUID,
-) -> list[Attendance]:
-    return await attendance_service.list_schedule_attendance(db, schedule_id=schedule_id)
+) -> Response:
+    lookup = await response_cache.lookup(request, "attendance.schedule", current_user.role, schedule_id=schedule_id)
+    if lookup.hit is not None:
+        if is_conditional(request):
+            # The cached validators may outlive the schedule; a schedule that is gone is a 404, not a 304.
+            await attendance_service.ensure_schedule_exists(db, schedule_id=schedule_id)
+        return lookup.hit
+
+    count, last_modified = await attendance_service.get_schedule_attendance_version(db, schedule_id=schedule_id)
+    if count == 0:
+        # Rows imply the schedule exists; without any, check before the ETag can answer 304.
+        await attendance_service.ensure_schedule_exists(db, schedule_id=schedule_id)
+    etag = make_etag("attendance", schedule_id, count, last_modified)
+    if (not_modified := conditional_response(request, response, etag=etag, last_modified=last_modified)) is not None:
+        return not_modified
+
+    if count == 0:
+        body = dump_rows(AttendanceRead, [])
+    elif get_settings().fast_path_serialization:
+        body = dump_rows(AttendanceRead, await attendance_service.list_schedule_attendance_rows(db, schedule_id=schedule_id))
+    else:
+        body = to_json(list[AttendanceRead], await attendance_service.list_schedule_attendance(db, schedule_id=schedule_id))
+    return await lookup.store(body, tags=[schedule_tag(schedule_id)], etag=etag, last_modified=last_modified)
 
 
 @router.put("/schedules/{schedule_id}/attendance/me", response_model=AttendanceRead)
@@ -54,6 +81,9 @@ async def get_my_attendance(
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-) -> list[Attendance]:
+) -> list[Attendance] | Response:
+    if get_settings().fast_path_serialization:
+        rows = await attendance_service.get_my_attendance_rows(db, user_id=current_user.id, page=page, size=size)
+        return Response(dump_rows(AttendanceRead, rows), media_type="application/json")
     items, _total = await attendance_service.get_my_attendance(db, user_id=current_user.id, page=page, size=size)
     return items
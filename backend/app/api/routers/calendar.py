@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import SCHEDULES_TAG, response_cache, user_tag
+from app.core.conditional import conditional_response, make_etag
+from app.core.deps import get_current_active_user, get_db_session
+from app.models.user import User
+from app.schemas.calendar import CalendarTokenRead
+from app.services.calendar_service import CALENDAR_MEDIA_TYPE, calendar_service, feed_window, render_feed
+
+router = APIRouter(tags=["calendar"])
+
+
+def _token_read(request: Request, token: str) -> CalendarTokenRead:
+    return CalendarTokenRead(token=token, url=str(request.url_for("calendar_feed").include_query_params(token=token)))
+
+
+@router.get("/calendar.ics", name="calendar_feed", response_class=Response, responses={200: {"content": {"text/calendar": {}}}})
+async def calendar_feed(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_session),
+    token: str = Query(min_length=1, max_length=64),
+) -> Response:
+    # Calendar apps poll without credentials, so the secret token in the URL is the only key. A cache hit,
+    # including a 304, answers without touching the database.
+    lookup = await response_cache.lookup(request, "calendar.feed", None, token=token)
+    if lookup.hit is not None:
+        return lookup.hit
+
+    user = await calendar_service.get_feed_user(db, token=token)
+    day, starts_from, occurrences_to = feed_window()
+    schedules, answers, updated = await calendar_service.get_feed_version(db, user_id=user.id, starts_from=starts_from)
+    last_modified = max(value for value in (updated, user.updated_at, day) if value is not None)
+    etag = make_etag("calendar", user.id, day, schedules, answers, last_modified)
+    if (not_modified := conditional_response(request, response, etag=etag, last_modified=last_modified)) is not None:
+        return not_modified
+
+    events = await calendar_service.feed_events(db, user_id=user.id, starts_from=starts_from, occurrences_to=occurrences_to)
+    return lookup.stream(
+        render_feed(events, attendee_name=user.name, attendee_email=user.email),
+        tags=[SCHEDULES_TAG, user_tag(user.id)],
+        etag=etag,
+        last_modified=last_modified,
+        media_type=CALENDAR_MEDIA_TYPE,
+    )
+
+
+@router.get("/calendar/token", response_model=CalendarTokenRead)
+async def get_calendar_token(*, request: Request, current_user: User = Depends(get_current_active_user)) -> CalendarTokenRead:
+    if current_user.calendar_token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No calendar token issued")
+    return _token_read(request, current_user.calendar_token)
+
+
+@router.post("/calendar/token", response_model=CalendarTokenRead)
+async def issue_calendar_token(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> CalendarTokenRead:
+    token = await calendar_service.issue_token(db, user=current_user)
+    return _token_read(request, token)
+
+
+@router.delete("/calendar/token", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_calendar_token(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> None:
+    await calendar_service.revoke_token(db, user=current_user)
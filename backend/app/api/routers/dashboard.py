@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.conditional import body_etag, is_fresh, not_modified_response, validator_headers
+from app.core.deps import get_current_active_user, get_db_session
+from app.models.user import User
+from app.schemas.dashboard import DashboardRead
+from app.services.dashboard_service import dashboard_service
+
+router = APIRouter(tags=["dashboard"])
+
+
+@router.get("/dashboard", response_model=DashboardRead)
+async def get_dashboard(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    # The sections use their own sessions; hand the auth lookup's connection back to the pool first.
+    # close() keeps the loaded user attributes readable, where rollback() would expire them.
+    await db.close()
+    body = await dashboard_service.get_dashboard(user=current_user)
+    etag = body_etag(body)
+    if is_fresh(request, etag):
+        return not_modified_response(etag)
+    return Response(body, media_type="application/json", headers=validator_headers(etag))
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.deps import get_current_active_user, get_current_stream_user, get_db_session
+from app.core.events import schedule_events
+from app.core.security import create_stream_token
+from app.models.user import User
+from app.schemas.auth import StreamToken
+from app.services.schedule_service import schedule_service
+
+router = APIRouter(tags=["events"])
+
+
+@router.post("/schedules/{schedule_id}/events/token", response_model=StreamToken)
+async def issue_stream_token(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+    schedule_id: UUID,
+) -> StreamToken:
+    await schedule_service.get_schedule(db, schedule_id=schedule_id)
+    return StreamToken(
+        token=create_stream_token(current_user.id, schedule_id),
+        expires_in=get_settings().stream_token_expire_seconds,
+    )
+
+
+@router.get("/schedules/{schedule_id}/events", response_class=StreamingResponse)
+async def schedule_event_stream(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    _: User = Depends(get_current_stream_user),
+    schedule_id: UUID,
+) -> StreamingResponse:
+    await schedule_service.get_schedule(db, schedule_id=schedule_id)
+    # Hand the connection back to the pool; the stream may stay open for hours.
+    await db.close()
+
+    return StreamingResponse(
+        schedule_events.subscribe(schedule_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_active_user, get_current_admin, get_db_session
+from app.models.schedule_rule import ScheduleRule
+from app.models.user import User
+from app.schemas.schedule_rule import ScheduleRuleCreate, ScheduleRuleRead, ScheduleRuleUpdate
+from app.services.schedule_rule_service import schedule_rule_service
+
+router = APIRouter(prefix="/schedule-rules", tags=["schedules"])
+
+
+@router.get("", response_model=list[ScheduleRuleRead])
+async def list_schedule_rules(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    _: User = Depends(get_current_active_user),
+) -> list[ScheduleRule]:
+    return await schedule_rule_service.list_rules(db)
+
+
+@router.post("", response_model=ScheduleRuleRead, status_code=status.HTTP_201_CREATED)
+async def create_schedule_rule(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    current_admin: User = Depends(get_current_admin),
+    payload: ScheduleRuleCreate,
+) -> ScheduleRule:
+    return await schedule_rule_service.create_rule(db, payload=payload, created_by=current_admin.id)
+
+
+@router.get("/{rule_id}", response_model=ScheduleRuleRead)
+async def get_schedule_rule(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    _: User = Depends(get_current_active_user),
+    rule_id: UUID,
+) -> ScheduleRule:
+    return await schedule_rule_service.get_rule(db, rule_id=rule_id)
+
+
+@router.patch("/{rule_id}", response_model=ScheduleRuleRead)
+async def update_schedule_rule(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    _: User = Depends(get_current_admin),
+    rule_id: UUID,
+    payload: ScheduleRuleUpdate,
+) -> ScheduleRule:
+    return await schedule_rule_service.update_rule(db, rule_id=rule_id, payload=payload)
@@ -3,14 +3,21 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import SCHEDULES_TAG, response_cache, schedule_tag, user_tag
+from app.core.conditional import conditional_response, is_conditional, make_etag
+from app.core.config import get_settings
 from app.core.deps import get_current_active_user, get_current_admin, get_db_session
+from app.core.serialization import dump_rows, to_json
 from app.models.schedule import Schedule
 from app.models.user import User
-from app.schemas.schedule import ScheduleCreate, ScheduleRead, ScheduleUpdate
-from app.services.schedule_service import schedule_service
+from app.schemas.schedule import ScheduleCreate, ScheduleMonthEntry, ScheduleRead, ScheduleUpdate
+from app.schemas.schedule_full import ScheduleFullRead
+from app.services.schedule_detail_service import parse_include, schedule_detail_service
+from app.services.schedule_rule_service import list_day
+from app.services.schedule_service import month_bounds, schedule_service
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
@@ -18,15 +25,42 @@ router = APIRouter(prefix="/schedules", tags=["schedules"])
 @router.get("", response_model=list[ScheduleRead])
 async def list_schedules(
     *,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     starts_from: datetime | None = Query(default=None),
     starts_to: datetime | None = Query(default=None),
-) -> list[Schedule]:
-    items, _total = await schedule_service.list_schedules(db, page=page, size=size, starts_from=starts_from, starts_to=starts_to)
-    return items
+) -> Response:
+    # Without an end date the list runs to each rule's next occurrence from today, which moves at midnight.
+    horizon = list_day().date() if starts_to is None else None
+    lookup = await response_cache.lookup(
+        request,
+        "schedules.list",
+        current_user.role,
+        page=page,
+        size=size,
+        starts_from=starts_from,
+        starts_to=starts_to,
+        horizon=horizon,
+    )
+    if lookup.hit is not None:
+        return lookup.hit
+
+    count, last_modified = await schedule_service.get_list_version(db, starts_from=starts_from, starts_to=starts_to)
+    etag = make_etag("schedules", count, last_modified, horizon)
+    if (not_modified := conditional_response(request, response, etag=etag, last_modified=last_modified)) is not None:
+        return not_modified
+
+    if get_settings().fast_path_serialization:
+        rows = await schedule_service.list_schedule_rows(db, page=page, size=size, starts_from=starts_from, starts_to=starts_to)
+        body = dump_rows(ScheduleRead, rows)
+    else:
+        items = await schedule_service.list_schedules(db, page=page, size=size, starts_from=starts_from, starts_to=starts_to)
+        body = to_json(list[ScheduleRead], items)
+    return await lookup.store(body, tags=[SCHEDULES_TAG], etag=etag, last_modified=last_modified)
 
 
 @router.post("", response_model=ScheduleRead, status_code=status.HTTP_201_CREATED)
@@ -39,14 +73,73 @@ async def create_schedule(
     return await schedule_service.create_schedule(db, payload=payload, created_by=current_admin.id)
 
 
+@router.get("/calendar", response_model=list[ScheduleMonthEntry])
+async def get_month_calendar(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+    month: str = Query(pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="YYYY-MM in CLUB_TIMEZONE"),
+) -> Response:
+    lookup = await response_cache.lookup(request, "schedules.calendar", current_user.role, month=month)
+    if lookup.hit is not None:
+        return lookup.hit
+
+    starts_from, starts_to = month_bounds(month)
+    rows = await schedule_service.list_month_rows(db, starts_from=starts_from, starts_to=starts_to)
+    # Attendance and score writes only invalidate their own schedule's tag.
+    tags = [SCHEDULES_TAG, *(schedule_tag(row["id"]) for row in rows)]  # type: ignore[arg-type]
+    return await lookup.store(dump_rows(ScheduleMonthEntry, rows), tags=tags)
+
+
 @router.get("/{schedule_id}", response_model=ScheduleRead)
 async def get_schedule(
     *,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
     schedule_id: UUID,
-) -> Schedule:
-    return await schedule_service.get_schedule(db, schedule_id=schedule_id)
+) -> Response:
+    lookup = await response_cache.lookup(request, "schedules.detail", current_user.role, schedule_id=schedule_id)
+    if lookup.hit is not None:
+        if is_conditional(request):
+            # The cached validators may outlive the row; a schedule that is gone is a 404, not a 304.
+            await schedule_service.get_schedule(db, schedule_id=schedule_id)
+        return lookup.hit
+
+    schedule = await schedule_service.get_schedule(db, schedule_id=schedule_id)
+    # Occurrences of a recurring rule also change when the rule is edited.
+    tags = [schedule_tag(schedule_id), *([SCHEDULES_TAG] if schedule.rule_id is not None else [])]
+    return await lookup.store(
+        to_json(ScheduleRead, schedule),
+        tags=tags,
+        etag=make_etag("schedule", schedule.id, schedule.updated_at),
+        last_modified=schedule.updated_at,
+    )
+
+
+@router.get("/{schedule_id}/full", response_model=ScheduleFullRead)
+async def get_schedule_full(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+    schedule_id: UUID,
+    include: str | None = Query(default=None, description="Comma-separated sections: attendance, scores, stats"),
+) -> Response:
+    sections = parse_include(include)
+    lookup = await response_cache.lookup(
+        request, "schedules.full", current_user.role, schedule_id=schedule_id, include=",".join(sorted(sections))
+    )
+    if lookup.hit is not None:
+        return lookup.hit
+
+    data, member_ids = await schedule_detail_service.get_schedule_full(db, schedule_id=schedule_id, include=sections)
+    # Member names are embedded, so renaming a member must drop this entry as well.
+    tags = [schedule_tag(schedule_id), *(user_tag(user_id) for user_id in member_ids)]
+    if data["schedule"]["rule_id"] is not None:  # type: ignore[index]
+        tags.append(SCHEDULES_TAG)
+    return await lookup.store(to_json(ScheduleFullRead, data), tags=tags)
 
 
 @router.patch("/{schedule_id}", response_model=ScheduleRead)
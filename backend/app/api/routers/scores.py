@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import SCHEDULES_TAG, response_cache, schedule_tag, user_tag
+from app.core.conditional import conditional_response, is_conditional, make_etag
+from app.core.config import get_settings
 from app.core.deps import get_current_active_user, get_db_session
+from app.core.serialization import dump_rows, to_json
 from app.models.score import Score
 from app.models.user import User
-from app.schemas.score import ScoreCreate, ScoreRead, ScoreUpdate
+from app.schemas.score import ScoreCreate, ScoreRead, ScoreTrendPoint, ScoreUpdate
 from app.services.score_service import score_service
 
 router = APIRouter(tags=["scores"])
@@ -17,11 +21,35 @@ router = APIRouter(tags=["scores"])
 @router.get("/schedules/{schedule_id}/scores", response_model=list[ScoreRead])
 async def list_schedule_scores(
     *,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
     schedule_id: UUID,
-) -> list[Score]:
-    return await score_service.list_schedule_scores(db, schedule_id=schedule_id)
+) -> Response:
+    lookup = await response_cache.lookup(request, "scores.schedule", current_user.role, schedule_id=schedule_id)
+    if lookup.hit is not None:
+        if is_conditional(request):
+            # The cached validators may outlive the schedule; a schedule that is gone is a 404, not a 304.
+            await score_service.ensure_schedule_exists(db, schedule_id=schedule_id)
+        return lookup.hit
+
+    # Scores are hard-deleted, so max(updated_at) cannot back Last-Modified; the count keeps the ETag honest.
+    count, last_modified = await score_service.get_schedule_scores_version(db, schedule_id=schedule_id)
+    if count == 0:
+        # Rows imply the schedule exists; without any, check before the ETag can answer 304.
+        await score_service.ensure_schedule_exists(db, schedule_id=schedule_id)
+    etag = make_etag("scores", schedule_id, count, last_modified)
+    if (not_modified := conditional_response(request, response, etag=etag)) is not None:
+        return not_modified
+
+    if count == 0:
+        body = dump_rows(ScoreRead, [])
+    elif get_settings().fast_path_serialization:
+        body = dump_rows(ScoreRead, await score_service.list_schedule_score_rows(db, schedule_id=schedule_id))
+    else:
+        body = to_json(list[ScoreRead], await score_service.list_schedule_scores(db, schedule_id=schedule_id))
+    return await lookup.store(body, tags=[schedule_tag(schedule_id)], etag=etag)
 
 
 @router.post("/schedules/{schedule_id}/scores", response_model=ScoreRead, status_code=status.HTTP_201_CREATED)
@@ -58,14 +86,21 @@ async def delete_score(
     await score_service.delete_score(db, score_id=score_id, actor_user_id=current_user.id, is_admin=is_admin)
 
 
-@router.get("/scores/me/trend")
+@router.get("/scores/me/trend", response_model=list[ScoreTrendPoint])
 async def my_trend(
     *,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_active_user),
     limit: int = Query(50, ge=1, le=200),
-) -> list[dict[str, object]]:
-    return await score_service.get_my_trend(db, user_id=current_user.id, limit=limit)
+) -> Response:
+    lookup = await response_cache.lookup(request, "scores.trend", current_user.role, user_id=current_user.id, limit=limit)
+    if lookup.hit is not None:
+        return lookup.hit
+
+    items = await score_service.get_my_trend(db, user_id=current_user.id, limit=limit)
+    # Trend rows carry schedule titles and start times, so schedule edits invalidate them too.
+    return await lookup.store(to_json(list[ScoreTrendPoint], items), tags=[user_tag(current_user.id), SCHEDULES_TAG])
 
 
 @router.get("/scores/me/high")
@@ -78,11 +113,17 @@ async def my_high_score(
     return {"high_score": high_score}
 
 
-@router.get("/schedules/{schedule_id}/stats")
+@router.get("/schedules/{schedule_id}/stats", response_model=dict[str, float | int | None])
 async def schedule_stats(
     *,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
     schedule_id: UUID,
-) -> dict[str, float | int | None]:
-    return await score_service.get_schedule_stats(db, schedule_id=schedule_id)
+) -> Response:
+    lookup = await response_cache.lookup(request, "scores.stats", current_user.role, schedule_id=schedule_id)
+    if lookup.hit is not None:
+        return lookup.hit
+
+    stats = await score_service.get_schedule_stats(db, schedule_id=schedule_id)
+    return await lookup.store(to_json(dict[str, float | int | None], stats), tags=[schedule_tag(schedule_id)])
@@ -1,18 +1,64 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.deps import get_current_active_user, get_current_admin, get_db_session
+from app.core.serialization import dump_rows
 from app.models.user import User
-from app.schemas.user import ProfileUpdate, UserCreate, UserRead, UserUpdate
+from app.schemas.user import (
+    MemberType,
+    ProfileUpdate,
+    UserCreate,
+    UserImportResult,
+    UserRead,
+    UserRole,
+    UserSearchPage,
+    UserUpdate,
+)
 from app.services.user_service import user_service
 
 router = APIRouter(tags=["users"])
 
 
+async def _import_rows(request: Request) -> list[dict[str, Any]]:
+    """Rows of a ``text/csv`` body (header row first) or of a JSON array of objects."""
+    body = await request.body()
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type == "text/csv":
+        try:
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="CSV must be UTF-8")
+        # The reader parses lazily, so malformed input surfaces while the rows are collected.
+        try:
+            # Empty cells mean "not given"; cells past the header (key None) are ignored.
+            rows: Any = [{key: value or None for key, value in row.items() if key} for row in reader]
+        except csv.Error as exc:
+            # line_num counts the lines read before the one that failed.
+            raise HTTPException(status_code=400, detail=f"Invalid CSV on line {reader.line_num + 1}: {exc}")
+    else:
+        try:
+            rows = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or text/csv")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise HTTPException(status_code=422, detail="Expected a JSON array of objects")
+    if not rows:
+        raise HTTPException(status_code=422, detail="Nothing to import")
+    limit = get_settings().user_import_max_rows
+    if len(rows) > limit:
+        raise HTTPException(status_code=413, detail=f"At most {limit} rows per import")
+    return rows
+
+
 @router.get("/users", response_model=list[UserRead])
 async def list_users(
     *,
@@ -20,7 +66,10 @@ async def list_users(
     _: User = Depends(get_current_admin),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-) -> list[User]:
+) -> list[User] | Response:
+    if get_settings().fast_path_serialization:
+        rows = await user_service.list_user_rows(db, page=page, size=size)
+        return Response(dump_rows(UserRead, rows), media_type="application/json")
     items, _total = await user_service.list_users(db, page=page, size=size)
     return items
 
@@ -30,6 +79,35 @@ async def create_user(*, db: AsyncSession = Depends(get_db_session), _: User = D
     return await user_service.create_user(db, payload=payload)
 
 
+@router.post("/users/import", response_model=UserImportResult, status_code=status.HTTP_201_CREATED)
+async def import_users(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    _: User = Depends(get_current_admin),
+) -> UserImportResult:
+    users = await user_service.import_users(db, rows=await _import_rows(request))
+    return UserImportResult.model_validate({"created": len(users), "users": users})
+
+
+@router.get("/users/search", response_model=UserSearchPage)
+async def search_users(
+    *,
+    db: AsyncSession = Depends(get_db_session),
+    _: User = Depends(get_current_admin),
+    q: str | None = Query(None, max_length=100),
+    role: UserRole | None = None,
+    member_type: MemberType | None = None,
+    is_active: bool | None = None,
+    cursor: str | None = Query(None, max_length=512),
+    size: int = Query(20, ge=1, le=100),
+) -> UserSearchPage:
+    rows, next_cursor = await user_service.search_user_rows(
+        db, q=q, role=role, member_type=member_type, is_active=is_active, cursor=cursor, size=size
+    )
+    return UserSearchPage.model_validate({"items": rows, "next_cursor": next_cursor})
+
+
 @router.get("/users/{user_id}", response_model=UserRead)
 async def get_user(*, db: AsyncSession = Depends(get_db_session), _: User = Depends(get_current_admin), user_id: UUID) -> User:
     return await user_service.get_user(db, user_id=user_id)
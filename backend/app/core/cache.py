@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import itertools
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.conditional import body_etag, is_fresh, not_modified_response, validator_headers
+from app.core.config import get_settings
+
+SCHEDULES_TAG = "schedules"
+ANNOUNCEMENTS_TAG = "announcements"
+
+
+def schedule_tag(schedule_id: UUID) -> str:
+    return f"schedule:{schedule_id}"
+
+
+def user_tag(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: datetime | None
+    media_type: str = JSON_MEDIA_TYPE
+
+    def encode(self) -> bytes:
+        header = json.dumps([self.etag, self.last_modified.isoformat() if self.last_modified else None, self.media_type])
+        return header.encode() + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> CachedResponse:
+        header, _, body = raw.partition(b"\n")
+        etag, last_modified, *rest = json.loads(header)
+        return cls(body, etag, datetime.fromisoformat(last_modified) if last_modified else None, *rest)
+
+    def to_response(self, request: Request) -> Response:
+        if is_fresh(request, self.etag, self.last_modified):
+            return not_modified_response(self.etag, self.last_modified)
+        return Response(self.body, media_type=self.media_type, headers=validator_headers(self.etag, self.last_modified))
+
+
+class CacheBackend:
+    """Storage for encoded responses. Subclasses must keep the tag index consistent with entries."""
+
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, *, tags: Iterable[str], ttl: float) -> None:
+        raise NotImplementedError
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+class NullCacheBackend(CacheBackend):
+    async def get(self, key: str) -> bytes | None:
+        return None
+
+    async def set(self, key: str, value: bytes, *, tags: Iterable[str], ttl: float) -> None:
+        return None
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        return 0
+
+    async def clear(self) -> None:
+        return None
+
+
+class LRUCacheBackend(CacheBackend):
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[bytes, float, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _tags = entry
+        if expires_at <= time.monotonic():
+            self._discard(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, *, tags: Iterable[str], ttl: float) -> None:
+        self._discard(key)
+        tag_tuple = tuple(tags)
+        self._entries[key] = (value, time.monotonic() + ttl, tag_tuple)
+        for tag in tag_tuple:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            for key in self._tags.pop(tag, set()):
+                if self._discard(key):
+                    removed += 1
+        return removed
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _discard(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared backend for multi-worker deployments. Requires the optional ``redis`` package."""
+
+    def __init__(self, *, url: str, prefix: str = "degururu:cache:") -> None:
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package") from exc
+        self._redis = aioredis.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, *, tags: Iterable[str], ttl: float) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._prefix + key, value, px=int(ttl * 1000))
+            for tag in tags:
+                tag_key = f"{self._prefix}tag:{tag}"
+                pipe.sadd(tag_key, key)
+                pipe.pexpire(tag_key, int(ttl * 1000))
+            await pipe.execute()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            tag_key = f"{self._prefix}tag:{tag}"
+            keys = await self._redis.smembers(tag_key)
+            if keys:
+                removed += await self._redis.delete(*(self._prefix + k.decode() for k in keys))
+            await self._redis.delete(tag_key)
+        return removed
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(match=self._prefix + "*"):
+            await self._redis.delete(key)
+
+
+class CacheLookup:
+    def __init__(self, cache: ResponseCache, key: str, hit: Response | None, generation: int) -> None:
+        self._cache = cache
+        self.key = key
+        self.hit = hit
+        self._generation = generation
+
+    async def store(
+        self,
+        body: bytes,
+        *,
+        tags: Iterable[str],
+        etag: str | None = None,
+        last_modified: datetime | None = None,
+    ) -> Response:
+        cached = CachedResponse(body, etag or body_etag(body), last_modified)
+        await self._cache.put(self.key, cached, tags=tuple(tags), generation=self._generation)
+        return Response(body, media_type=JSON_MEDIA_TYPE, headers=validator_headers(cached.etag, cached.last_modified))
+
+    def stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        tags: Iterable[str],
+        etag: str,
+        last_modified: datetime | None = None,
+        media_type: str,
+    ) -> StreamingResponse:
+        """Stream ``chunks`` to the client and cache the body once the last one is sent.
+
+        The validators go out before the body, so ``etag`` must come from a version rather than the bytes.
+        A client that disconnects early leaves nothing in the cache.
+        """
+        tags = tuple(tags)
+
+        async def send_and_store() -> AsyncIterator[bytes]:
+            parts: list[bytes] = []
+            for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+            cached = CachedResponse(b"".join(parts), etag, last_modified, media_type)
+            await self._cache.put(self.key, cached, tags=tags, generation=self._generation)
+
+        return StreamingResponse(send_and_store(), media_type=media_type, headers=validator_headers(etag, last_modified))
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend, *, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.skipped_stores = 0
+        self._clock = itertools.count(1)
+        self._generation = 0
+        self._tag_generations: dict[str, int] = {}
+
+    @staticmethod
+    def make_key(route: str, role: object, **params: object) -> str:
+        role_value = getattr(role, "value", role)
+        encoded = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{route}|{role_value}|{encoded}"
+
+    async def lookup(self, request: Request, route: str, role: object, **params: object) -> CacheLookup:
+        key = self.make_key(route, role, **params)
+        raw = await self.backend.get(key)
+        if raw is None:
+            self.misses += 1
+            return CacheLookup(self, key, None, self._generation)
+        self.hits += 1
+        return CacheLookup(self, key, CachedResponse.decode(raw).to_response(request), self._generation)
+
+    async def put(self, key: str, cached: CachedResponse, *, tags: tuple[str, ...], generation: int) -> None:
+        await self._store(key, cached.encode(), tags=tags, generation=generation)
+
+    async def get_or_set(self, key: str, *, tags: Iterable[str], load: Callable[[], Awaitable[bytes]]) -> bytes:
+        raw = await self.backend.get(key)
+        if raw is not None:
+            self.hits += 1
+            return raw
+        self.misses += 1
+        generation = self._generation
+        value = await load()
+        await self._store(key, value, tags=tuple(tags), generation=generation)
+        return value
+
+    async def _store(self, key: str, value: bytes, *, tags: tuple[str, ...], generation: int) -> None:
+        # A write that invalidated one of these tags after the miss may have raced the read;
+        # storing the result would pin pre-write data until the TTL expires.
+        if any(self._tag_generations.get(tag, 0) > generation for tag in tags):
+            self.skipped_stores += 1
+            return
+        await self.backend.set(key, value, tags=tags, ttl=self.ttl)
+
+    async def invalidate(self, *tags: str) -> None:
+        self._generation = next(self._clock)
+        for tag in tags:
+            self._tag_generations[tag] = self._generation
+        self.invalidations += 1
+        await self.backend.invalidate_tags(tags)
+
+    async def clear(self) -> None:
+        self._generation = next(self._clock)
+        self._tag_generations.clear()
+        await self.backend.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / lookups) if lookups else None,
+            "invalidations": self.invalidations,
+            "skipped_stores": self.skipped_stores,
+            **self.backend.stats(),
+        }
+
+
+def _create_backend() -> CacheBackend:
+    settings = get_settings()
+    if settings.response_cache_backend == "redis":
+        return RedisCacheBackend(url=settings.response_cache_redis_url)
+    if settings.response_cache_backend == "none":
+        return NullCacheBackend()
+    return LRUCacheBackend(max_entries=settings.response_cache_max_entries)
+
+
+response_cache = ResponseCache(_create_backend(), ttl=get_settings().response_cache_ttl_seconds)
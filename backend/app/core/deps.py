@@ -3,13 +3,13 @@ from __future__ import annotations
 from collections.abc import AsyncGenerator
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_token
+from app.core.security import STREAM_TOKEN_SCOPE, decode_token
 from app.db.session import get_db
 from app.models.user import User, UserRole
 
@@ -33,12 +33,17 @@ async def get_current_user(
     try:
         payload = decode_token(token)
         subject = payload.get("sub")
-        if not subject or not isinstance(subject, str):
+        # Scoped tokens (event streams) are not access tokens.
+        if not subject or not isinstance(subject, str) or "scope" in payload:
             raise credentials_exception
         user_id = UUID(subject)
     except (JWTError, ValueError):
         raise credentials_exception
 
+    return await _load_user(db, user_id, credentials_exception)
+
+
+async def _load_user(db: AsyncSession, user_id: UUID, credentials_exception: HTTPException) -> User:
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if user is None:
@@ -52,6 +57,25 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     return current_user
 
 
+async def get_current_stream_user(
+    schedule_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+    token: str = Query(description="From POST /schedules/{schedule_id}/events/token"),
+) -> User:
+    # EventSource cannot set headers, so the stream takes a short-lived token scoped to this schedule.
+    credentials_exception = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+    try:
+        payload = decode_token(token)
+        if payload.get("scope") != STREAM_TOKEN_SCOPE or payload.get("schedule_id") != str(schedule_id):
+            raise credentials_exception
+        user_id = UUID(payload.get("sub"))
+    except (JWTError, TypeError, ValueError):
+        raise credentials_exception
+
+    user = await _load_user(db, user_id, credentials_exception)
+    return await get_current_active_user(user)
+
+
 async def get_current_admin(current_user: User = Depends(get_current_active_user)) -> User:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
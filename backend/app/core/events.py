@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.serialization import get_adapter
+
+_payload_adapter = get_adapter(dict[str, Any])
+
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+def encode_event_data(data: dict[str, Any]) -> bytes:
+    return _payload_adapter.dump_json(data)
+
+
+class ScheduleEventHub:
+    """Per-process fan-out of schedule deltas to Server-Sent Events subscribers.
+
+    Each event is encoded once and the same frame is queued for every subscriber. Queues are
+    bounded: a subscriber that falls behind is sent ``resync`` and disconnected, so one slow
+    client can never grow memory or stall publishers. Deltas written through other workers
+    arrive through ``app.core.invalidation``.
+    """
+
+    def __init__(self, *, queue_size: int, heartbeat_seconds: float) -> None:
+        self.queue_size = max(queue_size, 2)
+        self.heartbeat_seconds = heartbeat_seconds
+        self._subscribers: dict[UUID, set[asyncio.Queue[bytes | None]]] = {}
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    def publish(self, schedule_id: UUID, event: str, data: dict[str, Any]) -> None:
+        if schedule_id in self._subscribers:
+            self.publish_encoded(schedule_id, event, encode_event_data(data))
+
+    def publish_encoded(self, schedule_id: UUID, event: str, data: bytes) -> None:
+        subscribers = self._subscribers.get(schedule_id)
+        if not subscribers:
+            return
+        frame = b"id: %d\nevent: %b\ndata: %b\n\n" % (next(self._ids), event.encode(), data)
+        self.published += 1
+        for queue in list(subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._evict(schedule_id, queue)
+
+    async def subscribe(self, schedule_id: UUID) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(schedule_id, set()).add(queue)
+        try:
+            yield b"retry: 3000\nevent: ready\ndata: {}\n\n"
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout=self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_FRAME
+                    continue
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self._unsubscribe(schedule_id, queue)
+
+    def subscriber_count(self, schedule_id: UUID | None = None) -> int:
+        if schedule_id is not None:
+            return len(self._subscribers.get(schedule_id, ()))
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def resync(self) -> None:
+        """Disconnects every subscriber with ``resync``, for when deltas may have been missed."""
+        for schedule_id, queues in list(self._subscribers.items()):
+            for queue in list(queues):
+                self._terminate(queue, frame=RESYNC_FRAME)
+            self._subscribers.pop(schedule_id, None)
+
+    def close(self) -> None:
+        for schedule_id, queues in list(self._subscribers.items()):
+            for queue in list(queues):
+                self._terminate(queue, frame=None)
+            self._subscribers.pop(schedule_id, None)
+
+    def _evict(self, schedule_id: UUID, queue: asyncio.Queue[bytes | None]) -> None:
+        self.dropped += 1
+        self._terminate(queue, frame=RESYNC_FRAME)
+        self._unsubscribe(schedule_id, queue)
+
+    @staticmethod
+    def _terminate(queue: asyncio.Queue[bytes | None], *, frame: bytes | None) -> None:
+        # Discard the backlog so the final frames always fit.
+        while not queue.empty():
+            queue.get_nowait()
+        if frame is not None:
+            queue.put_nowait(frame)
+        queue.put_nowait(None)
+
+    def _unsubscribe(self, schedule_id: UUID, queue: asyncio.Queue[bytes | None]) -> None:
+        queues = self._subscribers.get(schedule_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[schedule_id]
+
+
+schedule_events = ScheduleEventHub(
+    queue_size=get_settings().schedule_events_queue_size,
+    heartbeat_seconds=get_settings().schedule_events_heartbeat_seconds,
+)
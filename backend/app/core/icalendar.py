@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+# RFC 5545 content lines: at most 75 octets before a CRLF, continued on lines starting with a space.
+_MAX_LINE_OCTETS = 75
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def format_utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def fold(line: str) -> str:
+    """Fold a content line at 75 octets without splitting a UTF-8 sequence."""
+    encoded = line.encode()
+    if len(encoded) <= _MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts: list[str] = []
+    start, limit = 0, _MAX_LINE_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Continuation bytes look like 0b10xxxxxx; back up to the start of the character.
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, _MAX_LINE_OCTETS - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def content_line(name: str, value: str, /, **params: str) -> str:
+    """One folded property line; ``value`` must already be escaped or formatted."""
+    head = name + "".join(f";{key.upper().replace('_', '-')}={param}" for key, param in params.items())
+    return fold(f"{head}:{value}")
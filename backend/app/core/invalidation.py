@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import secrets
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache
+from app.core.config import get_settings
+from app.core.events import encode_event_data, schedule_events
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "degururu_invalidate"
+EVENTS_CHANNEL = "degururu_events"
+
+# Each payload is "<origin> <tag>", so a worker can skip its own notifications: it has already
+# invalidated locally before they come back.
+_notify_stmt = text(f"SELECT pg_notify('{CHANNEL}', :origin || ' ' || tag) FROM unnest(CAST(:tags AS text[])) AS tag")
+# Schedule events go out as "<origin> <schedule_id> <event> <json>"; the data is a few ids, far below
+# the 8000-byte payload limit.
+_event_stmt = text(f"SELECT pg_notify('{EVENTS_CHANNEL}', :payload)")
+_origin: tuple[int, str] | None = None
+
+
+def worker_id() -> str:
+    """Random per-process id; regenerated after a fork so preloaded workers do not share it."""
+    global _origin
+    if _origin is None or _origin[0] != os.getpid():
+        _origin = (os.getpid(), secrets.token_hex(8))
+    return _origin[1]
+
+
+async def publish_invalidation(db: AsyncSession, *tags: str) -> None:
+    # Nobody listens when LISTEN is off, so the write skips the extra statement.
+    if not get_settings().invalidation_listen:
+        return
+    # Runs inside the caller's transaction: Postgres delivers the notification on COMMIT and drops it on ROLLBACK.
+    await db.execute(_notify_stmt, {"origin": worker_id(), "tags": list(tags)})
+
+
+async def publish_event(db: AsyncSession, schedule_id: UUID, event: str, data: dict[str, Any]) -> None:
+    if not get_settings().invalidation_listen:
+        return
+    # Reaches the other workers' streams on COMMIT; the caller publishes to its own after the commit.
+    payload = f"{worker_id()} {schedule_id} {event} {encode_event_data(data).decode()}"
+    await db.execute(_event_stmt, {"payload": payload})
+
+
+TagHandler = Callable[[tuple[str, ...]], Awaitable[None]]
+ResetHandler = Callable[[], Awaitable[None]]
+EventHandler = Callable[[UUID, str, bytes], None]
+
+
+class InvalidationListener:
+    """Keeps one dedicated LISTEN connection per worker and fans notifications out to local caches and streams."""
+
+    def __init__(self, *, dsn: str, health_check_seconds: float = 30.0, max_backoff_seconds: float = 30.0) -> None:
+        self.dsn = dsn
+        self.health_check_seconds = health_check_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.tag_handlers: list[TagHandler] = []
+        self.reset_handlers: list[ResetHandler] = []
+        self.event_handlers: list[EventHandler] = []
+        self.received = 0
+        self.own = 0
+        self.reconnects = 0
+        self.connected = False
+        self._task: asyncio.Task[None] | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="invalidation-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {"connected": self.connected, "received": self.received, "own": self.own, "reconnects": self.reconnects}
+
+    async def _run(self) -> None:
+        backoff = 0.5
+        while True:
+            conn: asyncpg.Connection | None = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(CHANNEL, self._on_notify)
+                await conn.add_listener(EVENTS_CHANNEL, self._on_event)
+                self.connected = True
+                # Anything published while we were not listening is lost, so drop all local state.
+                await self._reset()
+                backoff = 0.5
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=self.health_check_seconds)
+                    except asyncio.TimeoutError:
+                        await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Invalidation listener disconnected; retrying in %.1fs", backoff, exc_info=True)
+            finally:
+                self.connected = False
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            self.reconnects += 1
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+    def _on_notify(self, _conn: asyncpg.Connection, _pid: int, _channel: str, payload: str) -> None:
+        origin, _, tag = payload.partition(" ")
+        if origin == worker_id():
+            self.own += 1
+            return
+        self.received += 1
+        task = asyncio.create_task(self._dispatch((tag or origin,)))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _on_event(self, _conn: asyncpg.Connection, _pid: int, _channel: str, payload: str) -> None:
+        origin, schedule_id, event, data = payload.split(" ", 3)
+        if origin == worker_id():
+            self.own += 1
+            return
+        self.received += 1
+        for handler in self.event_handlers:
+            try:
+                handler(UUID(schedule_id), event, data.encode())
+            except Exception:
+                logger.exception("Event handler failed for %s %s", schedule_id, event)
+
+    async def _dispatch(self, tags: tuple[str, ...]) -> None:
+        for handler in self.tag_handlers:
+            try:
+                await handler(tags)
+            except Exception:
+                logger.exception("Invalidation handler failed for %s", tags)
+
+    async def _reset(self) -> None:
+        for handler in self.reset_handlers:
+            await handler()
+
+
+async def _invalidate_response_cache(tags: tuple[str, ...]) -> None:
+    await response_cache.invalidate(*tags)
+
+
+async def _resync_event_streams() -> None:
+    schedule_events.resync()
+
+
+def _listener_dsn() -> str:
+    return make_url(get_settings().database_dsn).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+invalidation_listener = InvalidationListener(
+    dsn=_listener_dsn(),
+    health_check_seconds=get_settings().invalidation_health_check_seconds,
+)
+invalidation_listener.tag_handlers.append(_invalidate_response_cache)
+invalidation_listener.reset_handlers.append(response_cache.clear)
+invalidation_listener.event_handlers.append(schedule_events.publish_encoded)
+invalidation_listener.reset_handlers.append(_resync_event_streams)
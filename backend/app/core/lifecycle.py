@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+import time
+from collections.abc import Callable
+from contextlib import AsyncExitStack
+from types import FrameType
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.db.session import get_engine
+from app.services.announcement_service import announcement_service
+from app.services.schedule_service import schedule_service
+
+logger = logging.getLogger(__name__)
+
+
+class ShutdownSignal:
+    """Runs callbacks on the event loop as soon as SIGTERM or SIGINT arrives.
+
+    uvicorn only runs the lifespan shutdown after it has waited for open connections, so anything that
+    keeps a connection open indefinitely (the SSE streams) has to be ended from here instead.
+    """
+
+    signals = (signal.SIGINT, signal.SIGTERM)
+
+    def __init__(self) -> None:
+        self._callbacks: list[Callable[[], None]] = []
+        self._previous: dict[int, Any] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.fired = False
+
+    def install(self, *callbacks: Callable[[], None]) -> None:
+        self._callbacks = list(callbacks)
+        self._loop = asyncio.get_running_loop()
+        self.fired = False
+        for sig in self.signals:
+            try:
+                # Chains onto the server's own handler, which is still called so it begins its shutdown.
+                self._previous[sig] = signal.signal(sig, self._handle)
+            except ValueError:
+                # Not the main thread (e.g. TestClient); there is no signal to react to.
+                logger.debug("Cannot install a %s handler outside the main thread", signal.Signals(sig).name)
+                return
+
+    def uninstall(self) -> None:
+        for sig, previous in self._previous.items():
+            if signal.getsignal(sig) == self._handle:
+                signal.signal(sig, previous)
+        self._previous.clear()
+
+    def _handle(self, signum: int, frame: FrameType | None) -> None:
+        if not self.fired and self._loop is not None:
+            self.fired = True
+            # Signal handlers interrupt arbitrary loop code, so the callbacks run on the loop's next turn.
+            for callback in self._callbacks:
+                self._loop.call_soon_threadsafe(callback)
+        previous = self._previous.get(signum)
+        if callable(previous):
+            previous(signum, frame)
+        elif previous == signal.SIG_DFL:
+            signal.signal(signum, previous)
+            signal.raise_signal(signum)
+
+
+shutdown_signal = ShutdownSignal()
+
+
+async def _prime(conn: AsyncConnection) -> None:
+    async with AsyncSession(bind=conn) as db:
+        await db.execute(select(1))
+        await schedule_service.list_schedule_rows(db)
+        await schedule_service.get_list_version(db)
+        await announcement_service.list_announcement_rows(db)
+        await announcement_service.get_list_version(db)
+
+
+async def warm_up_pool(connections: int) -> None:
+    # Holds every connection until all are open so the pool creates ``count`` distinct ones, then runs
+    # the hot list queries on each so asyncpg's per-connection prepared statement cache is filled.
+    engine = get_engine()
+    count = min(connections, engine.pool.size())
+    if count <= 0:
+        return
+    started = time.perf_counter()
+    async with AsyncExitStack() as stack:
+        conns = [await stack.enter_async_context(engine.connect()) for _ in range(count)]
+        await asyncio.gather(*(_prime(conn) for conn in conns))
+    logger.info("Warmed up %d database connection(s) in %.0f ms", count, (time.perf_counter() - started) * 1000)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, *, buckets: Sequence[float]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # Per label set: non-cumulative bucket counts (last slot is +Inf), sum, count.
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+        counts, totals = series
+        counts[bisect_left(self.buckets, value)] += 1
+        totals[0] += value
+        totals[1] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        bounds = (*self.buckets, float("inf"))
+        for labels, (counts, (total, count)) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket{_format_labels(labels, (('le', _format_value(bound)),))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(labels)} {_format_value(count)}"
+
+
+@dataclass
+class Gauge:
+    name: str
+    help_text: str
+    value: float
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {_format_value(self.value)}"
+
+
+@dataclass
+class RequestDbStats:
+    scope: Scope | None = None
+    statements: int = 0
+    seconds: float = 0.0
+    statement_hook: Callable[[float], None] | None = None  # set while a request is being profiled
+
+
+_request_db: ContextVar[RequestDbStats | None] = ContextVar("request_db", default=None)
+
+http_requests_total = Counter("http_requests_total", "HTTP requests by route template, method and status.")
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", buckets=LATENCY_BUCKETS
+)
+db_statements_per_request = Histogram(
+    "db_statements_per_request", "SQL statements executed while serving one request.", buckets=STATEMENT_BUCKETS
+)
+db_time_per_request = Histogram(
+    "db_time_per_request_seconds", "Time spent in SQL statements while serving one request.", buckets=LATENCY_BUCKETS
+)
+db_statements_total = Counter("db_statements_total", "SQL statements executed, inside or outside requests.")
+db_statement_seconds_total = Counter("db_statement_seconds_total", "Time spent executing SQL statements.")
+
+_metrics: list[Counter | Histogram] = [
+    http_requests_total,
+    http_request_duration,
+    db_statements_per_request,
+    db_time_per_request,
+    db_statements_total,
+    db_statement_seconds_total,
+]
+
+# Called at scrape time for values that are read rather than accumulated (pool state, queue depths).
+collectors: list[Callable[[], Iterable[Gauge]]] = []
+
+
+def record_statement(seconds: float) -> None:
+    db_statements_total.inc()
+    db_statement_seconds_total.inc(seconds)
+    stats = _request_db.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += seconds
+        if stats.statement_hook is not None:
+            stats.statement_hook(seconds)
+
+
+def current_request_db() -> RequestDbStats | None:
+    return _request_db.get()
+
+
+@contextmanager
+def track_db(scope: Scope | None = None) -> Iterator[RequestDbStats]:
+    stats = RequestDbStats(scope)
+    token = _request_db.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_db.reset(token)
+
+
+def current_route() -> str | None:
+    stats = _request_db.get()
+    if stats is None or stats.scope is None:
+        return None
+    return f"{stats.scope['method']} {route_template(stats.scope)}"
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    for collect in collectors:
+        for gauge in collect():
+            lines.extend(gauge.render())
+    return "\n".join(lines) + "\n"
+
+
+def route_template(scope: Scope) -> str:
+    # Label by the matched route's template, never the raw path, so ids do not explode cardinality.
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if not path:
+        return "unmatched"
+    # Depending on the FastAPI version an included route carries the full path or only the router's own,
+    # so the API prefix is dropped to give the same label either way.
+    prefix = get_settings().api_prefix
+    return path[len(prefix) :] if path.startswith(prefix + "/") else path
+
+
+def metrics_middleware(app: ASGIApp) -> ASGIApp:
+    async def measured(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_db(scope) as stats:
+            try:
+                await app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - started
+                route = route_template(scope)
+                method = scope["method"]
+                http_requests_total.inc(method=method, route=route, status=str(status_code))
+                http_request_duration.observe(elapsed, method=method, route=route)
+                db_statements_per_request.observe(stats.statements, route=route)
+                db_time_per_request.observe(stats.seconds, route=route)
+
+    return measured
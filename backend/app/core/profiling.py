@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import greenlet
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.metrics import current_request_db, route_template
+
+PROFILE_HEADER = "x-profile"
+PROFILE_PARAM = "profile"
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SKIP_DIRS = tuple(os.path.join(_APP_ROOT, name) + os.sep for name in ("core", "db"))
+
+
+def sql_call_site() -> str:
+    """Innermost application frame (outside app.core/app.db) that led to the current statement."""
+    # Cursor events run in SQLAlchemy's worker greenlet; the awaiting code is parked in its parent.
+    current = greenlet.getcurrent()
+    frame = current.parent.gr_frame if current.parent is not None else sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_ROOT) and not filename.startswith(_SKIP_DIRS):
+            return f"{os.path.relpath(filename, os.path.dirname(_APP_ROOT))}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<outside app>"
+
+
+@dataclass
+class StoredProfile:
+    id: int
+    route: str
+    created_at: datetime
+    duration_ms: float
+    engine: str
+    text: str
+    html: str | None
+    sql_sites: list[dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "route": self.route,
+            "created_at": self.created_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 2),
+            "engine": self.engine,
+            "sql_statements": sum(site["statements"] for site in self.sql_sites),
+            "sql_ms": round(sum(site["ms"] for site in self.sql_sites), 2),
+        }
+
+
+class _Session:
+    """One profiled request.
+
+    pyinstrument (the ``profiling`` extra) samples the stack and follows the request across awaits.
+    Without it cProfile is used instead: a deterministic tracer that hooks every call on the event loop
+    thread, so it slows the request noticeably and its report also contains whatever other requests ran
+    on the loop meanwhile.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.sql_sites: dict[str, list[float]] = {}
+        try:
+            from pyinstrument import Profiler
+        except ImportError:  # pragma: no cover - optional dependency
+            self._sampler: Any = None
+            self._cprofile: cProfile.Profile | None = cProfile.Profile()
+            self.engine = "cProfile"
+        else:
+            self._sampler = Profiler(interval=interval, async_mode="enabled")
+            self._cprofile = None
+            self.engine = "pyinstrument"
+
+    def start(self) -> None:
+        if self._sampler is not None:
+            self._sampler.start()
+        else:
+            assert self._cprofile is not None
+            self._cprofile.enable()
+
+    def stop(self) -> tuple[str, str | None]:
+        if self._sampler is not None:
+            self._sampler.stop()
+            return self._sampler.output_text(unicode=True, color=False), self._sampler.output_html()
+        assert self._cprofile is not None
+        self._cprofile.disable()
+        out = io.StringIO()
+        pstats.Stats(self._cprofile, stream=out).sort_stats("cumulative").print_stats(60)
+        return out.getvalue(), None
+
+    def on_statement(self, seconds: float) -> None:
+        site = self.sql_sites.setdefault(sql_call_site(), [0, 0.0])
+        site[0] += 1
+        site[1] += seconds
+
+    def sql_report(self) -> list[dict[str, Any]]:
+        return [
+            {"site": site, "statements": int(count), "ms": round(seconds * 1000, 3)}
+            for site, (count, seconds) in sorted(self.sql_sites.items(), key=lambda item: -item[1][1])
+        ]
+
+
+class RequestProfiler:
+    """Profiles single requests on demand for admins; other requests only pay a header/query lookup."""
+
+    def __init__(self, *, max_profiles: int, interval: float) -> None:
+        self.interval = interval
+        self.profiles: deque[StoredProfile] = deque(maxlen=max_profiles)
+        self._ids = itertools.count(1)
+        # Both engines profile the whole event loop thread, so overlapping sessions would mix requests.
+        self._active = False
+
+    def get(self, profile_id: int) -> StoredProfile | None:
+        return next((profile for profile in self.profiles if profile.id == profile_id), None)
+
+    def middleware(self, app: ASGIApp) -> ASGIApp:
+        async def profiled(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] != "http":
+                await app(scope, receive, send)
+                return
+            mode = self._requested_mode(scope)
+            if mode is None or not await self._is_admin(scope):
+                await app(scope, receive, send)
+                return
+            if self._active:
+                response = JSONResponse(
+                    {"detail": "Another request is being profiled"}, status_code=status.HTTP_409_CONFLICT
+                )
+                await response(scope, receive, send)
+                return
+            self._active = True
+            try:
+                await self._run(app, scope, receive, send, inline=mode == "inline")
+            finally:
+                self._active = False
+
+        return profiled
+
+    @staticmethod
+    def _requested_mode(scope: Scope) -> str | None:
+        query = scope.get("query_string", b"")
+        if f"{PROFILE_PARAM}=".encode() in query:
+            value = QueryParams(query).get(PROFILE_PARAM)
+        else:
+            value = Headers(scope=scope).get(PROFILE_HEADER)
+        if not value or value.lower() in ("0", "false", "no"):
+            return None
+        return "inline" if value.lower() == "inline" else "store"
+
+    @staticmethod
+    async def _is_admin(scope: Scope) -> bool:
+        # The same dependency chain as routes guarded by get_current_admin, resolved by hand.
+        from app.core.deps import get_current_active_user, get_current_admin, get_current_user
+        from app.db.session import async_session_factory
+
+        scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            async with async_session_factory() as db:
+                user = await get_current_user(db=db, token=token)
+            await get_current_admin(await get_current_active_user(user))
+        except HTTPException:
+            return False
+        return True
+
+    async def _run(self, app: ASGIApp, scope: Scope, receive: Receive, send: Send, *, inline: bool) -> None:
+        session = _Session(self.interval)
+        stats = current_request_db()
+        if stats is not None:
+            stats.statement_hook = session.on_statement
+        profile_id = next(self._ids)
+
+        async def send_wrapper(message: Message) -> None:
+            if inline:  # the report replaces the route's own response
+                return
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", str(profile_id).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        started = time.perf_counter()
+        session.start()
+        try:
+            await app(scope, receive, send_wrapper)
+        finally:
+            text, html = session.stop()
+            if stats is not None:
+                stats.statement_hook = None
+            profile = StoredProfile(
+                id=profile_id,
+                route=f"{scope['method']} {route_template(scope)}",
+                created_at=datetime.now(timezone.utc),
+                duration_ms=(time.perf_counter() - started) * 1000,
+                engine=session.engine,
+                text=text,
+                html=html,
+                sql_sites=session.sql_report(),
+            )
+            self.profiles.append(profile)
+
+        if inline:
+            body = (profile.html or render_text(profile)).encode()
+            content_type = b"text/html; charset=utf-8" if profile.html else b"text/plain; charset=utf-8"
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", content_type),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"x-profile-id", str(profile_id).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+
+def render_text(profile: StoredProfile) -> str:
+    lines = [f"{profile.route}  {profile.duration_ms:.1f} ms  ({profile.engine})", "", "SQL by call site:"]
+    for site in profile.sql_sites or [{"site": "-", "statements": 0, "ms": 0.0}]:
+        lines.append(f"  {site['ms']:9.2f} ms  {site['statements']:4d}x  {site['site']}")
+    lines += ["", profile.text]
+    return "\n".join(lines)
+
+
+request_profiler = RequestProfiler(
+    max_profiles=get_settings().profiling_max_profiles,
+    interval=get_settings().profiling_interval_seconds,
+)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+# Worst-case statements per request, including the current-user lookup done by the auth dependency.
+# Every GET route under the API prefix needs an entry; requests to one without are reported.
+# Routes that read a schedule's children also count the existence check issued when the list is empty,
+# and schedule lookups count the recurring-rule fallback (rules, plus materialized occurrences for lists).
+QUERY_BUDGETS: dict[str, int] = {
+    "GET /auth/me": 1,
+    "GET /profile": 1,
+    "GET /users": 2,
+    "GET /users/search": 2,
+    "GET /users/{user_id}": 2,
+    "GET /schedules": 5,
+    "GET /schedules/calendar": 4,
+    "GET /schedules/{schedule_id}": 3,
+    "GET /schedules/{schedule_id}/full": 4,
+    "GET /schedules/{schedule_id}/attendance": 5,
+    "GET /schedules/{schedule_id}/scores": 5,
+    "GET /schedules/{schedule_id}/stats": 4,
+    "GET /schedules/{schedule_id}/events": 3,
+    "GET /schedule-rules": 2,
+    "GET /schedule-rules/{rule_id}": 2,
+    "GET /attendance/me": 2,
+    "GET /announcements": 3,
+    "GET /announcements/search": 2,
+    "GET /announcements/unread-count": 2,
+    "GET /announcements/{announcement_id}": 2,
+    "GET /scores/me/trend": 2,
+    "GET /scores/me/high": 2,
+    "GET /dashboard": 6,
+    "GET /calendar.ics": 5,
+    "GET /calendar/token": 1,
+    "GET /admin/cache": 1,
+    "GET /admin/partitions": 1,
+    "GET /admin/slow-queries": 1,
+    "GET /admin/traces": 1,
+    "GET /admin/profiles": 1,
+    "GET /admin/profiles/{profile_id}": 1,
+}
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class RecordedRequest:
+    route: str
+    statements: list[str] = field(default_factory=list)
+    # API reads must have a budget, so a key that no longer matches its route is reported, not skipped.
+    requires_budget: bool = False
+
+    def repeated(self, threshold: int = 2) -> dict[str, int]:
+        # The same SQL text issued several times in one request is the usual shape of an N+1.
+        return {sql: n for sql, n in Counter(self.statements).items() if n >= threshold}
+
+
+_statements: ContextVar[list[str] | None] = ContextVar("query_budget_statements", default=None)
+
+
+def record_query(statement: str) -> None:
+    statements = _statements.get()
+    if statements is not None:
+        statements.append(statement)
+
+
+class QueryBudgetMonitor:
+    """Records the statements each request issues and checks them against ``QUERY_BUDGETS``.
+
+    Tests wrap requests in ``recording()`` and call ``assert_within_budget``; with ``log_violations``
+    set, every request is checked and over-budget or repeated statements are logged.
+    """
+
+    def __init__(self, budgets: Mapping[str, int], *, log_violations: bool = False, repeat_threshold: int = 2) -> None:
+        self.budgets = budgets
+        self.log_violations = log_violations
+        self.repeat_threshold = repeat_threshold
+        self._recordings: list[list[RecordedRequest]] = []
+
+    @contextmanager
+    def recording(self) -> Iterator[list[RecordedRequest]]:
+        requests: list[RecordedRequest] = []
+        self._recordings.append(requests)
+        try:
+            yield requests
+        finally:
+            self._recordings.remove(requests)
+
+    def problems(self, request: RecordedRequest) -> list[str]:
+        found: list[str] = []
+        budget = self.budgets.get(request.route)
+        if budget is None and request.requires_budget:
+            found.append(f"{request.route} has no query budget")
+        elif budget is not None and len(request.statements) > budget:
+            found.append(f"{request.route} issued {len(request.statements)} statements (budget {budget})")
+        for sql, count in request.repeated(self.repeat_threshold).items():
+            found.append(f"{request.route} repeated {count}x: {' '.join(sql.split())[:200]}")
+        return found
+
+    def assert_within_budget(self, requests: list[RecordedRequest]) -> None:
+        found = [problem for request in requests for problem in self.problems(request)]
+        if found:
+            raise QueryBudgetExceeded("\n".join(found))
+
+    def middleware(self, app: ASGIApp) -> ASGIApp:
+        async def recorded(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] != "http" or not (self.log_violations or self._recordings):
+                await app(scope, receive, send)
+                return
+            statements: list[str] = []
+            token = _statements.set(statements)
+            try:
+                await app(scope, receive, send)
+            finally:
+                _statements.reset(token)
+                request = RecordedRequest(
+                    f"{scope['method']} {route_template(scope)}",
+                    statements,
+                    requires_budget=scope["method"] == "GET"
+                    and "route" in scope
+                    and scope["path"].startswith(get_settings().api_prefix + "/"),
+                )
+                for requests in self._recordings:
+                    requests.append(request)
+                if self.log_violations:
+                    for problem in self.problems(request):
+                        logger.warning("Query budget: %s", problem)
+
+        return recorded
+
+
+query_budget = QueryBudgetMonitor(QUERY_BUDGETS, log_violations=get_settings().query_budget_log)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.session import get_engine
+
+
+class ReadinessProbe:
+    """Bounded ``SELECT 1`` through the pool plus pool saturation, cached briefly so probes add no load."""
+
+    def __init__(self, *, timeout: float, cache_seconds: float, max_latency_ms: float, max_saturation: float) -> None:
+        self.timeout = timeout
+        self.cache_seconds = cache_seconds
+        self.max_latency_ms = max_latency_ms
+        self.max_saturation = max_saturation
+        self.last_latency_ms: float | None = None
+        self._result: tuple[bool, dict[str, Any]] | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def check(self) -> tuple[bool, dict[str, Any]]:
+        async with self._lock:
+            # Concurrent probes wait here and share the one result.
+            if self._result is None or time.monotonic() - self._checked_at >= self.cache_seconds:
+                self._result = await self._run()
+                self._checked_at = time.monotonic()
+            return self._result
+
+    async def _run(self) -> tuple[bool, dict[str, Any]]:
+        engine = get_engine()
+        pool = engine.pool
+        capacity = pool.size() + max(get_settings().db_max_overflow, 0)
+        saturation = pool.checkedout() / capacity if capacity else 0.0
+        problems: list[str] = []
+
+        started = time.perf_counter()
+        try:
+            # The timeout covers the pool checkout too, so an exhausted pool fails here instead of hanging.
+            async with asyncio.timeout(self.timeout):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except TimeoutError:
+            problems.append(f"database did not answer within {self.timeout:g}s")
+        except Exception as exc:
+            problems.append(f"database unavailable: {type(exc).__name__}")
+        else:
+            self.last_latency_ms = (time.perf_counter() - started) * 1000
+            if self.last_latency_ms > self.max_latency_ms:
+                problems.append(f"database latency {self.last_latency_ms:.0f}ms over {self.max_latency_ms:g}ms")
+        if saturation >= self.max_saturation:
+            problems.append(f"connection pool {saturation:.0%} checked out")
+
+        return not problems, {
+            "status": "ok" if not problems else "unavailable",
+            "problems": problems,
+            "database": {
+                "latency_ms": None if self.last_latency_ms is None else round(self.last_latency_ms, 2),
+            },
+            "pool": {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "capacity": capacity,
+                "saturation": round(saturation, 3),
+            },
+        }
+
+
+readiness_probe = ReadinessProbe(
+    timeout=get_settings().ready_timeout_seconds,
+    cache_seconds=get_settings().ready_cache_seconds,
+    max_latency_ms=get_settings().ready_max_latency_ms,
+    max_saturation=get_settings().ready_max_pool_saturation,
+)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
+from uuid import UUID
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.core.metrics import Gauge, collectors
+
+T = TypeVar("T")
+
+STREAM_TOKEN_SCOPE = "schedule-events"
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -19,6 +30,82 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHasher:
+    """Runs bcrypt on a small thread pool so hashing never blocks the event loop."""
+
+    def __init__(self, *, workers: int, bulk_workers: int) -> None:
+        self.workers = workers
+        self.bulk_workers = bulk_workers or os.cpu_count() or 1
+        self.queued = 0
+        self.running = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._bulk_executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """Hash a batch on its own pool so logins are not queued behind it.
+
+        bcrypt releases the GIL while it works, so the threads hash on every core at once.
+        """
+        if self._bulk_executor is None:
+            self._bulk_executor = ThreadPoolExecutor(max_workers=self.bulk_workers, thread_name_prefix="bcrypt-bulk")
+        executor = self._bulk_executor
+        jobs = [self._submit(get_password_hash, password, executor=executor) for password in passwords]
+        return list(await asyncio.gather(*jobs))
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        for executor in (self._executor, self._bulk_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._bulk_executor = None
+
+    def gauges(self) -> Iterable[Gauge]:
+        return [
+            Gauge("password_hash_queue_depth", "bcrypt jobs waiting for a hashing thread.", self.queued),
+            Gauge("password_hash_running", "bcrypt jobs currently running.", self.running),
+        ]
+
+    async def _submit(self, fn: Callable[..., T], *args: Any, executor: ThreadPoolExecutor | None = None) -> T:
+        if executor is None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            executor = self._executor
+        with self._lock:
+            self.queued += 1
+        future = executor.submit(self._call, fn, *args)
+        future.add_done_callback(self._discard_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def _discard_cancelled(self, future: Future[Any]) -> None:
+        # A job cancelled before it started never reaches _call.
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+
+password_hasher = PasswordHasher(
+    workers=get_settings().password_hash_workers,
+    bulk_workers=get_settings().password_import_workers,
+)
+collectors.append(password_hasher.gauges)
+
+
 def create_access_token(subject: str, expires_delta: timedelta | None = None, extra_claims: dict[str, Any] | None = None) -> str:
     settings = get_settings()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
@@ -30,6 +117,19 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None, ex
     return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
+def create_stream_token(user_id: UUID, schedule_id: UUID) -> str:
+    """A short-lived token that can only open the event stream of one schedule.
+
+    EventSource cannot send headers, so this goes in the URL instead of the access token and
+    whatever logs the URL records something that expires within a minute and grants nothing else.
+    """
+    return create_access_token(
+        str(user_id),
+        expires_delta=timedelta(seconds=get_settings().stream_token_expire_seconds),
+        extra_claims={"scope": STREAM_TOKEN_SCOPE, "schedule_id": str(schedule_id)},
+    )
+
+
 def decode_token(token: str) -> dict[str, Any]:
     settings = get_settings()
     payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import enum
+import types
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column
+from sqlalchemy.engine import Result
+from typing_extensions import TypedDict
+
+
+@lru_cache(maxsize=None)
+def get_adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
+def to_json(tp: Any, data: Any) -> bytes:
+    adapter = get_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def _plain_annotation(annotation: Any) -> Any:
+    # Rows carry the ORM enum classes, which are distinct from the schema enums; both are str-based.
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return str
+    if get_origin(annotation) in (Union, types.UnionType):
+        return Union[tuple(_plain_annotation(arg) for arg in get_args(annotation))]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def row_adapter(schema: type[BaseModel]) -> TypeAdapter[Any]:
+    fields = {name: _plain_annotation(field.annotation) for name, field in schema.model_fields.items()}
+    return TypeAdapter(list[TypedDict(f"{schema.__name__}Row", fields)])  # type: ignore[misc]
+
+
+def schema_columns(model: type[Any], schema: type[BaseModel]) -> list[Column[Any]]:
+    return [model.__table__.c[name] for name in schema.model_fields]
+
+
+def rows_as_dicts(result: Result[Any]) -> list[dict[str, Any]]:
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def dump_rows(schema: type[BaseModel], rows: Sequence[dict[str, Any]]) -> bytes:
+    # Rows come straight from the database, so they are serialized without a validation pass.
+    return row_adapter(schema).dump_json(rows)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import date, datetime, timezone
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.metrics import current_route
+
+logger = logging.getLogger(__name__)
+
+Explain = Callable[[str, Sequence[Any]], Awaitable[str]]
+
+# Only plain reads are explained: EXPLAIN ANALYZE executes the statement.
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_WRITES = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b|\bFOR\s+(UPDATE|SHARE)\b|\bpg_notify\b", re.IGNORECASE)
+
+# Statements with inlined literals are all distinct, so the cooldown map is capped as well as pruned.
+_MAX_EXPLAINED = 1024
+
+
+def redact_parameters(parameters: Any) -> list[Any]:
+    # Keep values that explain a plan (numbers, dates, flags); hide anything that may identify a person.
+    if isinstance(parameters, dict):
+        parameters = list(parameters.values())
+    redacted: list[Any] = []
+    for value in parameters or ():
+        if value is None or isinstance(value, (bool, int, float)):
+            redacted.append(value)
+        elif isinstance(value, (datetime, date)):
+            redacted.append(value.isoformat())
+        else:
+            redacted.append(f"<{type(value).__name__}>")
+    return redacted
+
+
+class SlowQueryLog:
+    """Logs statements slower than the threshold and keeps the most recent ones, optionally with plans."""
+
+    def __init__(self, *, threshold_ms: float, max_entries: int, explain: bool, explain_cooldown_seconds: float) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.explain_cooldown_seconds = explain_cooldown_seconds
+        self.entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
+        self.total = 0
+        self._explained_at: OrderedDict[str, float] = OrderedDict()
+        self._explaining = False
+        self._pending: set[asyncio.Task[None]] = set()
+
+    def observe(self, statement: str, parameters: Any, seconds: float, *, executemany: bool, explain: Explain) -> None:
+        duration_ms = seconds * 1000
+        if self.threshold_ms <= 0 or duration_ms < self.threshold_ms or statement.lstrip().upper().startswith("EXPLAIN"):
+            return
+        self.total += 1
+        route = current_route()
+        entry: dict[str, Any] = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "route": route,
+            "duration_ms": round(duration_ms, 2),
+            "statement": statement,
+            "parameters": redact_parameters(parameters) if not executemany else "<executemany>",
+            "plan": None,
+        }
+        self.entries.append(entry)
+        logger.warning(
+            "Slow query %.0fms on %s: %s params=%s",
+            duration_ms,
+            route or "-",
+            " ".join(statement.split()),
+            entry["parameters"],
+        )
+        if self._should_explain(statement, executemany):
+            # A fresh context keeps the EXPLAIN out of the current request's metrics and query budget.
+            task = asyncio.get_running_loop().create_task(
+                self._capture_plan(entry, explain, statement, parameters), context=contextvars.Context()
+            )
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    def _should_explain(self, statement: str, executemany: bool) -> bool:
+        if not self.explain or executemany or self._explaining:
+            return False
+        if not _READ_ONLY.match(statement) or _WRITES.search(statement):
+            return False
+        now = time.monotonic()
+        # Oldest first, so everything past the cooldown sits at the front.
+        while self._explained_at and (
+            len(self._explained_at) >= _MAX_EXPLAINED
+            or now - next(iter(self._explained_at.values())) >= self.explain_cooldown_seconds
+        ):
+            self._explained_at.popitem(last=False)
+        if statement in self._explained_at:
+            return False
+        self._explained_at[statement] = now
+        self._explaining = True
+        return True
+
+    async def _capture_plan(self, entry: dict[str, Any], explain: Explain, statement: str, parameters: Any) -> None:
+        try:
+            entry["plan"] = await explain(statement, list(parameters or ()))
+        except Exception as exc:
+            entry["plan"] = f"EXPLAIN failed: {type(exc).__name__}: {exc}"
+        finally:
+            self._explaining = False
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self._explained_at.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "threshold_ms": self.threshold_ms,
+            "explain": self.explain,
+            "total": self.total,
+            "entries": list(reversed(self.entries)),
+        }
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=get_settings().slow_query_threshold_ms,
+    max_entries=get_settings().slow_query_buffer_size,
+    explain=get_settings().slow_query_explain,
+    explain_cooldown_seconds=get_settings().slow_query_explain_cooldown_seconds,
+)
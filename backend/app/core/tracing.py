@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENTATION_SCOPE = "app.core.tracing"
+
+T = TypeVar("T")
+
+
+class SpanKind(IntEnum):
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+class StatusCode(IntEnum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    name: str
+    kind: SpanKind
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: StatusCode = StatusCode.UNSET
+    status_message: str = ""
+    # Finished spans of the whole trace, shared by every span in it.
+    finished: list[Span] = field(default_factory=list, repr=False)
+
+    def child(self, name: str, kind: SpanKind, start_ns: int, attributes: dict[str, Any]) -> Span:
+        return Span(
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_span_id=self.span_id,
+            name=name,
+            kind=kind,
+            start_ns=start_ns,
+            attributes=attributes,
+            finished=self.finished,
+        )
+
+    def end(self, end_ns: int | None = None) -> None:
+        self.end_ns = end_ns or time.time_ns()
+        self.finished.append(self)
+
+    def fail(self, exc: BaseException) -> None:
+        self.status = StatusCode.ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def to_otlp(self) -> dict[str, Any]:
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": int(self.status), **({"message": self.status_message} if self.status_message else {})},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+def otlp_document(service_name: str, spans: list[Span]) -> dict[str, Any]:
+    """Spans as an OTLP/JSON ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+                "scopeSpans": [{"scope": {"name": INSTRUMENTATION_SCOPE}, "spans": [span.to_otlp() for span in spans]}],
+            }
+        ]
+    }
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+
+class MemoryExporter:
+    """Keeps the most recent traces in memory for GET /admin/traces."""
+
+    def __init__(self, max_traces: int) -> None:
+        self.traces: deque[list[Span]] = deque(maxlen=max_traces)
+
+    def export(self, spans: list[Span]) -> None:
+        self.traces.append(spans)
+
+    def spans(self, limit: int | None = None) -> list[Span]:
+        traces = list(self.traces)[-limit:] if limit else list(self.traces)
+        return [span for trace in traces for span in trace]
+
+
+class FileExporter:
+    """Appends one OTLP/JSON document per trace to a JSON Lines file.
+
+    Traces are exported on the event loop, so encoding and writing happen on a background thread fed by
+    a queue; ``close`` writes whatever is still queued.
+    """
+
+    def __init__(self, path: str, service_name: str) -> None:
+        self.path = Path(path)
+        self.service_name = service_name
+        self._queue: queue.SimpleQueue[list[Span] | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._writer_pid: int | None = None
+
+    def export(self, spans: list[Span]) -> None:
+        self._ensure_writer()
+        self._queue.put(spans)
+
+    def close(self) -> None:
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and self._writer_pid == os.getpid():
+            self._queue.put(None)
+            writer.join()
+
+    def _ensure_writer(self) -> None:
+        # A writer thread inherited across fork is not running in this process, so start a fresh one.
+        if self._writer is not None and self._writer_pid == os.getpid():
+            return
+        with self._lock:
+            if self._writer is None or self._writer_pid != os.getpid():
+                self._queue = queue.SimpleQueue()
+                self._writer = threading.Thread(
+                    target=self._write_loop, args=(self._queue,), name="trace-file-exporter", daemon=True
+                )
+                self._writer_pid = os.getpid()
+                self._writer.start()
+
+    def _write_loop(self, pending: queue.SimpleQueue[list[Span] | None]) -> None:
+        done = False
+        while not done:
+            batch = [pending.get()]
+            while not pending.empty():
+                batch.append(pending.get_nowait())
+            done = None in batch
+            lines = [
+                json.dumps(otlp_document(self.service_name, spans), separators=(",", ":")) + "\n"
+                for spans in batch
+                if spans is not None
+            ]
+            if not lines:
+                continue
+            try:
+                with self.path.open("a", encoding="utf-8") as handle:
+                    handle.writelines(lines)
+            except OSError:
+                logger.exception("Writing %d trace(s) to %s failed", len(lines), self.path)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Request, service-method, SQL and pool-checkout spans; everything is a no-op outside a sampled request."""
+
+    def __init__(self, *, service_name: str, sample_rate: float, exporters: list[SpanExporter]) -> None:
+        self.service_name = service_name
+        self.sample_rate = sample_rate
+        self.exporters = exporters
+
+    @contextmanager
+    def start_trace(self, name: str, *, kind: SpanKind = SpanKind.SERVER, **attributes: Any) -> Iterator[Span]:
+        root = Span(
+            trace_id=secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_span_id=None,
+            name=name,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(root)
+        try:
+            yield root
+        except BaseException as exc:
+            root.fail(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            root.end()
+            self._export(root.finished)
+
+    @contextmanager
+    def span(self, name: str, *, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any) -> Iterator[Span | None]:
+        parent = _current_span.get()
+        if parent is None:
+            yield None
+            return
+        span = parent.child(name, kind, time.time_ns(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.fail(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    @staticmethod
+    def is_recording() -> bool:
+        """Whether the current context belongs to a sampled request; lets callers skip building attributes."""
+        return _current_span.get() is not None
+
+    def record(self, name: str, seconds: float, *, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any) -> None:
+        """Add a finished child span that ended just now and lasted ``seconds``."""
+        parent = _current_span.get()
+        if parent is None:
+            return
+        end_ns = time.time_ns()
+        parent.child(name, kind, end_ns - int(seconds * 1e9), attributes).end(end_ns)
+
+    def _export(self, spans: list[Span]) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception:
+                logger.exception("Span export failed in %s", type(exporter).__name__)
+
+    def close(self) -> None:
+        for exporter in self.exporters:
+            if isinstance(exporter, FileExporter):
+                exporter.close()
+
+    def memory(self) -> MemoryExporter | None:
+        return next((exporter for exporter in self.exporters if isinstance(exporter, MemoryExporter)), None)
+
+    def middleware(self, app: ASGIApp) -> ASGIApp:
+        async def traced_request(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] != "http" or random.random() >= self.sample_rate:
+                await app(scope, receive, send)
+                return
+            status_code = 500
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                await send(message)
+
+            with self.start_trace(f"{scope['method']}", **{"http.request.method": scope["method"], "url.path": scope["path"]}) as root:
+                try:
+                    await app(scope, receive, send_wrapper)
+                finally:
+                    route = route_template(scope)
+                    root.name = f"{scope['method']} {route}"
+                    root.attributes["http.route"] = route
+                    root.attributes["http.response.status_code"] = status_code
+                    if status_code >= 500:
+                        root.status = StatusCode.ERROR
+
+        return traced_request
+
+
+def _traced_method(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _current_span.get() is None:
+            return await func(*args, **kwargs)
+        with tracer.span(name, **{"code.function": name}):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def traced(cls: type[T]) -> type[T]:
+    """Class decorator: a span per call of every public async method, named ``Class.method``."""
+    for attr, member in list(vars(cls).items()):
+        if not attr.startswith("_") and inspect.iscoroutinefunction(member):
+            setattr(cls, attr, _traced_method(member, f"{cls.__name__}.{attr}"))
+    return cls
+
+
+def _build_tracer() -> Tracer:
+    settings = get_settings()
+    exporters: list[SpanExporter] = [MemoryExporter(settings.tracing_buffer_size)]
+    if settings.tracing_file:
+        exporters.append(FileExporter(settings.tracing_file, settings.project_name))
+    return Tracer(service_name=settings.project_name, sample_rate=settings.tracing_sample_rate, exporters=exporters)
+
+
+tracer = _build_tracer()
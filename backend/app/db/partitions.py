@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.session import get_engine
+
+logger = logging.getLogger(__name__)
+
+# Range-partitioned by ``season`` (FOR VALUES FROM (year) TO (year + 1)), one partition per table per season.
+SEASON_PARTITIONED_TABLES = ("attendance", "scores")
+_PARTITION_NAME = re.compile(r"^(?P<table>\w+)_y(?P<season>\d{4})$")
+
+_list_partitions = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = ANY(:tables)
+    """
+)
+
+
+def season_of(starts_at: datetime) -> int:
+    """The season a schedule belongs to: its year in CLUB_TIMEZONE, as in ``schedules.season``."""
+    return starts_at.astimezone(ZoneInfo(get_settings().club_timezone)).year
+
+
+def season_sql(column: str, tz: str) -> str:
+    return f"(EXTRACT(YEAR FROM {column} AT TIME ZONE '{tz}'))::smallint"
+
+
+def partition_name(table: str, season: int) -> str:
+    return f"{table}_y{season}"
+
+
+def create_partition_sql(table: str, season: int) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, season)} "
+        f"PARTITION OF {table} FOR VALUES FROM ({season}) TO ({season + 1})"
+    )
+
+
+class PartitionUnavailable(RuntimeError):
+    """A season partition is missing and could not be created; the write has to wait and retry."""
+
+
+class SeasonPartitions:
+    """Creates the season partitions of attendance and scores before rows need them.
+
+    A background task keeps this and next season's partitions in place. Writes that create or move a
+    schedule into another season call ensure() first. The DDL runs in its own short transaction with a
+    lock timeout, because attaching a partition briefly takes an exclusive lock on the parent table.
+    """
+
+    def __init__(self, *, check_interval_seconds: float, lock_timeout_ms: int) -> None:
+        self.check_interval_seconds = check_interval_seconds
+        self.lock_timeout_ms = lock_timeout_ms
+        self.known: set[int] = set()
+        self.created = 0
+        self.failures = 0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="season-partitions")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {"seasons": sorted(self.known), "created": self.created, "failures": self.failures}
+
+    async def ensure(self, *seasons: int) -> None:
+        """Make sure every table has a partition for each season, or raise PartitionUnavailable.
+
+        Callers run before their writes, so a failure never reaches the rows as a constraint violation.
+        """
+        if self.known.issuperset(seasons):
+            return
+        async with self._lock:
+            try:
+                async with get_engine().begin() as conn:
+                    # Another worker may have created it; the catalog is cheaper to ask than the DDL.
+                    self.known = self._complete(await conn.scalars(_list_partitions, {"tables": list(SEASON_PARTITIONED_TABLES)}))
+                    missing = sorted(set(seasons) - self.known)
+                    if not missing:
+                        return
+                    await conn.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+                    for season in missing:
+                        for table in SEASON_PARTITIONED_TABLES:
+                            await conn.execute(text(create_partition_sql(table, season)))
+                self.known.update(missing)
+                self.created += len(missing)
+                logger.info("Created season partitions for %s", ", ".join(map(str, missing)))
+            except Exception as exc:
+                self.failures += 1
+                logger.warning("Could not create season partitions for %s", sorted(seasons), exc_info=True)
+                raise PartitionUnavailable(f"No partitions for season {sorted(seasons)}") from exc
+
+    @staticmethod
+    def _complete(names: Any) -> set[int]:
+        # A season counts only once every partitioned table has it.
+        tables: dict[int, set[str]] = {}
+        for name in names:
+            match = _PARTITION_NAME.match(name)
+            if match is not None:
+                tables.setdefault(int(match["season"]), set()).add(match["table"])
+        return {season for season, found in tables.items() if found.issuperset(SEASON_PARTITIONED_TABLES)}
+
+    async def _run(self) -> None:
+        while True:
+            current = season_of(datetime.now(timezone.utc))
+            try:
+                await self.ensure(current, current + 1)
+            except PartitionUnavailable:
+                pass  # logged by ensure(); retried on the next check
+            await asyncio.sleep(self.check_interval_seconds)
+
+
+season_partitions = SeasonPartitions(
+    check_interval_seconds=get_settings().season_partition_check_seconds,
+    lock_timeout_ms=get_settings().season_partition_lock_timeout_ms,
+)
@@ -1,19 +1,116 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import os
+import time
+from collections.abc import AsyncGenerator, Iterable, Sequence
+from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from app.core.config import get_settings
+from app.core.metrics import Gauge, collectors, record_statement
+from app.core.query_budget import record_query
+from app.core.slow_queries import slow_query_log
+from app.core.tracing import SpanKind, tracer
+
+_engine: AsyncEngine | None = None
+_engine_pid: int | None = None
+_session_factory = async_sessionmaker(expire_on_commit=False, class_=AsyncSession)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    elapsed = time.perf_counter() - context._query_started_at
+    record_statement(elapsed)
+    record_query(statement)
+    slow_query_log.observe(statement, parameters, elapsed, executemany=executemany, explain=_explain)
+    if not tracer.is_recording():
+        return
+    tracer.record(
+        statement.split(None, 1)[0].upper() if statement else "SQL",
+        elapsed,
+        kind=SpanKind.CLIENT,
+        **{"db.system.name": "postgresql", "db.query.text": statement},
+    )
+
+
+class TracedQueuePool(AsyncAdaptedQueuePool):
+    """Records the wait for a pooled connection (or a new one) as a span."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if tracer.is_recording():
+                tracer.record("db.pool.checkout", time.perf_counter() - started, **{"db.pool.checked_out": self.checkedout()})
+
+
+async def _explain(statement: str, parameters: Sequence[Any]) -> str:
+    # Goes straight to the driver so the EXPLAIN is not itself timed, counted or explained.
+    async with get_engine().connect() as conn:
+        raw = await conn.get_raw_connection()
+        rows = await raw.driver_connection.fetch(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", *parameters)
+    return "\n".join(row[0] for row in rows)
 
 
 def _create_engine() -> AsyncEngine:
     settings = get_settings()
-    return create_async_engine(settings.database_dsn, pool_pre_ping=True)
+    engine = create_async_engine(
+        settings.database_dsn,
+        poolclass=TracedQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+    )
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    global _engine, _engine_pid
+    if _engine is not None and _engine_pid != os.getpid():
+        # Inherited across fork: the parent's sockets must not be used or closed from this process.
+        _engine.sync_engine.dispose(close=False)
+        _engine = None
+    if _engine is None:
+        _engine = _create_engine()
+        _engine_pid = os.getpid()
+    return _engine
+
+
+async def dispose_engine() -> None:
+    global _engine, _engine_pid
+    if _engine is None:
+        return
+    engine, _engine, _engine_pid = _engine, None, None
+    await engine.dispose()
+
+
+def _pool_gauges() -> Iterable[Gauge]:
+    if _engine is None:
+        return []
+    pool = _engine.pool
+    return [
+        Gauge("db_pool_size", "Configured persistent connections in the pool.", pool.size()),
+        Gauge("db_pool_checked_out", "Connections currently checked out of the pool.", pool.checkedout()),
+        Gauge("db_pool_checked_in", "Idle connections currently held by the pool.", pool.checkedin()),
+        Gauge("db_pool_overflow", "Connections open beyond the pool size.", max(pool.overflow(), 0)),
+    ]
+
+
+collectors.append(_pool_gauges)
 
 
-engine: AsyncEngine = _create_engine()
-async_session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+def async_session_factory() -> AsyncSession:
+    return _session_factory(bind=get_engine())
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
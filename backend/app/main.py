@@ -1,17 +1,63 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from app.api.routers import announcements, attendance, auth, schedules, scores, users
+from app.api.routers import admin, announcements, attendance, auth, calendar, dashboard, events, schedule_rules, schedules, scores, users
 from app.core.config import get_settings
+from app.core.events import schedule_events
+from app.core.invalidation import invalidation_listener
+from app.core.lifecycle import shutdown_signal, warm_up_pool
+from app.core.metrics import metrics_middleware, render_metrics
+from app.core.profiling import request_profiler
+from app.core.query_budget import query_budget
+from app.core.readiness import readiness_probe
+from app.core.security import password_hasher
+from app.core.tracing import tracer
+from app.db.partitions import PartitionUnavailable, season_partitions
+from app.db.session import dispose_engine, get_engine
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # The engine is created here rather than at import so every worker process builds its own pool.
+    settings = get_settings()
+    get_engine()
+    if settings.db_warmup_connections > 0:
+        await warm_up_pool(settings.db_warmup_connections)
+    if settings.invalidation_listen:
+        await invalidation_listener.start()
+    await season_partitions.start()
+    # SSE streams never finish on their own and the server waits for open connections before this
+    # lifespan exits, so they are ended as soon as the shutdown signal arrives.
+    shutdown_signal.install(schedule_events.close)
+    try:
+        yield
+    finally:
+        shutdown_signal.uninstall()
+        schedule_events.close()
+        await invalidation_listener.stop()
+        await season_partitions.stop()
+        password_hasher.shutdown()
+        tracer.close()
+        await dispose_engine()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
 
-    app = FastAPI(title=settings.project_name)
+    app = FastAPI(title=settings.project_name, lifespan=lifespan)
 
+    if settings.profiling_enabled:
+        app.add_middleware(request_profiler.middleware)
+    app.add_middleware(query_budget.middleware)
+    app.add_middleware(metrics_middleware)
+    if settings.tracing_enabled:
+        app.add_middleware(tracer.middleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_allow_origins,
@@ -20,17 +66,42 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.exception_handler(PartitionUnavailable)
+    async def partition_unavailable(_request: Request, _exc: PartitionUnavailable) -> JSONResponse:
+        # Usually a lock timeout while attaching the partition; the next attempt tends to succeed.
+        return JSONResponse(
+            {"detail": "Season storage is not ready, please retry"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "5"},
+        )
+
     @app.get("/health")
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
-    api_prefix = "/api"
+    @app.get("/ready")
+    async def ready() -> JSONResponse:
+        ok, report = await readiness_probe.check()
+        return JSONResponse(report, status_code=status.HTTP_200_OK if ok else status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics() -> PlainTextResponse:
+            return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+    api_prefix = settings.api_prefix
     app.include_router(auth.router, prefix=api_prefix)
     app.include_router(users.router, prefix=api_prefix)
     app.include_router(schedules.router, prefix=api_prefix)
+    app.include_router(schedule_rules.router, prefix=api_prefix)
     app.include_router(attendance.router, prefix=api_prefix)
     app.include_router(scores.router, prefix=api_prefix)
     app.include_router(announcements.router, prefix=api_prefix)
+    app.include_router(dashboard.router, prefix=api_prefix)
+    app.include_router(events.router, prefix=api_prefix)
+    app.include_router(calendar.router, prefix=api_prefix)
+    app.include_router(admin.router, prefix=api_prefix)
 
     return app
 
@@ -1,14 +1,19 @@
 from app.models.announcement import Announcement
+from app.models.announcement_read_state import AnnouncementReadState
 from app.models.attendance import Attendance, AttendanceStatus
 from app.models.schedule import Schedule
+from app.models.schedule_rule import RecurrenceFrequency, ScheduleRule
 from app.models.score import Score
 from app.models.user import MemberType, User, UserRole
 
 __all__ = [
     "Announcement",
+    "AnnouncementReadState",
     "Attendance",
     "AttendanceStatus",
+    "RecurrenceFrequency",
     "Schedule",
+    "ScheduleRule",
     "Score",
     "User",
     "UserRole",
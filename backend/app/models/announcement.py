@@ -3,8 +3,8 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,11 +12,20 @@ from app.db.base import Base
 
 class Announcement(Base):
     __tablename__ = "announcements"
+    __table_args__ = (
+        Index("ix_announcements_live_created_at", "created_at", postgresql_where=text("is_deleted IS false")),
+        Index("ix_announcements_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_announcements_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_announcements_content_trgm", "content", postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Written together with content so list pages never read the (TOASTed) content column.
+    summary: Mapped[str] = mapped_column(String(200), nullable=False, server_default="")
+    content_length: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     author_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
@@ -28,4 +37,15 @@ class Announcement(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
-    author = relationship("User", back_populates="announcements")
+    # 'simple' keeps Korean and English tokens as written; prefix queries cover Korean particles.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', content), 'B')",
+            persisted=True,
+        ),
+        nullable=False,
+        deferred=True,
+    )
+
+    author = relationship("User", back_populates="announcements", lazy="raise")
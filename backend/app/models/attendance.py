@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import DateTime, Enum, ForeignKey, ForeignKeyConstraint, SmallInteger, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,11 +19,20 @@ class AttendanceStatus(str, enum.Enum):
 
 class Attendance(Base):
     __tablename__ = "attendance"
-    __table_args__ = (UniqueConstraint("schedule_id", "user_id", name="uq_attendance_schedule_user"),)
+    # Partitioned by season (see app.db.partitions); the key has to be part of every unique constraint.
+    # Moving a schedule to another year cascades the new season and Postgres moves the rows.
+    __table_args__ = (
+        UniqueConstraint("schedule_id", "user_id", "season", name="uq_attendance_schedule_user"),
+        ForeignKeyConstraint(
+            ["schedule_id", "season"], ["schedules.id", "schedules.season"], name="fk_attendance_schedule_season", onupdate="CASCADE"
+        ),
+        {"postgresql_partition_by": "RANGE (season)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    season: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
 
-    schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schedules.id"), nullable=False)
+    schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     status: Mapped[AttendanceStatus] = mapped_column(Enum(AttendanceStatus, name="attendance_status"), nullable=False)
@@ -31,5 +40,5 @@ class Attendance(Base):
 
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    schedule = relationship("Schedule", back_populates="attendances")
-    user = relationship("User", back_populates="attendances")
+    schedule = relationship("Schedule", back_populates="attendances", lazy="raise")
+    user = relationship("User", back_populates="attendances", lazy="raise")
@@ -3,31 +3,45 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, Integer, SmallInteger, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.config import get_settings
 from app.db.base import Base
+from app.db.partitions import season_sql
 
 
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        Index("ix_schedules_rule_occurrence", "rule_id", "occurrence_index", unique=True),
+        # Target of the (schedule_id, season) foreign keys of the season-partitioned child tables.
+        UniqueConstraint("id", "season", name="uq_schedules_id_season"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    season: Mapped[int] = mapped_column(
+        SmallInteger, Computed(season_sql("starts_at", get_settings().club_timezone), persisted=True), nullable=False
+    )
     location: Mapped[str | None] = mapped_column(String(200), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     is_cancelled: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
 
+    # Set on occurrences of a ScheduleRule that were materialized (attached to, or edited).
+    rule_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("schedule_rules.id"), nullable=True)
+    occurrence_index: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
-    creator = relationship("User", back_populates="schedules_created")
-    attendances = relationship("Attendance", back_populates="schedule")
-    scores = relationship("Score", back_populates="schedule")
+    creator = relationship("User", back_populates="schedules_created", lazy="raise")
+    attendances = relationship("Attendance", back_populates="schedule", lazy="raise")
+    scores = relationship("Score", back_populates="schedule", lazy="raise")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Identity, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class RecurrenceFrequency(str, enum.Enum):
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+
+
+class ScheduleRule(Base):
+    """A recurring schedule; occurrences are expanded on read and stored in ``schedules`` only once used."""
+
+    __tablename__ = "schedule_rules"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Small stable number embedded in occurrence ids (see app.services.schedule_rule_service).
+    number: Mapped[int] = mapped_column(Integer, Identity(), unique=True, nullable=False)
+
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    location: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    frequency: Mapped[RecurrenceFrequency] = mapped_column(Enum(RecurrenceFrequency, name="recurrence_frequency"), nullable=False)
+    interval: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+    starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    timezone: Mapped[str] = mapped_column(String(64), nullable=False, server_default="Asia/Seoul")
+    # Original start times of skipped occurrences.
+    exdates: Mapped[list[datetime]] = mapped_column(ARRAY(DateTime(timezone=True)), nullable=False, server_default=text("'{}'"))
+
+    created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Text, func
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,14 @@ class MemberType(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    # Member search (UserService.search_user_rows): the "C" collation indexes serve prefix matches and the
+    # keyset order, the trigram indexes serve substring matches.
+    __table_args__ = (
+        Index("ix_users_name_key", text('(lower(name) COLLATE "C")'), "id"),
+        Index("ix_users_email_key", text('(email COLLATE "C")')),
+        Index("ix_users_name_trgm", text("lower(name) gin_trgm_ops"), postgresql_using="gin"),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -32,6 +40,8 @@ class User(Base):
     role: Mapped[UserRole] = mapped_column(Enum(UserRole, name="user_role"), nullable=False)
     member_type: Mapped[MemberType | None] = mapped_column(Enum(MemberType, name="member_type"), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Secret for the subscription URL of the member's iCalendar feed; NULL until one is issued.
+    calendar_token: Mapped[str | None] = mapped_column(String(64), unique=True, nullable=True)
 
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -40,7 +50,7 @@ class User(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
-    schedules_created = relationship("Schedule", back_populates="creator")
-    attendances = relationship("Attendance", back_populates="user")
-    scores = relationship("Score", back_populates="user")
-    announcements = relationship("Announcement", back_populates="author")
+    schedules_created = relationship("Schedule", back_populates="creator", lazy="raise")
+    attendances = relationship("Attendance", back_populates="user", lazy="raise")
+    scores = relationship("Score", back_populates="user", lazy="raise")
+    announcements = relationship("Announcement", back_populates="author", lazy="raise")
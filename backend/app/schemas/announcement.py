@@ -28,3 +28,24 @@ class AnnouncementRead(BaseModel):
     is_deleted: bool
     created_at: datetime
     updated_at: datetime
+
+
+class AnnouncementListItem(BaseModel):
+    id: UUID
+    title: str
+    summary: str
+    content_length: int
+    author_id: UUID
+    is_pinned: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class AnnouncementSearchResult(AnnouncementListItem):
+    rank: float
+    snippet: str  # HTML: escaped content with matches wrapped in <mark>...</mark>
+
+
+class UnreadCount(BaseModel):
+    count: int
+    has_more: bool  # more than ``count`` unread; shown as "99+"
@@ -8,6 +8,11 @@ class Token(BaseModel):
     token_type: str = Field(default="bearer")
 
 
+class StreamToken(BaseModel):
+    token: str
+    expires_in: int  # seconds; only checked when the stream is opened
+
+
 class LoginRequest(BaseModel):
     email: str
     password: str = Field(min_length=8)
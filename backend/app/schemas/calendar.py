@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class CalendarTokenRead(BaseModel):
+    token: str
+    url: str  # subscription URL for calendar apps; anyone holding it can read the feed
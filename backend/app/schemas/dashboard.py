@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from app.schemas.announcement import AnnouncementListItem
+from app.schemas.schedule import ScheduleRead
+from app.schemas.score import ScoreTrendPoint
+from app.schemas.user import UserRead
+
+
+class DashboardRead(BaseModel):
+    me: UserRead
+    schedules: list[ScheduleRead]
+    announcements: list[AnnouncementListItem]
+    score_trend: list[ScoreTrendPoint]
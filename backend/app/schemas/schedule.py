@@ -29,5 +29,14 @@ class ScheduleRead(BaseModel):
     notes: str | None
     created_by: UUID | None
     is_cancelled: bool
+    rule_id: UUID | None
     created_at: datetime
     updated_at: datetime
+
+
+class ScheduleMonthEntry(ScheduleRead):
+    attend_count: int
+    absent_count: int
+    unknown_count: int
+    score_average: float | None
+    score_count: int
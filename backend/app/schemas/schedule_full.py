@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.schemas.attendance import AttendanceRead
+from app.schemas.schedule import ScheduleRead
+from app.schemas.score import ScoreRead
+
+
+class ScheduleAttendanceEntry(AttendanceRead):
+    user_name: str
+
+
+class MemberScores(BaseModel):
+    user_id: UUID
+    user_name: str
+    games: list[ScoreRead]
+    average: float | None
+    highest: int | None
+
+
+class ScheduleStats(BaseModel):
+    average: float | None
+    min: int | None
+    max: int | None
+    count: int
+
+
+class ScheduleFullRead(BaseModel):
+    schedule: ScheduleRead
+    attendance: list[ScheduleAttendanceEntry] | None = None
+    scores: list[MemberScores] | None = None
+    stats: ScheduleStats | None = None
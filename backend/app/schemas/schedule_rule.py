@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.schedule_rule import RecurrenceFrequency
+
+
+class ScheduleRuleCreate(BaseModel):
+    title: str = Field(min_length=1, max_length=200)
+    location: str | None = Field(default=None, max_length=200)
+    notes: str | None = Field(default=None, max_length=10_000)
+    frequency: RecurrenceFrequency
+    interval: int = Field(default=1, ge=1, le=52)
+    starts_at: datetime
+    until: datetime | None = None
+    timezone: str = Field(default="Asia/Seoul", max_length=64)
+    exdates: list[datetime] = Field(default_factory=list, max_length=500)
+
+    @field_validator("timezone")
+    @classmethod
+    def _known_timezone(cls, value: str) -> str:
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown time zone: {value}") from None
+        return value
+
+
+class ScheduleRuleUpdate(BaseModel):
+    # The pattern itself (frequency, interval, start, time zone) is fixed: occurrence ids depend on it.
+    # End a rule with ``until`` and create a new one to change it.
+    title: str | None = Field(default=None, min_length=1, max_length=200)
+    location: str | None = Field(default=None, max_length=200)
+    notes: str | None = Field(default=None, max_length=10_000)
+    until: datetime | None = None
+    exdates: list[datetime] | None = Field(default=None, max_length=500)
+
+
+class ScheduleRuleRead(BaseModel):
+    id: UUID
+    title: str
+    location: str | None
+    notes: str | None
+    frequency: RecurrenceFrequency
+    interval: int
+    starts_at: datetime
+    until: datetime | None
+    timezone: str
+    exdates: list[datetime]
+    created_by: UUID | None
+    created_at: datetime
+    updated_at: datetime
@@ -24,3 +24,11 @@ class ScoreRead(BaseModel):
     game_no: int
     score: int
     created_at: datetime
+
+
+class ScoreTrendPoint(BaseModel):
+    schedule_id: UUID
+    starts_at: datetime
+    title: str
+    average: float
+    highest: int
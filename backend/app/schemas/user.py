@@ -28,7 +28,7 @@ class UserBase(BaseModel):
     @field_validator("email")
     @classmethod
     def normalize_email(cls, v: EmailStr) -> EmailStr:
-        return EmailStr(str(v).lower())
+        return str(v).lower()
 
 
 class UserCreate(BaseModel):
@@ -42,7 +42,7 @@ class UserCreate(BaseModel):
     @field_validator("email")
     @classmethod
     def normalize_email(cls, v: EmailStr) -> EmailStr:
-        return EmailStr(str(v).lower())
+        return str(v).lower()
 
     @field_validator("member_type")
     @classmethod
@@ -76,5 +76,22 @@ class UserRead(BaseModel):
     updated_at: datetime
 
 
+class UserSearchPage(BaseModel):
+    items: list[UserRead]
+    # Pass back as ``cursor`` for the next page; null on the last page.
+    next_cursor: str | None
+
+
+class UserImportError(BaseModel):
+    row: int  # 1-based, not counting a CSV header
+    email: str | None
+    detail: str
+
+
+class UserImportResult(BaseModel):
+    created: int
+    users: list[UserRead]
+
+
 class ProfileUpdate(BaseModel):
     description: str | None = Field(default=None, max_length=10_000)
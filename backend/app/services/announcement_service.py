@@ -1,15 +1,54 @@
 from __future__ import annotations
 
+import re
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import all_, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import defer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import ANNOUNCEMENTS_TAG, response_cache
+from app.core.invalidation import publish_invalidation
+from app.core.serialization import rows_as_dicts, schema_columns
+from app.core.tracing import traced
 from app.models.announcement import Announcement
-from app.schemas.announcement import AnnouncementCreate, AnnouncementUpdate
+from app.models.announcement_read_state import AnnouncementReadState
+from app.models.user import User
+from app.schemas.announcement import AnnouncementCreate, AnnouncementListItem, AnnouncementUpdate
 
+_SEARCH_TOKEN = re.compile(r"\w+")
+MAX_SEARCH_TOKENS = 8
+UNREAD_COUNT_LIMIT = 99  # badges show "99+"; counting stops there
+SUMMARY_LENGTH = 200  # matches Announcement.summary
+SNIPPET_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=12, MaxFragments=2, FragmentDelimiter=\" … \""
 
+
+# Same output as html.escape(); "&" goes first so the entities themselves are not escaped again.
+HTML_ENTITIES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"))
+
+
+def html_escaped(column: Any) -> Any:
+    """SQL for ``column`` with the HTML special characters replaced by entities."""
+    for char, entity in HTML_ENTITIES:
+        column = func.replace(column, char, entity)
+    return column
+
+
+def summarize(content: str, length: int = SUMMARY_LENGTH) -> str:
+    """Whitespace-collapsed excerpt of at most ``length`` characters, cut at a word boundary when possible."""
+    text = " ".join(content.split())
+    if len(text) <= length:
+        return text
+    cut = text[: length - 1]
+    head = cut.rsplit(" ", 1)[0]
+    return (head if len(head) >= length // 2 else cut).rstrip() + "…"
+
+
+@traced
 class AnnouncementService:
     async def list_announcements(self, db: AsyncSession, *, page: int = 1, size: int = 20) -> tuple[list[Announcement], int]:
         base_filter = Announcement.is_deleted.is_(False)
@@ -17,6 +56,7 @@ class AnnouncementService:
         total = await db.scalar(select(func.count()).select_from(Announcement).where(base_filter))
         stmt = (
             select(Announcement)
+            .options(defer(Announcement.content))
             .where(base_filter)
             .order_by(Announcement.is_pinned.desc(), Announcement.created_at.desc())
             .offset((page - 1) * size)
@@ -25,16 +65,66 @@ class AnnouncementService:
         result = await db.execute(stmt)
         return list(result.scalars().all()), int(total or 0)
 
+    async def list_announcement_rows(self, db: AsyncSession, *, page: int = 1, size: int = 20) -> list[dict[str, object]]:
+        stmt = (
+            select(*schema_columns(Announcement, AnnouncementListItem))
+            .where(Announcement.is_deleted.is_(False))
+            .order_by(Announcement.is_pinned.desc(), Announcement.created_at.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+        return rows_as_dicts(await db.execute(stmt))
+
+    async def search_announcement_rows(
+        self, db: AsyncSession, *, q: str, page: int = 1, size: int = 20
+    ) -> list[dict[str, object]]:
+        tokens = _SEARCH_TOKEN.findall(q.lower())[:MAX_SEARCH_TOKENS]
+        if not tokens:
+            return []
+        # Every word as a prefix: Korean words carry particles ("볼링장에서"), so '볼링장:*' must match them.
+        query = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+        matches = [Announcement.search_vector.bool_op("@@")(query)]
+        phrase = " ".join(tokens)
+        if len(phrase) >= 3:
+            # Substring hits inside longer words, served by the trigram indexes.
+            pattern = "%" + phrase.replace("_", "\\_") + "%"  # tokens are \w+, so "_" is the only wildcard left
+            matches += [Announcement.title.ilike(pattern, escape="\\"), Announcement.content.ilike(pattern, escape="\\")]
+
+        rank = func.ts_rank_cd(Announcement.search_vector, query)
+        stmt = (
+            select(
+                *schema_columns(Announcement, AnnouncementListItem),
+                rank.label("rank"),
+                # Escaped before highlighting, so the only markup in the snippet is the <mark> tags.
+                func.ts_headline("simple", html_escaped(Announcement.content), query, literal(SNIPPET_OPTIONS)).label("snippet"),
+            )
+            .where(Announcement.is_deleted.is_(False), or_(*matches))
+            .order_by(rank.desc(), Announcement.created_at.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+        return rows_as_dicts(await db.execute(stmt))
+
+    async def get_list_version(self, db: AsyncSession) -> tuple[int, datetime | None]:
+        # Soft deletes bump updated_at, so max() is taken over deleted rows as well.
+        stmt = select(func.count().filter(Announcement.is_deleted.is_(False)), func.max(Announcement.updated_at))
+        row = (await db.execute(stmt.select_from(Announcement))).one()
+        return int(row[0] or 0), row[1]
+
     async def create_announcement(self, db: AsyncSession, *, author_id: UUID, payload: AnnouncementCreate) -> Announcement:
         announcement = Announcement(
             title=payload.title,
             content=payload.content,
+            summary=summarize(payload.content),
+            content_length=len(payload.content),
             author_id=author_id,
             is_pinned=payload.is_pinned,
             is_deleted=False,
         )
         db.add(announcement)
+        await publish_invalidation(db, ANNOUNCEMENTS_TAG)
         await db.commit()
+        await response_cache.invalidate(ANNOUNCEMENTS_TAG)
         await db.refresh(announcement)
         return announcement
 
@@ -51,17 +141,93 @@ class AnnouncementService:
         data = payload.model_dump(exclude_unset=True)
         for k, v in data.items():
             setattr(announcement, k, v)
+        if "content" in data:
+            announcement.summary = summarize(announcement.content)
+            announcement.content_length = len(announcement.content)
 
+        await publish_invalidation(db, ANNOUNCEMENTS_TAG)
         await db.commit()
+        await response_cache.invalidate(ANNOUNCEMENTS_TAG)
         await db.refresh(announcement)
         return announcement
 
     async def delete_announcement(self, db: AsyncSession, *, announcement_id: UUID) -> Announcement:
         announcement = await self.get_announcement(db, announcement_id=announcement_id)
         announcement.is_deleted = True
+        await publish_invalidation(db, ANNOUNCEMENTS_TAG)
         await db.commit()
+        await response_cache.invalidate(ANNOUNCEMENTS_TAG)
         await db.refresh(announcement)
         return announcement
 
+    async def get_unread_count(self, db: AsyncSession, *, user: User) -> tuple[int, bool]:
+        # Members who never marked anything start from their join date, not from the first notice ever.
+        mine = AnnouncementReadState.user_id == user.id
+        read_through = func.coalesce(select(AnnouncementReadState.read_through).where(mine).scalar_subquery(), user.created_at)
+        read_ids = func.coalesce(
+            select(AnnouncementReadState.read_ids).where(mine).scalar_subquery(), literal([], AnnouncementReadState.read_ids.type)
+        )
+        unread = (
+            select(Announcement.id)
+            .where(
+                Announcement.is_deleted.is_(False),
+                Announcement.created_at > read_through,
+                Announcement.id != all_(read_ids),
+            )
+            .limit(UNREAD_COUNT_LIMIT + 1)
+            .subquery()
+        )
+        count = int(await db.scalar(select(func.count()).select_from(unread)) or 0)
+        return min(count, UNREAD_COUNT_LIMIT), count > UNREAD_COUNT_LIMIT
+
+    async def _lock_read_state(self, db: AsyncSession, *, user: User) -> AnnouncementReadState:
+        await db.execute(
+            insert(AnnouncementReadState)
+            .values(user_id=user.id, read_through=user.created_at, read_ids=[])
+            .on_conflict_do_nothing(index_elements=[AnnouncementReadState.user_id])
+        )
+        stmt = select(AnnouncementReadState).where(AnnouncementReadState.user_id == user.id).with_for_update()
+        return (await db.execute(stmt)).scalar_one()
+
+    async def mark_read(self, db: AsyncSession, *, user: User, announcement_id: UUID) -> None:
+        announcement = await self.get_announcement(db, announcement_id=announcement_id)
+        state = await self._lock_read_state(db, user=user)
+        if announcement.created_at <= state.read_through or announcement.id in state.read_ids:
+            await db.commit()
+            return
+
+        read_ids = [*state.read_ids, announcement.id]
+        live_after = (Announcement.is_deleted.is_(False), Announcement.created_at > state.read_through)
+        # Move the watermark over the run of read announcements that now directly follows it,
+        # so the exception list only ever holds items read out of order.
+        oldest_unread = await db.scalar(
+            select(func.min(Announcement.created_at)).where(*live_after, Announcement.id.not_in(read_ids))
+        )
+        covered = select(func.max(Announcement.created_at)).where(*live_after)
+        if oldest_unread is not None:
+            covered = covered.where(Announcement.created_at < oldest_unread)
+        watermark = await db.scalar(covered)
+        if watermark is not None:
+            state.read_through = watermark
+            read_ids = list(
+                await db.scalars(select(Announcement.id).where(Announcement.id.in_(read_ids), Announcement.created_at > watermark))
+            )
+        state.read_ids = read_ids
+        await db.commit()
+
+    async def mark_all_read(self, db: AsyncSession, *, user: User) -> None:
+        state = await self._lock_read_state(db, user=user)
+        # The newest announcement this transaction can see, not now(): one still being written was
+        # stamped earlier but commits later, and the member has not seen it yet.
+        newest = await db.scalar(
+            select(func.max(Announcement.created_at)).where(
+                Announcement.is_deleted.is_(False), Announcement.created_at > state.read_through
+            )
+        )
+        if newest is not None:
+            state.read_through = newest
+            state.read_ids = []
+        await db.commit()
+
 
 announcement_service = AnnouncementService()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -7,16 +9,47 @@ from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import response_cache, schedule_tag, user_tag
+from app.core.events import schedule_events
+from app.core.invalidation import publish_event, publish_invalidation
+from app.core.serialization import rows_as_dicts, schema_columns
+from app.core.tracing import traced
 from app.models.attendance import Attendance, AttendanceStatus
-from app.models.schedule import Schedule
-from app.schemas.attendance import AttendanceUpsert
+from app.schemas.attendance import AttendanceRead, AttendanceUpsert
+from app.services.schedule_service import schedule_season, schedule_service
 
 
+@traced
 class AttendanceService:
     async def list_schedule_attendance(self, db: AsyncSession, *, schedule_id: UUID) -> list[Attendance]:
-        await self._ensure_schedule_exists(db, schedule_id=schedule_id)
-        result = await db.execute(select(Attendance).where(Attendance.schedule_id == schedule_id).order_by(Attendance.updated_at.desc()))
-        return list(result.scalars().all())
+        result = await db.execute(
+            select(Attendance)
+            .where(Attendance.schedule_id == schedule_id, Attendance.season == schedule_season(schedule_id))
+            .order_by(Attendance.updated_at.desc())
+        )
+        items = list(result.scalars().all())
+        # Rows imply the schedule exists; only an empty result needs the extra lookup.
+        if not items:
+            await self.ensure_schedule_exists(db, schedule_id=schedule_id)
+        return items
+
+    async def list_schedule_attendance_rows(self, db: AsyncSession, *, schedule_id: UUID) -> list[dict[str, object]]:
+        stmt = (
+            select(*schema_columns(Attendance, AttendanceRead))
+            .where(Attendance.schedule_id == schedule_id, Attendance.season == schedule_season(schedule_id))
+            .order_by(Attendance.updated_at.desc())
+        )
+        rows = rows_as_dicts(await db.execute(stmt))
+        if not rows:
+            await self.ensure_schedule_exists(db, schedule_id=schedule_id)
+        return rows
+
+    async def get_schedule_attendance_version(self, db: AsyncSession, *, schedule_id: UUID) -> tuple[int, datetime | None]:
+        stmt = select(func.count(), func.max(Attendance.updated_at)).where(
+            Attendance.schedule_id == schedule_id, Attendance.season == schedule_season(schedule_id)
+        )
+        row = (await db.execute(stmt)).one()
+        return int(row[0] or 0), row[1]
 
     async def upsert_attendance_for_user(
         self,
@@ -26,14 +59,17 @@ class AttendanceService:
         user_id: UUID,
         payload: AttendanceUpsert,
     ) -> Attendance:
-        await self._ensure_schedule_exists(db, schedule_id=schedule_id)
+        season = await schedule_service.ensure_stored(db, schedule_id=schedule_id)
 
-        result = await db.execute(select(Attendance).where(Attendance.schedule_id == schedule_id, Attendance.user_id == user_id))
+        result = await db.execute(
+            select(Attendance).where(Attendance.schedule_id == schedule_id, Attendance.user_id == user_id, Attendance.season == season)
+        )
         attendance = result.scalar_one_or_none()
 
         if attendance is None:
             attendance = Attendance(
                 schedule_id=schedule_id,
+                season=season,
                 user_id=user_id,
                 status=payload.status,
                 comment=payload.comment,
@@ -44,12 +80,18 @@ class AttendanceService:
             attendance.comment = payload.comment
 
         try:
+            # Flushed and refreshed before COMMIT so the event carries the new updated_at.
+            await db.flush()
+            await db.refresh(attendance)
+            await publish_invalidation(db, schedule_tag(schedule_id), user_tag(user_id))
+            await publish_event(db, *self._event(attendance))
             await db.commit()
         except IntegrityError:
             await db.rollback()
             raise HTTPException(status_code=409, detail="Attendance conflict")
 
-        await db.refresh(attendance)
+        await response_cache.invalidate(schedule_tag(schedule_id), user_tag(user_id))
+        schedule_events.publish(*self._event(attendance))
         return attendance
 
     async def get_my_attendance(self, db: AsyncSession, *, user_id: UUID, page: int = 1, size: int = 20) -> tuple[list[Attendance], int]:
@@ -63,22 +105,53 @@ class AttendanceService:
         )
         return list(result.scalars().all()), int(total or 0)
 
-    async def _ensure_schedule_exists(self, db: AsyncSession, *, schedule_id: UUID) -> None:
-        exists = await db.scalar(select(func.count()).select_from(Schedule).where(Schedule.id == schedule_id))
-        if not exists:
+    async def get_my_attendance_rows(self, db: AsyncSession, *, user_id: UUID, page: int = 1, size: int = 20) -> list[dict[str, object]]:
+        stmt = (
+            select(*schema_columns(Attendance, AttendanceRead))
+            .where(Attendance.user_id == user_id)
+            .order_by(Attendance.updated_at.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+        return rows_as_dicts(await db.execute(stmt))
+
+    async def ensure_schedule_exists(self, db: AsyncSession, *, schedule_id: UUID) -> None:
+        if not await schedule_service.schedule_exists(db, schedule_id=schedule_id):
             raise HTTPException(status_code=404, detail="Schedule not found")
 
     async def set_unknown_if_missing(self, db: AsyncSession, *, schedule_id: UUID, user_id: UUID) -> Attendance:
-        result = await db.execute(select(Attendance).where(Attendance.schedule_id == schedule_id, Attendance.user_id == user_id))
+        # Before any attendance read: materializing may create partitions, which waits on such reads.
+        season = await schedule_service.ensure_stored(db, schedule_id=schedule_id)
+        result = await db.execute(
+            select(Attendance).where(Attendance.schedule_id == schedule_id, Attendance.user_id == user_id, Attendance.season == season)
+        )
         attendance = result.scalar_one_or_none()
         if attendance is not None:
             return attendance
 
-        attendance = Attendance(schedule_id=schedule_id, user_id=user_id, status=AttendanceStatus.UNKNOWN, comment=None)
+        attendance = Attendance(schedule_id=schedule_id, season=season, user_id=user_id, status=AttendanceStatus.UNKNOWN, comment=None)
         db.add(attendance)
-        await db.commit()
+        await db.flush()
         await db.refresh(attendance)
+        await publish_invalidation(db, schedule_tag(schedule_id), user_tag(user_id))
+        await publish_event(db, *self._event(attendance))
+        await db.commit()
+        await response_cache.invalidate(schedule_tag(schedule_id), user_tag(user_id))
+        schedule_events.publish(*self._event(attendance))
         return attendance
 
+    @staticmethod
+    def _event(attendance: Attendance) -> tuple[UUID, str, dict[str, Any]]:
+        return (
+            attendance.schedule_id,
+            "attendance",
+            {
+                "user_id": attendance.user_id,
+                "status": attendance.status.value,
+                "comment": attendance.comment,
+                "updated_at": attendance.updated_at,
+            },
+        )
+
 
 attendance_service = AttendanceService()
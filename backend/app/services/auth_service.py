@@ -7,10 +7,12 @@ from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import create_access_token, password_hasher
+from app.core.tracing import traced
 from app.models.user import User
 
 
+@traced
 class AuthService:
     async def login(self, db: AsyncSession, *, email: str, password: str) -> str:
         email_normalized = email.lower().strip()
@@ -18,7 +20,7 @@ class AuthService:
         result = await db.execute(select(User).where(User.email == email_normalized))
         user = result.scalar_one_or_none()
 
-        if user is None or not verify_password(password, user.password_hash):
+        if user is None or not await password_hasher.verify(password, user.password_hash):
             raise HTTPException(status_code=401, detail="Incorrect email or password")
         if not user.is_active:
             raise HTTPException(status_code=403, detail="Inactive user")
@@ -34,10 +36,10 @@ class AuthService:
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
 
-        if not verify_password(current_password, user.password_hash):
+        if not await password_hasher.verify(current_password, user.password_hash):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
 
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await password_hasher.hash(new_password)
         await db.commit()
 
 
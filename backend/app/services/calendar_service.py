@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import secrets
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache, user_tag
+from app.core.config import get_settings
+from app.core.icalendar import content_line, escape_text, format_utc
+from app.core.invalidation import publish_invalidation
+from app.core.serialization import rows_as_dicts
+from app.core.tracing import traced
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.schedule import Schedule
+from app.models.schedule_rule import ScheduleRule
+from app.models.user import User
+from app.services.schedule_rule_service import schedule_rule_service
+
+CALENDAR_MEDIA_TYPE = "text/calendar; charset=utf-8"
+PRODID = "-//Degururu//Club Schedule//EN"
+
+_PARTSTAT = {
+    AttendanceStatus.ATTEND: "ACCEPTED",
+    AttendanceStatus.ABSENT: "DECLINED",
+    AttendanceStatus.UNKNOWN: "NEEDS-ACTION",
+}
+_ATTENDANCE_LABEL = {
+    AttendanceStatus.ATTEND: "Attending",
+    AttendanceStatus.ABSENT: "Not attending",
+    AttendanceStatus.UNKNOWN: "Not answered",
+}
+
+
+def feed_window(now: datetime | None = None) -> tuple[datetime, datetime, datetime]:
+    """(day, starts_from, occurrences_to) for the feed.
+
+    The window moves at midnight UTC, so the feed only changes on writes and once a day.
+    """
+    settings = get_settings()
+    day = (now or datetime.now(timezone.utc)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (
+        day,
+        day - timedelta(days=settings.calendar_feed_past_days),
+        day + timedelta(days=settings.schedule_rule_horizon_days),
+    )
+
+
+def _quote_param(value: str) -> str:
+    return '"' + value.replace('"', "'") + '"'
+
+
+def _render_event(event: Mapping[str, Any], *, attendee_name: str, attendee_email: str, duration: str) -> str:
+    attendance: AttendanceStatus | None = event["attendance"]
+    description = [event["notes"]] if event["notes"] else []
+    if attendance is not None:
+        label = _ATTENDANCE_LABEL[attendance]
+        description.append(f"Your attendance: {label}" + (f" ({event['attendance_comment']})" if event["attendance_comment"] else ""))
+
+    lines = [
+        content_line("BEGIN", "VEVENT"),
+        content_line("UID", f"{event['id']}@degururu"),
+        # Stamped with the row's own update time so an unchanged schedule renders identical bytes.
+        content_line("DTSTAMP", format_utc(event["updated_at"])),
+        content_line("LAST-MODIFIED", format_utc(event["updated_at"])),
+        content_line("DTSTART", format_utc(event["starts_at"])),
+        content_line("DURATION", duration),
+        content_line("SUMMARY", escape_text(event["title"])),
+        content_line("STATUS", "CANCELLED" if event["is_cancelled"] else "CONFIRMED"),
+    ]
+    if event["location"]:
+        lines.append(content_line("LOCATION", escape_text(event["location"])))
+    if description:
+        lines.append(content_line("DESCRIPTION", escape_text("\n\n".join(description))))
+    if attendance is not None:
+        lines.append(content_line("ATTENDEE", f"mailto:{attendee_email}", cn=_quote_param(attendee_name), partstat=_PARTSTAT[attendance]))
+    if event["is_cancelled"] or attendance is AttendanceStatus.ABSENT:
+        lines.append(content_line("TRANSP", "TRANSPARENT"))
+    lines.append(content_line("END", "VEVENT"))
+    return "".join(lines)
+
+
+def render_feed(events: Iterable[Mapping[str, Any]], *, attendee_name: str, attendee_email: str) -> Iterator[bytes]:
+    """The VCALENDAR document, one chunk per event."""
+    duration = f"PT{get_settings().calendar_event_minutes}M"
+    yield "".join(
+        [
+            content_line("BEGIN", "VCALENDAR"),
+            content_line("VERSION", "2.0"),
+            content_line("PRODID", PRODID),
+            content_line("CALSCALE", "GREGORIAN"),
+            content_line("METHOD", "PUBLISH"),
+            content_line("X-WR-CALNAME", "Degururu"),
+            content_line("REFRESH-INTERVAL", "PT1H", value="DURATION"),
+            content_line("X-PUBLISHED-TTL", "PT1H"),
+        ]
+    ).encode()
+    for event in events:
+        yield _render_event(event, attendee_name=attendee_name, attendee_email=attendee_email, duration=duration).encode()
+    yield content_line("END", "VCALENDAR").encode()
+
+
+@traced
+class CalendarService:
+    async def issue_token(self, db: AsyncSession, *, user: User) -> str:
+        """Issue a new feed token, replacing (and so revoking) any previous one."""
+        token = secrets.token_urlsafe(32)
+        user.calendar_token = token
+        await publish_invalidation(db, user_tag(user.id))
+        await db.commit()
+        await response_cache.invalidate(user_tag(user.id))
+        return token
+
+    async def revoke_token(self, db: AsyncSession, *, user: User) -> None:
+        user.calendar_token = None
+        await publish_invalidation(db, user_tag(user.id))
+        await db.commit()
+        await response_cache.invalidate(user_tag(user.id))
+
+    async def get_feed_user(self, db: AsyncSession, *, token: str) -> User:
+        stmt = select(User).where(User.calendar_token == token, User.is_active.is_(True))
+        user = (await db.execute(stmt)).scalar_one_or_none()
+        if user is None:
+            raise HTTPException(status_code=404, detail="Calendar not found")
+        return user
+
+    async def get_feed_version(self, db: AsyncSession, *, user_id: UUID, starts_from: datetime) -> tuple[int, int, datetime | None]:
+        """(schedules in the window, the member's attendance rows, newest update) in one statement."""
+        # As for schedule lists, max(updated_at) spans every schedule and rule so nothing that can change
+        # the feed is missed; attendance is only the member's own.
+        rules_updated = select(func.max(ScheduleRule.updated_at)).scalar_subquery()
+        answers = select(func.count()).select_from(Attendance).where(Attendance.user_id == user_id).scalar_subquery()
+        answers_updated = select(func.max(Attendance.updated_at)).where(Attendance.user_id == user_id).scalar_subquery()
+        stmt = select(
+            func.count().filter(Schedule.starts_at >= starts_from),
+            func.max(Schedule.updated_at),
+            rules_updated,
+            answers,
+            answers_updated,
+        ).select_from(Schedule)
+        row = (await db.execute(stmt)).one()
+        updated = [value for value in (row[1], row[2], row[4]) if value is not None]
+        return int(row[0] or 0), int(row[3] or 0), max(updated, default=None)
+
+    async def feed_events(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: UUID,
+        starts_from: datetime,
+        occurrences_to: datetime,
+    ) -> list[dict[str, Any]]:
+        """Schedules from ``starts_from`` on with the member's attendance, plus virtual rule occurrences."""
+        stmt = (
+            select(
+                Schedule.id,
+                Schedule.title,
+                Schedule.starts_at,
+                Schedule.location,
+                Schedule.notes,
+                Schedule.is_cancelled,
+                Schedule.updated_at,
+                Attendance.status.label("attendance"),
+                Attendance.comment.label("attendance_comment"),
+            )
+            .outerjoin(
+                Attendance,
+                and_(Attendance.schedule_id == Schedule.id, Attendance.season == Schedule.season, Attendance.user_id == user_id),
+            )
+            .where(Schedule.starts_at >= starts_from)
+        )
+        events = rows_as_dicts(await db.execute(stmt))
+        # Nothing can be attached to an occurrence that is still virtual.
+        occurrences = await schedule_rule_service.occurrence_rows(db, starts_from=starts_from, starts_to=occurrences_to)
+        events += [{**row, "attendance": None, "attendance_comment": None} for row in occurrences]
+        events.sort(key=lambda event: event["starts_at"])
+        return events
+
+
+calendar_service = CalendarService()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import ANNOUNCEMENTS_TAG, SCHEDULES_TAG, response_cache, user_tag
+from app.core.config import get_settings
+from app.core.serialization import dump_rows, to_json
+from app.core.tracing import traced
+from app.db.session import async_session_factory
+from app.models.user import User
+from app.schemas.announcement import AnnouncementListItem
+from app.schemas.schedule import ScheduleRead
+from app.schemas.score import ScoreTrendPoint
+from app.schemas.user import UserRead
+from app.services.announcement_service import announcement_service
+from app.services.schedule_service import schedule_service
+from app.services.score_service import score_service
+
+
+@traced
+class DashboardService:
+    def __init__(self, *, max_connections: int) -> None:
+        self._connections = asyncio.Semaphore(max_connections)
+
+    async def get_dashboard(
+        self,
+        *,
+        user: User,
+        schedule_size: int = 20,
+        announcement_size: int = 20,
+        trend_limit: int = 50,
+    ) -> bytes:
+        async def schedules(db: AsyncSession) -> bytes:
+            return dump_rows(ScheduleRead, await schedule_service.list_schedule_rows(db, size=schedule_size))
+
+        async def announcements(db: AsyncSession) -> bytes:
+            return dump_rows(AnnouncementListItem, await announcement_service.list_announcement_rows(db, size=announcement_size))
+
+        async def score_trend(db: AsyncSession) -> bytes:
+            return to_json(list[ScoreTrendPoint], await score_service.get_my_trend(db, user_id=user.id, limit=trend_limit))
+
+        # Each section checks out its own pooled connection, so the sections overlap instead of queueing
+        # behind one session. The semaphore caps how many connections all dashboards hold at once.
+        sections = await asyncio.gather(
+            self._section(f"dashboard.schedules|{schedule_size}", [SCHEDULES_TAG], schedules),
+            self._section(f"dashboard.announcements|{announcement_size}", [ANNOUNCEMENTS_TAG], announcements),
+            self._section(f"dashboard.trend|{user.id}|{trend_limit}", [user_tag(user.id), SCHEDULES_TAG], score_trend),
+        )
+        me = to_json(UserRead, user)
+        return b'{"me":%b,"schedules":%b,"announcements":%b,"score_trend":%b}' % (me, *sections)
+
+    async def _section(self, key: str, tags: list[str], load: Callable[[AsyncSession], Awaitable[bytes]]) -> bytes:
+        async def run() -> bytes:
+            async with self._connections, async_session_factory() as db:
+                return await load(db)
+
+        if not get_settings().dashboard_section_cache:
+            return await run()
+        return await response_cache.get_or_set(key, tags=tags, load=run)
+
+
+dashboard_service = DashboardService(max_connections=get_settings().dashboard_max_connections)
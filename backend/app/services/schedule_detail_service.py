@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.serialization import rows_as_dicts, schema_columns
+from app.core.tracing import traced
+from app.models.attendance import Attendance
+from app.models.schedule import Schedule
+from app.models.score import Score
+from app.models.user import User
+from app.schemas.attendance import AttendanceRead
+from app.schemas.schedule import ScheduleRead
+from app.schemas.score import ScoreRead
+from app.services.schedule_rule_service import schedule_rule_service
+
+SCHEDULE_SECTIONS = frozenset({"attendance", "scores", "stats"})
+
+
+def parse_include(raw: str | None) -> frozenset[str]:
+    if raw is None:
+        return SCHEDULE_SECTIONS
+    sections = frozenset(part.strip() for part in raw.split(",") if part.strip())
+    unknown = sections - SCHEDULE_SECTIONS
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown include section(s): {', '.join(sorted(unknown))}")
+    return sections
+
+
+@traced
+class ScheduleDetailService:
+    async def get_schedule_full(
+        self, db: AsyncSession, *, schedule_id: UUID, include: frozenset[str]
+    ) -> tuple[dict[str, object], set[UUID]]:
+        # At most three queries: the schedule SELECT doubles as the existence check and stats
+        # are derived from the score rows. Member ids are returned so cached copies can be tagged.
+        result = await db.execute(select(*schema_columns(Schedule, ScheduleRead), Schedule.season).where(Schedule.id == schedule_id))
+        schedules = rows_as_dicts(result)
+        if not schedules:
+            return await self._virtual_schedule_full(db, schedule_id=schedule_id, include=include), set()
+
+        # The season picks the one attendance and score partition to read; it is not part of the response.
+        season = schedules[0].pop("season")
+        data: dict[str, object] = {"schedule": schedules[0]}
+        member_ids: set[UUID] = set()
+
+        if "attendance" in include:
+            stmt = (
+                select(*schema_columns(Attendance, AttendanceRead), User.name.label("user_name"))
+                .join(User, User.id == Attendance.user_id)
+                .where(Attendance.schedule_id == schedule_id, Attendance.season == season)
+                .order_by(Attendance.updated_at.desc())
+            )
+            attendance = rows_as_dicts(await db.execute(stmt))
+            member_ids.update(row["user_id"] for row in attendance)
+            data["attendance"] = attendance
+
+        if "scores" in include or "stats" in include:
+            stmt = (
+                select(*schema_columns(Score, ScoreRead), User.name.label("user_name"))
+                .join(User, User.id == Score.user_id)
+                .where(Score.schedule_id == schedule_id, Score.season == season)
+                .order_by(Score.user_id.asc(), Score.game_no.asc())
+            )
+            scores = rows_as_dicts(await db.execute(stmt))
+            if "scores" in include:
+                data["scores"] = self._group_by_member(scores)
+                member_ids.update(row["user_id"] for row in scores)
+            if "stats" in include:
+                data["stats"] = self._stats([row["score"] for row in scores])
+
+        return data, member_ids
+
+    async def _virtual_schedule_full(self, db: AsyncSession, *, schedule_id: UUID, include: frozenset[str]) -> dict[str, object]:
+        # An occurrence of a recurring rule that nothing has been attached to yet.
+        schedule = await schedule_rule_service.virtual_schedule(db, schedule_id=schedule_id)
+        if schedule is None:
+            raise HTTPException(status_code=404, detail="Schedule not found")
+        data: dict[str, object] = {"schedule": {name: getattr(schedule, name) for name in ScheduleRead.model_fields}}
+        if "attendance" in include:
+            data["attendance"] = []
+        if "scores" in include:
+            data["scores"] = []
+        if "stats" in include:
+            data["stats"] = self._stats([])
+        return data
+
+    @staticmethod
+    def _group_by_member(scores: list[dict[str, object]]) -> list[dict[str, object]]:
+        members: dict[object, dict[str, object]] = {}
+        for row in scores:
+            user_name = row.pop("user_name")
+            member = members.setdefault(row["user_id"], {"user_id": row["user_id"], "user_name": user_name, "games": []})
+            member["games"].append(row)  # type: ignore[attr-defined]
+        for member in members.values():
+            values = [game["score"] for game in member["games"]]  # type: ignore[attr-defined]
+            member["average"] = sum(values) / len(values)
+            member["highest"] = max(values)
+        return list(members.values())
+
+    @staticmethod
+    def _stats(values: list[int]) -> dict[str, float | int | None]:
+        if not values:
+            return {"average": None, "min": None, "max": None, "count": 0}
+        return {"average": sum(values) / len(values), "min": min(values), "max": max(values), "count": len(values)}
+
+
+schedule_detail_service = ScheduleDetailService()
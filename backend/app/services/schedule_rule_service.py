@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import calendar
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import SCHEDULES_TAG, response_cache
+from app.core.config import get_settings
+from app.core.invalidation import publish_invalidation
+from app.core.tracing import traced
+from app.db.partitions import season_of, season_partitions
+from app.models.schedule import Schedule
+from app.models.schedule_rule import RecurrenceFrequency, ScheduleRule
+from app.schemas.schedule_rule import ScheduleRuleCreate, ScheduleRuleUpdate
+
+# Occurrence ids are RFC 9562 version-8 UUIDs: a fixed 64-bit prefix (with the version nibble),
+# then the variant bits, a 30-bit rule number and a 32-bit occurrence index. They decode without
+# a lookup, and a materialized occurrence keeps the id clients already saw.
+_OCCURRENCE_PREFIX = 0x5343_4845_4455_8000
+_VARIANT = 0b10 << 62
+_NUMBER_MASK = (1 << 30) - 1
+_INDEX_MASK = (1 << 32) - 1
+
+
+def occurrence_id(rule_number: int, index: int) -> UUID:
+    return UUID(int=(_OCCURRENCE_PREFIX << 64) | _VARIANT | ((rule_number & _NUMBER_MASK) << 32) | (index & _INDEX_MASK))
+
+
+def parse_occurrence_id(value: UUID) -> tuple[int, int] | None:
+    """(rule number, occurrence index) for ids made by occurrence_id, else None."""
+    if value.int >> 64 != _OCCURRENCE_PREFIX or (value.int >> 62) & 0b11 != 0b10:
+        return None
+    low = value.int & ((1 << 62) - 1)
+    return low >> 32, low & _INDEX_MASK
+
+
+def occurrence_start(rule: ScheduleRule, index: int) -> datetime | None:
+    """Start of the ``index``-th occurrence in UTC, or None when that month has no such day."""
+    tz = ZoneInfo(rule.timezone)
+    first = rule.starts_at.astimezone(tz).replace(tzinfo=None)
+    if rule.frequency is RecurrenceFrequency.WEEKLY:
+        local = first + timedelta(weeks=rule.interval * index)
+    else:
+        year, month = divmod(first.month - 1 + rule.interval * index, 12)
+        year, month = first.year + year, month + 1
+        if first.day > calendar.monthrange(year, month)[1]:
+            return None
+        local = first.replace(year=year, month=month)
+    # Wall-clock arithmetic keeps the local time fixed across DST changes.
+    return local.replace(tzinfo=tz).astimezone(timezone.utc)
+
+
+def _index_bounds(rule: ScheduleRule, start: datetime, end: datetime) -> tuple[int, int]:
+    """Occurrence index range covering [start, end], one step wider on each side for DST shifts."""
+    if rule.frequency is RecurrenceFrequency.WEEKLY:
+        period = timedelta(weeks=rule.interval)
+        low = (start - rule.starts_at) // period
+        high = (end - rule.starts_at) // period
+    else:
+        first = rule.starts_at.astimezone(ZoneInfo(rule.timezone))
+        low = ((start.year - first.year) * 12 + start.month - first.month) // rule.interval
+        high = ((end.year - first.year) * 12 + end.month - first.month) // rule.interval
+    return max(low - 1, 0), min(high + 1, _INDEX_MASK)
+
+
+def expand(rule: ScheduleRule, start: datetime, end: datetime, *, descending: bool = False) -> Iterator[tuple[int, datetime]]:
+    """(index, start) of the rule's occurrences within [start, end], skipping exdates."""
+    if rule.until is not None:
+        end = min(end, rule.until)
+    start = max(start, rule.starts_at)
+    if start > end:
+        return
+    low, high = _index_bounds(rule, start, end)
+    skipped = set(rule.exdates)
+    indexes = range(high, low - 1, -1) if descending else range(low, high + 1)
+    for index in indexes:
+        occurs_at = occurrence_start(rule, index)
+        if occurs_at is not None and start <= occurs_at <= end and occurs_at not in skipped:
+            yield index, occurs_at
+
+
+def list_day() -> datetime:
+    """UTC midnight today: lists without ``starts_to`` show each rule up to its first occurrence from then on.
+
+    It moves once a day, so list validators can cover it with the date alone.
+    """
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def horizon_end() -> datetime:
+    """How far a list without ``starts_to`` looks for a rule's next occurrence: SCHEDULE_RULE_HORIZON_DAYS after today."""
+    return list_day() + timedelta(days=get_settings().schedule_rule_horizon_days)
+
+
+def occurrence_row(rule: ScheduleRule, index: int, starts_at: datetime) -> dict[str, object]:
+    return {
+        "id": occurrence_id(rule.number, index),
+        "title": rule.title,
+        "starts_at": starts_at,
+        "location": rule.location,
+        "notes": rule.notes,
+        "created_by": rule.created_by,
+        "is_cancelled": False,
+        "rule_id": rule.id,
+        "created_at": rule.created_at,
+        "updated_at": rule.updated_at,
+    }
+
+
+@traced
+class ScheduleRuleService:
+    async def list_rules(self, db: AsyncSession) -> list[ScheduleRule]:
+        result = await db.execute(select(ScheduleRule).order_by(ScheduleRule.starts_at.desc()))
+        return list(result.scalars().all())
+
+    async def get_rule(self, db: AsyncSession, *, rule_id: UUID) -> ScheduleRule:
+        rule = await db.get(ScheduleRule, rule_id)
+        if rule is None:
+            raise HTTPException(status_code=404, detail="Schedule rule not found")
+        return rule
+
+    async def create_rule(self, db: AsyncSession, *, payload: ScheduleRuleCreate, created_by: UUID) -> ScheduleRule:
+        rule = ScheduleRule(**payload.model_dump(), created_by=created_by)
+        db.add(rule)
+        await publish_invalidation(db, SCHEDULES_TAG)
+        await db.commit()
+        await response_cache.invalidate(SCHEDULES_TAG)
+        await db.refresh(rule)
+        return rule
+
+    async def update_rule(self, db: AsyncSession, *, rule_id: UUID, payload: ScheduleRuleUpdate) -> ScheduleRule:
+        # Materialized occurrences keep their own copy; only virtual ones follow the rule.
+        rule = await self.get_rule(db, rule_id=rule_id)
+        for k, v in payload.model_dump(exclude_unset=True).items():
+            setattr(rule, k, v)
+        await publish_invalidation(db, SCHEDULES_TAG)
+        await db.commit()
+        await response_cache.invalidate(SCHEDULES_TAG)
+        await db.refresh(rule)
+        return rule
+
+    async def occurrence_rows(
+        self,
+        db: AsyncSession,
+        *,
+        starts_from: datetime | None = None,
+        starts_to: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        """Virtual occurrences in the range, newest first, as ScheduleRead rows.
+
+        Without ``starts_to`` each rule ends at its next occurrence, the first on or after today (or
+        ``starts_from`` if later), so a newest-first list opens with the coming sessions rather than
+        ones a year out. Occurrences that already have a ``schedules`` row are left out: that row is
+        listed instead.
+        """
+        end = starts_to or horizon_end()
+        upcoming_from = None if starts_to is not None else max(list_day(), starts_from or list_day())
+        conditions = [ScheduleRule.starts_at <= end]
+        if starts_from is not None:
+            conditions.append((ScheduleRule.until.is_(None)) | (ScheduleRule.until >= starts_from))
+        rules = list((await db.execute(select(ScheduleRule).where(*conditions))).scalars().all())
+        if not rules:
+            return []
+
+        candidates: list[tuple[ScheduleRule, int, datetime]] = []
+        for rule in rules:
+            rule_end = end
+            if upcoming_from is not None:
+                upcoming = next(expand(rule, upcoming_from, end), None)
+                if upcoming is not None:
+                    rule_end = upcoming[1]
+            occurrences = expand(rule, starts_from or rule.starts_at, rule_end, descending=True)
+            for count, (index, occurs_at) in enumerate(occurrences):
+                if limit is not None and count >= limit:
+                    break
+                candidates.append((rule, index, occurs_at))
+        materialized = await self._materialized(db, ((rule.id, index) for rule, index, _ in candidates))
+
+        rows = [
+            occurrence_row(rule, index, occurs_at)
+            for rule, index, occurs_at in candidates
+            if (rule.id, index) not in materialized
+        ]
+        rows.sort(key=lambda row: row["starts_at"], reverse=True)  # type: ignore[arg-type, return-value]
+        return rows[:limit] if limit is not None else rows
+
+    async def _materialized(self, db: AsyncSession, keys: Iterable[tuple[UUID, int]]) -> set[tuple[UUID, int]]:
+        keys = list(keys)
+        if not keys:
+            return set()
+        stmt = select(Schedule.rule_id, Schedule.occurrence_index).where(
+            tuple_(Schedule.rule_id, Schedule.occurrence_index).in_(keys)
+        )
+        return {(row.rule_id, row.occurrence_index) for row in await db.execute(stmt)}
+
+    async def _resolve(self, db: AsyncSession, schedule_id: UUID) -> tuple[ScheduleRule, int, datetime] | None:
+        parsed = parse_occurrence_id(schedule_id)
+        if parsed is None:
+            return None
+        number, index = parsed
+        rule = await db.scalar(select(ScheduleRule).where(ScheduleRule.number == number))
+        if rule is None:
+            return None
+        occurs_at = occurrence_start(rule, index)
+        if occurs_at is None or occurs_at in rule.exdates or (rule.until is not None and occurs_at > rule.until):
+            return None
+        return rule, index, occurs_at
+
+    async def virtual_schedule(self, db: AsyncSession, *, schedule_id: UUID) -> Schedule | None:
+        """A transient Schedule for a not yet materialized occurrence id, else None."""
+        resolved = await self._resolve(db, schedule_id)
+        if resolved is None:
+            return None
+        return Schedule(**occurrence_row(*resolved), occurrence_index=resolved[1])
+
+    async def materialize(self, db: AsyncSession, *, schedule_id: UUID) -> int | None:
+        """Insert the ``schedules`` row for an occurrence id, in the caller's transaction, and return its season.
+
+        Returns None when the id is not a valid occurrence. Concurrent callers are safe: the id is
+        deterministic, so the second insert is a no-op.
+        """
+        resolved = await self._resolve(db, schedule_id)
+        if resolved is None:
+            return None
+        rule, index, occurs_at = resolved
+        season = season_of(occurs_at)
+        await season_partitions.ensure(season)
+        await db.execute(
+            insert(Schedule)
+            .values(
+                id=schedule_id,
+                title=rule.title,
+                starts_at=occurs_at,
+                location=rule.location,
+                notes=rule.notes,
+                created_by=rule.created_by,
+                is_cancelled=False,
+                rule_id=rule.id,
+                occurrence_index=index,
+            )
+            .on_conflict_do_nothing(index_elements=[Schedule.id])
+        )
+        return season
+
+
+schedule_rule_service = ScheduleRuleService()
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
+from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import Float, and_, func, select, true
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import ScalarSelect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import SCHEDULES_TAG, response_cache, schedule_tag
+from app.core.config import get_settings
+from app.core.invalidation import publish_invalidation
+from app.core.serialization import rows_as_dicts, schema_columns
+from app.core.tracing import traced
+from app.db.partitions import season_of, season_partitions
+from app.models.attendance import Attendance, AttendanceStatus
 from app.models.schedule import Schedule
-from app.schemas.schedule import ScheduleCreate, ScheduleUpdate
+from app.models.schedule_rule import ScheduleRule
+from app.models.score import Score
+from app.schemas.schedule import ScheduleCreate, ScheduleRead, ScheduleUpdate
+from app.services.schedule_rule_service import list_day, schedule_rule_service
 
 
+def month_bounds(month: str) -> tuple[datetime, datetime]:
+    """[start, end) of a ``YYYY-MM`` month at midnight in CLUB_TIMEZONE."""
+    year, number = (int(part) for part in month.split("-"))
+    tz = ZoneInfo(get_settings().club_timezone)
+    start = datetime(year, number, 1, tzinfo=tz)
+    end = datetime(year + number // 12, number % 12 + 1, 1, tzinfo=tz)
+    return start, end
+
+
+def schedule_season(schedule_id: UUID) -> ScalarSelect[int]:
+    """The schedule's season as a scalar subquery.
+
+    Comparing a child table's ``season`` with it lets Postgres prune attendance and score partitions at
+    execution time, so a per-schedule query probes one partition's index instead of every season's.
+    """
+    return select(Schedule.season).where(Schedule.id == schedule_id).scalar_subquery()
+
+
+@traced
 class ScheduleService:
     async def list_schedules(
         self,
@@ -20,22 +52,105 @@ class ScheduleService:
         size: int = 20,
         starts_from: datetime | None = None,
         starts_to: datetime | None = None,
-    ) -> tuple[list[Schedule], int]:
-        stmt = select(Schedule)
-        count_stmt = select(func.count()).select_from(Schedule)
+    ) -> list[Schedule]:
+        stmt = (
+            select(Schedule)
+            .where(*self._range_conditions(starts_from, starts_to))
+            .order_by(Schedule.starts_at.desc())
+            .limit(page * size)
+        )
+        result = await db.execute(stmt)
+        occurrences = await schedule_rule_service.occurrence_rows(
+            db, starts_from=starts_from, starts_to=starts_to, limit=page * size
+        )
+        items = [*result.scalars().all(), *(Schedule(**row) for row in occurrences)]
+        items.sort(key=lambda schedule: schedule.starts_at, reverse=True)
+        return items[(page - 1) * size : page * size]
 
-        if starts_from is not None:
-            stmt = stmt.where(Schedule.starts_at >= starts_from)
-            count_stmt = count_stmt.where(Schedule.starts_at >= starts_from)
-        if starts_to is not None:
-            stmt = stmt.where(Schedule.starts_at <= starts_to)
-            count_stmt = count_stmt.where(Schedule.starts_at <= starts_to)
+    async def list_schedule_rows(
+        self,
+        db: AsyncSession,
+        *,
+        page: int = 1,
+        size: int = 20,
+        starts_from: datetime | None = None,
+        starts_to: datetime | None = None,
+    ) -> list[dict[str, object]]:
+        # Stored rows and virtual rule occurrences are merged, so each side supplies its first
+        # page * size rows and the page is cut after sorting.
+        stmt = (
+            select(*schema_columns(Schedule, ScheduleRead))
+            .where(*self._range_conditions(starts_from, starts_to))
+            .order_by(Schedule.starts_at.desc())
+            .limit(page * size)
+        )
+        rows = rows_as_dicts(await db.execute(stmt))
+        rows += await schedule_rule_service.occurrence_rows(db, starts_from=starts_from, starts_to=starts_to, limit=page * size)
+        rows.sort(key=lambda row: row["starts_at"], reverse=True)  # type: ignore[arg-type, return-value]
+        return rows[(page - 1) * size : page * size]
+
+    async def list_month_rows(self, db: AsyncSession, *, starts_from: datetime, starts_to: datetime) -> list[dict[str, object]]:
+        """Schedules in [starts_from, starts_to) with attendance counts and score stats, oldest first.
+
+        Each LATERAL subquery aggregates one schedule's rows through the unique index that leads with
+        ``schedule_id``, so the counts come back in the same statement without joining attendance and
+        scores to each other. Virtual rule occurrences have nothing attached and are added with zeros.
+        """
+        attendance = (
+            select(
+                func.count().filter(Attendance.status == AttendanceStatus.ATTEND).label("attend_count"),
+                func.count().filter(Attendance.status == AttendanceStatus.ABSENT).label("absent_count"),
+                func.count().filter(Attendance.status == AttendanceStatus.UNKNOWN).label("unknown_count"),
+            )
+            .where(Attendance.schedule_id == Schedule.id, Attendance.season == Schedule.season)
+            .lateral("attendance_counts")
+        )
+        scores = (
+            select(func.avg(Score.score).cast(Float).label("score_average"), func.count().label("score_count"))
+            .where(Score.schedule_id == Schedule.id, Score.season == Schedule.season)
+            .lateral("score_stats")
+        )
+        stmt = (
+            select(*schema_columns(Schedule, ScheduleRead), *attendance.c, *scores.c)
+            .select_from(Schedule)
+            .join(attendance, true())
+            .join(scores, true())
+            .where(Schedule.starts_at >= starts_from, Schedule.starts_at < starts_to)
+            .order_by(Schedule.starts_at.asc())
+        )
+        rows = rows_as_dicts(await db.execute(stmt))
 
-        total = await db.scalar(count_stmt)
-        result = await db.execute(stmt.order_by(Schedule.starts_at.desc()).offset((page - 1) * size).limit(size))
-        return list(result.scalars().all()), int(total or 0)
+        # occurrence_rows takes an inclusive end.
+        occurrences = await schedule_rule_service.occurrence_rows(
+            db, starts_from=starts_from, starts_to=starts_to - timedelta(microseconds=1)
+        )
+        empty = {"attend_count": 0, "absent_count": 0, "unknown_count": 0, "score_average": None, "score_count": 0}
+        rows += [{**row, **empty} for row in occurrences]
+        rows.sort(key=lambda row: row["starts_at"])  # type: ignore[arg-type, return-value]
+        return rows
+
+    async def get_list_version(
+        self,
+        db: AsyncSession,
+        *,
+        starts_from: datetime | None = None,
+        starts_to: datetime | None = None,
+    ) -> tuple[int, datetime | None]:
+        conditions = self._range_conditions(starts_from, starts_to)
+
+        # max(updated_at) spans the whole table so rows moving out of the range still bump it.
+        # Rule edits change virtual occurrences, so the newest rule update counts as well.
+        count = func.count().filter(and_(*conditions)) if conditions else func.count()
+        rules_updated = select(func.max(ScheduleRule.updated_at)).scalar_subquery()
+        row = (await db.execute(select(count, func.max(Schedule.updated_at), rules_updated).select_from(Schedule))).one()
+        updated = [value for value in row[1:] if value is not None]
+        if starts_to is None and updated:
+            # Open-ended lists move on to each rule's following occurrence at midnight.
+            updated.append(list_day())
+        return int(row[0] or 0), max(updated, default=None)
 
     async def create_schedule(self, db: AsyncSession, *, payload: ScheduleCreate, created_by: UUID) -> Schedule:
+        await season_partitions.ensure(season_of(payload.starts_at))
         schedule = Schedule(
             title=payload.title,
             starts_at=payload.starts_at,
@@ -45,32 +160,83 @@ class ScheduleService:
             is_cancelled=False,
         )
         db.add(schedule)
+        await publish_invalidation(db, SCHEDULES_TAG)
         await db.commit()
+        await response_cache.invalidate(SCHEDULES_TAG)
         await db.refresh(schedule)
         return schedule
 
     async def get_schedule(self, db: AsyncSession, *, schedule_id: UUID) -> Schedule:
+        """A stored schedule, or a transient one for an occurrence of a recurring rule."""
         result = await db.execute(select(Schedule).where(Schedule.id == schedule_id))
         schedule = result.scalar_one_or_none()
+        if schedule is None:
+            schedule = await schedule_rule_service.virtual_schedule(db, schedule_id=schedule_id)
+        if schedule is None:
+            raise HTTPException(status_code=404, detail="Schedule not found")
+        return schedule
+
+    async def schedule_exists(self, db: AsyncSession, *, schedule_id: UUID) -> bool:
+        if await db.scalar(select(func.count()).select_from(Schedule).where(Schedule.id == schedule_id)):
+            return True
+        return await schedule_rule_service.virtual_schedule(db, schedule_id=schedule_id) is not None
+
+    async def ensure_stored(self, db: AsyncSession, *, schedule_id: UUID) -> int:
+        """Make sure a ``schedules`` row exists before something is attached to it, and return its season.
+
+        Occurrences of recurring rules are materialized here, inside the caller's transaction. That may
+        create the season's partitions on another connection, which waits for every transaction that has
+        read attendance or scores, so call this before the caller's transaction touches either table.
+        """
+        season = await db.scalar(select(Schedule.season).where(Schedule.id == schedule_id))
+        if season is None:
+            season = await schedule_rule_service.materialize(db, schedule_id=schedule_id)
+        if season is None:
+            raise HTTPException(status_code=404, detail="Schedule not found")
+        return season
+
+    async def get_stored_schedule(self, db: AsyncSession, *, schedule_id: UUID) -> Schedule:
+        stmt = select(Schedule).where(Schedule.id == schedule_id)
+        schedule = (await db.execute(stmt)).scalar_one_or_none()
+        if schedule is None and await schedule_rule_service.materialize(db, schedule_id=schedule_id) is not None:
+            schedule = (await db.execute(stmt)).scalar_one()
         if schedule is None:
             raise HTTPException(status_code=404, detail="Schedule not found")
         return schedule
 
     async def update_schedule(self, db: AsyncSession, *, schedule_id: UUID, payload: ScheduleUpdate) -> Schedule:
-        schedule = await self.get_schedule(db, schedule_id=schedule_id)
+        if payload.starts_at is not None:
+            # A new year moves the schedule's attendance and scores (ON UPDATE CASCADE), so the target
+            # partitions must exist before anything in this transaction touches those tables.
+            await season_partitions.ensure(season_of(payload.starts_at))
+        # Editing one occurrence of a rule stores it as an override.
+        schedule = await self.get_stored_schedule(db, schedule_id=schedule_id)
         data = payload.model_dump(exclude_unset=True)
         for k, v in data.items():
             setattr(schedule, k, v)
+        await publish_invalidation(db, SCHEDULES_TAG, schedule_tag(schedule_id))
         await db.commit()
+        await response_cache.invalidate(SCHEDULES_TAG, schedule_tag(schedule_id))
         await db.refresh(schedule)
         return schedule
 
     async def cancel_schedule(self, db: AsyncSession, *, schedule_id: UUID) -> Schedule:
-        schedule = await self.get_schedule(db, schedule_id=schedule_id)
+        schedule = await self.get_stored_schedule(db, schedule_id=schedule_id)
         schedule.is_cancelled = True
+        await publish_invalidation(db, SCHEDULES_TAG, schedule_tag(schedule_id))
         await db.commit()
+        await response_cache.invalidate(SCHEDULES_TAG, schedule_tag(schedule_id))
         await db.refresh(schedule)
         return schedule
 
+    @staticmethod
+    def _range_conditions(starts_from: datetime | None, starts_to: datetime | None) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        if starts_from is not None:
+            conditions.append(Schedule.starts_at >= starts_from)
+        if starts_to is not None:
+            conditions.append(Schedule.starts_at <= starts_to)
+        return conditions
+
 
 schedule_service = ScheduleService()
@@ -1,37 +1,70 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import response_cache, schedule_tag, user_tag
+from app.core.events import schedule_events
+from app.core.invalidation import publish_event, publish_invalidation
+from app.core.serialization import rows_as_dicts, schema_columns
+from app.core.tracing import traced
 from app.models.schedule import Schedule
 from app.models.score import Score
-from app.schemas.score import ScoreCreate, ScoreUpdate
+from app.schemas.score import ScoreCreate, ScoreRead, ScoreUpdate
+from app.services.schedule_service import schedule_season, schedule_service
 
 
+@traced
 class ScoreService:
     async def list_schedule_scores(self, db: AsyncSession, *, schedule_id: UUID) -> list[Score]:
-        await self._ensure_schedule_exists(db, schedule_id=schedule_id)
         result = await db.execute(
-            select(Score).where(Score.schedule_id == schedule_id).order_by(Score.user_id.asc(), Score.game_no.asc())
+            select(Score)
+            .where(Score.schedule_id == schedule_id, Score.season == schedule_season(schedule_id))
+            .order_by(Score.user_id.asc(), Score.game_no.asc())
         )
-        return list(result.scalars().all())
+        items = list(result.scalars().all())
+        # Rows imply the schedule exists; only an empty result needs the extra lookup.
+        if not items:
+            await self.ensure_schedule_exists(db, schedule_id=schedule_id)
+        return items
+
+    async def list_schedule_score_rows(self, db: AsyncSession, *, schedule_id: UUID) -> list[dict[str, object]]:
+        stmt = (
+            select(*schema_columns(Score, ScoreRead))
+            .where(Score.schedule_id == schedule_id, Score.season == schedule_season(schedule_id))
+            .order_by(Score.user_id.asc(), Score.game_no.asc())
+        )
+        rows = rows_as_dicts(await db.execute(stmt))
+        if not rows:
+            await self.ensure_schedule_exists(db, schedule_id=schedule_id)
+        return rows
+
+    async def get_schedule_scores_version(self, db: AsyncSession, *, schedule_id: UUID) -> tuple[int, datetime | None]:
+        stmt = select(func.count(), func.max(Score.updated_at)).where(
+            Score.schedule_id == schedule_id, Score.season == schedule_season(schedule_id)
+        )
+        row = (await db.execute(stmt)).one()
+        return int(row[0] or 0), row[1]
 
     async def create_my_score(self, db: AsyncSession, *, schedule_id: UUID, user_id: UUID, payload: ScoreCreate) -> Score:
         if payload.schedule_id != schedule_id:
             raise HTTPException(status_code=400, detail="schedule_id mismatch")
 
-        await self._ensure_schedule_exists(db, schedule_id=schedule_id)
+        season = await schedule_service.ensure_stored(db, schedule_id=schedule_id)
 
         # Check if a score already exists with the same user_id, schedule_id, and game_no
         result = await db.execute(
             select(Score).where(
                 Score.schedule_id == schedule_id,
                 Score.user_id == user_id,
-                Score.game_no == payload.game_no
+                Score.game_no == payload.game_no,
+                Score.season == season,
             )
         )
         existing_score = result.scalar_one_or_none()
@@ -42,16 +75,22 @@ class ScoreService:
             score = existing_score
         else:
             # Create new score
-            score = Score(schedule_id=schedule_id, user_id=user_id, game_no=payload.game_no, score=payload.score)
+            score = Score(schedule_id=schedule_id, season=season, user_id=user_id, game_no=payload.game_no, score=payload.score)
             db.add(score)
 
         try:
+            # Assigns the new score's id, which the event carries.
+            await db.flush()
+            await publish_invalidation(db, schedule_tag(schedule_id), user_tag(user_id))
+            await publish_event(db, *self._score_event(score))
             await db.commit()
         except IntegrityError:
             await db.rollback()
             raise HTTPException(status_code=409, detail="Score conflict")
 
+        await response_cache.invalidate(schedule_tag(schedule_id), user_tag(user_id))
         await db.refresh(score)
+        schedule_events.publish(*self._score_event(score))
         return score
 
     async def update_score(self, db: AsyncSession, *, score_id: UUID, actor_user_id: UUID, is_admin: bool, payload: ScoreUpdate) -> Score:
@@ -64,12 +103,16 @@ class ScoreService:
             setattr(score, k, v)
 
         try:
+            await publish_invalidation(db, schedule_tag(score.schedule_id), user_tag(score.user_id))
+            await publish_event(db, *self._score_event(score))
             await db.commit()
         except IntegrityError:
             await db.rollback()
             raise HTTPException(status_code=409, detail="Score conflict")
 
+        await response_cache.invalidate(schedule_tag(score.schedule_id), user_tag(score.user_id))
         await db.refresh(score)
+        schedule_events.publish(*self._score_event(score))
         return score
 
     async def delete_score(self, db: AsyncSession, *, score_id: UUID, actor_user_id: UUID, is_admin: bool) -> None:
@@ -77,8 +120,13 @@ class ScoreService:
         if not is_admin and score.user_id != actor_user_id:
             raise HTTPException(status_code=403, detail="Not permitted")
 
+        event = (score.schedule_id, "score_deleted", {"id": score.id, "user_id": score.user_id, "game_no": score.game_no})
         await db.delete(score)
+        await publish_invalidation(db, schedule_tag(score.schedule_id), user_tag(score.user_id))
+        await publish_event(db, *event)
         await db.commit()
+        await response_cache.invalidate(schedule_tag(score.schedule_id), user_tag(score.user_id))
+        schedule_events.publish(*event)
 
     async def get_score(self, db: AsyncSession, *, score_id: UUID) -> Score:
         result = await db.execute(select(Score).where(Score.id == score_id))
@@ -88,15 +136,15 @@ class ScoreService:
         return score
 
     async def get_schedule_stats(self, db: AsyncSession, *, schedule_id: UUID) -> dict[str, float | int | None]:
-        await self._ensure_schedule_exists(db, schedule_id=schedule_id)
-
         stmt = (
             select(func.avg(Score.score), func.min(Score.score), func.max(Score.score), func.count())
-            .where(Score.schedule_id == schedule_id)
+            .where(Score.schedule_id == schedule_id, Score.season == schedule_season(schedule_id))
             .select_from(Score)
         )
         row = (await db.execute(stmt)).one()
         avg_score, min_score, max_score, count = row
+        if not count:
+            await self.ensure_schedule_exists(db, schedule_id=schedule_id)
 
         return {
             "average": float(avg_score) if avg_score is not None else None,
@@ -121,7 +169,7 @@ class ScoreService:
                 func.min(Schedule.starts_at).label("starts_at"),
                 func.min(Schedule.title).label("title")
             )
-            .join(Schedule, Schedule.id == Score.schedule_id)
+            .join(Schedule, and_(Schedule.id == Score.schedule_id, Schedule.season == Score.season))
             .where(Score.user_id == user_id)
             .group_by(Score.schedule_id)
             .order_by(func.min(Schedule.starts_at).desc())
@@ -142,10 +190,17 @@ class ScoreService:
             )
         return items
 
-    async def _ensure_schedule_exists(self, db: AsyncSession, *, schedule_id: UUID) -> None:
-        exists = await db.scalar(select(func.count()).select_from(Schedule).where(Schedule.id == schedule_id))
-        if not exists:
+    async def ensure_schedule_exists(self, db: AsyncSession, *, schedule_id: UUID) -> None:
+        if not await schedule_service.schedule_exists(db, schedule_id=schedule_id):
             raise HTTPException(status_code=404, detail="Schedule not found")
 
+    @staticmethod
+    def _score_event(score: Score) -> tuple[UUID, str, dict[str, Any]]:
+        return (
+            score.schedule_id,
+            "score",
+            {"id": score.id, "user_id": score.user_id, "game_no": score.game_no, "score": score.score},
+        )
+
 
 score_service = ScoreService()
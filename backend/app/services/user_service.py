@@ -1,27 +1,139 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Mapping, Sequence
+from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from pydantic import ValidationError
+from sqlalchemy import case, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
-from app.models.user import User
-from app.schemas.user import ProfileUpdate, UserCreate, UserUpdate
+from app.core.cache import response_cache, user_tag
+from app.core.invalidation import publish_invalidation
+from app.core.security import password_hasher
+from app.core.serialization import get_adapter, rows_as_dicts, schema_columns
+from app.core.tracing import traced
+from app.models.user import MemberType, User, UserRole
+from app.schemas.user import ProfileUpdate, UserCreate, UserImportError, UserRead, UserUpdate
 
+# Match the expressions of ix_users_name_key / ix_users_email_key so prefix matches and the keyset order
+# use them. "C" compares code points, which also keeps Hangul names in dictionary order.
+NAME_KEY = func.lower(User.name).collate("C")
+EMAIL_KEY = User.email.collate("C")
+SUBSTRING_MIN_LENGTH = 3  # shorter terms have no trigram to look up, so they only match as prefixes
+# Search cursors: (match rank, lowered name, id) when searching, else (lowered name, id).
+_RANKED_CURSOR = get_adapter(tuple[int, str, UUID])
+_NAME_CURSOR = get_adapter(tuple[str, UUID])
 
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _import_error(row: int, email: object, detail: str) -> dict[str, Any]:
+    return UserImportError(row=row, email=None if email is None else str(email), detail=detail).model_dump()
+
+
+def _describe(error: Mapping[str, Any]) -> str:
+    field = ".".join(str(part) for part in error["loc"])
+    return f"{field}: {error['msg']}" if field else str(error["msg"])
+
+
+def _encode_cursor(values: Sequence[object]) -> str:
+    raw = json.dumps([str(value) if isinstance(value, UUID) else value for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, *, ranked: bool) -> tuple[object, ...]:
+    """The keyset values of the last row of the previous page, checked against the current sort key."""
+    adapter = _RANKED_CURSOR if ranked else _NAME_CURSOR
+    try:
+        return adapter.validate_json(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)), strict=True)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@traced
 class UserService:
     async def list_users(self, db: AsyncSession, *, page: int = 1, size: int = 20) -> tuple[list[User], int]:
         total = await db.scalar(select(func.count()).select_from(User))
         result = await db.execute(select(User).order_by(User.created_at.desc()).offset((page - 1) * size).limit(size))
         return list(result.scalars().all()), int(total or 0)
 
+    async def list_user_rows(self, db: AsyncSession, *, page: int = 1, size: int = 20) -> list[dict[str, object]]:
+        stmt = select(*schema_columns(User, UserRead)).order_by(User.created_at.desc()).offset((page - 1) * size).limit(size)
+        return rows_as_dicts(await db.execute(stmt))
+
+    async def search_user_rows(
+        self,
+        db: AsyncSession,
+        *,
+        q: str | None = None,
+        role: UserRole | None = None,
+        member_type: MemberType | None = None,
+        is_active: bool | None = None,
+        cursor: str | None = None,
+        size: int = 20,
+    ) -> tuple[list[dict[str, object]], str | None]:
+        """One page of members matching ``q`` and the filters, plus the cursor of the next page.
+
+        ``q`` matches the start of the name or email (autocomplete) and, from three characters on, any
+        part of either. Name prefix hits come first, then email prefix hits, then the rest; each group is
+        ordered by name. Pages are cut by keyset rather than OFFSET, so deep pages cost the same as the first.
+        """
+        conditions: list[ColumnElement[bool]] = []
+        if role is not None:
+            conditions.append(User.role == role)
+        if member_type is not None:
+            conditions.append(User.member_type == member_type)
+        if is_active is not None:
+            conditions.append(User.is_active.is_(is_active))
+
+        keys: list[ColumnElement[object]] = [NAME_KEY, User.id]
+        term = " ".join((q or "").lower().split())
+        if term:
+            prefix = _like_escape(term) + "%"
+            name_prefix = NAME_KEY.like(prefix, escape="\\")
+            email_prefix = EMAIL_KEY.like(prefix, escape="\\")
+            matches = [name_prefix, email_prefix]
+            if len(term) >= SUBSTRING_MIN_LENGTH:
+                # Served by the trigram indexes.
+                matches += [func.lower(User.name).like("%" + prefix, escape="\\"), User.email.like("%" + prefix, escape="\\")]
+            conditions.append(or_(*matches))
+            keys.insert(0, case((name_prefix, 0), (email_prefix, 1), else_=2))
+        if cursor is not None:
+            conditions.append(tuple_(*keys) > _decode_cursor(cursor, ranked=bool(term)))
+
+        # The sort key is selected alongside so the cursor carries exactly what the database compared.
+        key_names = [f"sort_{i}" for i in range(len(keys) - 1)]
+        stmt = (
+            select(*schema_columns(User, UserRead), *(key.label(name) for key, name in zip(keys, key_names)))
+            .where(*conditions)
+            .order_by(*keys)
+            .limit(size + 1)
+        )
+        rows = rows_as_dicts(await db.execute(stmt))
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_cursor = _encode_cursor([*(rows[-1][name] for name in key_names), rows[-1]["id"]])
+        for row in rows:
+            for name in key_names:
+                del row[name]
+        return rows, next_cursor
+
     async def create_user(self, db: AsyncSession, *, payload: UserCreate) -> User:
         user = User(
             email=str(payload.email).lower(),
-            password_hash=get_password_hash(payload.password),
+            password_hash=await password_hasher.hash(payload.password),
             name=payload.name,
             role=payload.role,
             member_type=payload.member_type,
@@ -39,9 +151,70 @@ class UserService:
         await db.refresh(user)
         return user
 
+    async def import_users(self, db: AsyncSession, *, rows: Sequence[Mapping[str, Any]]) -> list[dict[str, object]]:
+        """Create every member in ``rows``, or none of them.
+
+        All rows are validated and checked for taken emails before any password is hashed, and every
+        problem is reported with its row number (422). The passwords are then hashed in parallel and the
+        users inserted with one multi-row INSERT.
+        """
+        errors: list[dict[str, Any]] = []
+        payloads: list[UserCreate] = []
+        first_row: dict[str, int] = {}
+        for number, row in enumerate(rows, start=1):
+            try:
+                payload = UserCreate.model_validate(row)
+            except ValidationError as exc:
+                errors.append(_import_error(number, row.get("email"), "; ".join(_describe(e) for e in exc.errors())))
+                continue
+            email = str(payload.email)
+            if email in first_row:
+                errors.append(_import_error(number, email, f"Duplicate of row {first_row[email]}"))
+                continue
+            first_row[email] = number
+            payloads.append(payload)
+
+        if first_row:
+            taken = await db.scalars(select(User.email).where(User.email.in_(list(first_row))))
+            errors += [_import_error(first_row[email], email, "Email already exists") for email in taken]
+        if errors:
+            raise HTTPException(status_code=422, detail=sorted(errors, key=lambda error: error["row"]))
+
+        hashes = await password_hasher.hash_many([payload.password for payload in payloads])
+        values = [
+            {
+                "id": uuid.uuid4(),
+                "email": str(payload.email),
+                "password_hash": password_hash,
+                "name": payload.name,
+                "role": payload.role,
+                "member_type": payload.member_type,
+                "description": payload.description,
+                "is_active": True,
+            }
+            for payload, password_hash in zip(payloads, hashes)
+        ]
+        stmt = (
+            insert(User)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(*schema_columns(User, UserRead))
+        )
+        created = rows_as_dicts(await db.execute(stmt))
+        if len(created) < len(values):
+            # An email was registered between the check above and the INSERT.
+            await db.rollback()
+            inserted = {row["email"] for row in created}
+            conflicts = [str(row["email"]) for row in values if row["email"] not in inserted]
+            raise HTTPException(
+                status_code=409, detail=[_import_error(first_row[email], email, "Email already exists") for email in conflicts]
+            )
+        await db.commit()
+        return created
+
     async def get_user(self, db: AsyncSession, *, user_id: UUID) -> User:
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        # The auth dependency has usually loaded this user into the session already; get() reuses it.
+        user = await db.get(User, user_id)
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
         return user
@@ -54,18 +227,22 @@ class UserService:
             setattr(user, k, v)
 
         try:
+            await publish_invalidation(db, user_tag(user_id))
             await db.commit()
         except IntegrityError:
             await db.rollback()
             raise HTTPException(status_code=409, detail="Update conflict")
 
+        await response_cache.invalidate(user_tag(user_id))
         await db.refresh(user)
         return user
 
     async def deactivate_user(self, db: AsyncSession, *, user_id: UUID) -> None:
         user = await self.get_user(db, user_id=user_id)
         user.is_active = False
+        await publish_invalidation(db, user_tag(user_id))
         await db.commit()
+        await response_cache.invalidate(user_tag(user_id))
 
     async def get_profile(self, db: AsyncSession, *, user_id: UUID) -> User:
         return await self.get_user(db, user_id=user_id)
@@ -75,7 +252,9 @@ class UserService:
         data = payload.model_dump(exclude_unset=True)
         for k, v in data.items():
             setattr(user, k, v)
+        await publish_invalidation(db, user_tag(user_id))
         await db.commit()
+        await response_cache.invalidate(user_tag(user_id))
         await db.refresh(user)
         return user
 
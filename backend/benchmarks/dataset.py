@@ -0,0 +1,131 @@
+"""
+Benchmark dataset shared by the load test and the service microbenchmarks.
+
+Every row it creates uses the ``bench`` email domain, so it can live next to seed data, but point
+DATABASE_DSN at a scratch database: the load test writes attendance and scores.
+"""
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import get_password_hash
+from app.db.partitions import SEASON_PARTITIONED_TABLES, create_partition_sql, season_of
+from app.models import Announcement, Attendance, AttendanceStatus, MemberType, Schedule, Score, User, UserRole
+from app.services.announcement_service import summarize
+
+PASSWORD = "bench-password"
+EMAIL_DOMAIN = "bench.degururu.test"
+ADMIN_EMAIL = f"admin@{EMAIL_DOMAIN}"
+
+
+@dataclass
+class Dataset:
+    admin_id: uuid.UUID
+    member_ids: list[uuid.UUID]
+    member_emails: list[str]
+    past_schedule_ids: list[uuid.UUID]
+    upcoming_schedule_ids: list[uuid.UUID]
+
+    @property
+    def admin_email(self) -> str:
+        return ADMIN_EMAIL
+
+
+async def ensure_dataset(db: AsyncSession, *, members: int = 40, schedules: int = 30, games: int = 3) -> Dataset:
+    """Load the benchmark dataset, creating it first if it does not exist yet."""
+    admin = await db.scalar(select(User).where(User.email == ADMIN_EMAIL))
+    if admin is None:
+        await _create(db, members=members, schedules=schedules, games=games)
+        admin = await db.scalar(select(User).where(User.email == ADMIN_EMAIL))
+        assert admin is not None
+
+    member_rows = (
+        await db.execute(
+            select(User.id, User.email)
+            .where(User.email.like(f"member%@{EMAIL_DOMAIN}"))
+            .order_by(User.email)
+        )
+    ).all()
+    schedule_rows = (
+        await db.execute(select(Schedule.id, Schedule.starts_at).where(Schedule.created_by == admin.id).order_by(Schedule.starts_at))
+    ).all()
+    now = datetime.now(timezone.utc)
+    return Dataset(
+        admin_id=admin.id,
+        member_ids=[row.id for row in member_rows],
+        member_emails=[row.email for row in member_rows],
+        past_schedule_ids=[row.id for row in schedule_rows if row.starts_at < now],
+        upcoming_schedule_ids=[row.id for row in schedule_rows if row.starts_at >= now],
+    )
+
+
+async def _create(db: AsyncSession, *, members: int, schedules: int, games: int) -> None:
+    rng = random.Random(2026)
+    # One bcrypt hash shared by every account: hashing per user would dominate setup time.
+    password_hash = get_password_hash(PASSWORD)
+
+    admin = User(email=ADMIN_EMAIL, password_hash=password_hash, name="Bench Admin", role=UserRole.ADMIN, is_active=True)
+    member_users = [
+        User(
+            email=f"member{i:04d}@{EMAIL_DOMAIN}",
+            password_hash=password_hash,
+            name=f"Bench Member {i}",
+            role=UserRole.MEMBER,
+            member_type=MemberType.FULL if i % 3 else MemberType.ASSOCIATE,
+            is_active=True,
+        )
+        for i in range(members)
+    ]
+    db.add(admin)
+    db.add_all(member_users)
+    await db.flush()
+
+    # Half the schedules are in the past (with scores), half upcoming (for check-ins).
+    base = datetime.now(timezone.utc).replace(hour=10, minute=0, second=0, microsecond=0) - timedelta(weeks=schedules // 2)
+    schedule_rows = [
+        Schedule(
+            title=f"Bench Session {i + 1}",
+            starts_at=base + timedelta(weeks=i),
+            location="Strike Bowling Center",
+            created_by=admin.id,
+        )
+        for i in range(schedules)
+    ]
+    db.add_all(schedule_rows)
+    await db.flush()
+    # The range can reach back into last season; partitions are created in this transaction.
+    for season in sorted({season_of(schedule.starts_at) for schedule in schedule_rows}):
+        for table in SEASON_PARTITIONED_TABLES:
+            await db.execute(text(create_partition_sql(table, season)))
+
+    now = datetime.now(timezone.utc)
+    for schedule in schedule_rows:
+        for user in member_users:
+            status = rng.choice((AttendanceStatus.ATTEND, AttendanceStatus.ATTEND, AttendanceStatus.ABSENT, AttendanceStatus.UNKNOWN))
+            season = season_of(schedule.starts_at)
+            db.add(Attendance(schedule_id=schedule.id, season=season, user_id=user.id, status=status))
+            if schedule.starts_at < now and status is AttendanceStatus.ATTEND:
+                db.add_all(
+                    Score(schedule_id=schedule.id, season=season, user_id=user.id, game_no=game, score=rng.randint(90, 260))
+                    for game in range(1, games + 1)
+                )
+
+    content = "Lane maintenance this week. " * 20
+    db.add_all(
+        Announcement(
+            title=f"Bench notice {i}",
+            content=content,
+            summary=summarize(content),
+            content_length=len(content),
+            author_id=admin.id,
+            is_pinned=i == 0,
+        )
+        for i in range(20)
+    )
+    await db.commit()
@@ -0,0 +1,191 @@
+"""
+Mixed-traffic load test: scripted personas against the app running in-process on a local Postgres.
+
+Usage:
+    python -m benchmarks.load [--users 20] [--duration 30] [--mix dashboard=5,check_in=3,...]
+
+The app is driven through httpx's ASGI transport with its lifespan running, so everything from
+routing to the database pool is exercised without a network hop. Each virtual user logs in once,
+then repeatedly picks a persona by weight and runs its script. The report shows throughput and
+p50/p95/p99 latency per route template; compare runs before and after a change.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.db.session import async_session_factory
+from app.main import create_app
+from benchmarks.dataset import PASSWORD, Dataset, ensure_dataset
+from benchmarks.report import print_latency_table
+
+
+@dataclass
+class Recorder:
+    samples: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+@dataclass
+class VirtualUser:
+    client: httpx.AsyncClient
+    recorder: Recorder
+    dataset: Dataset
+    rng: random.Random
+    email: str
+    user_id: uuid.UUID
+    token: str = ""
+
+    async def call(self, label: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        started = time.perf_counter()
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+        self.recorder.samples[label].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.recorder.errors[label] += 1
+        return response
+
+    async def login(self) -> None:
+        response = await self.call("POST /auth/login", "POST", "/api/auth/login", json={"email": self.email, "password": PASSWORD})
+        response.raise_for_status()
+        self.token = response.json()["access_token"]
+
+
+Persona = Callable[[VirtualUser], Awaitable[None]]
+
+
+async def login_burst(user: VirtualUser) -> None:
+    await user.call("POST /auth/login", "POST", "/api/auth/login", json={"email": user.email, "password": PASSWORD})
+
+
+async def dashboard(user: VirtualUser) -> None:
+    await user.call("GET /dashboard", "GET", "/api/dashboard")
+    await user.call("GET /announcements", "GET", "/api/announcements")
+    await user.call("GET /schedules", "GET", "/api/schedules")
+
+
+async def check_in(user: VirtualUser) -> None:
+    schedule_id = user.rng.choice(user.dataset.upcoming_schedule_ids)
+    status = user.rng.choice(("ATTEND", "ABSENT"))
+    await user.call(
+        "PUT /schedules/{schedule_id}/attendance/me",
+        "PUT",
+        f"/api/schedules/{schedule_id}/attendance/me",
+        json={"status": status},
+    )
+    await user.call("GET /schedules/{schedule_id}/attendance", "GET", f"/api/schedules/{schedule_id}/attendance")
+
+
+async def score_sheet(user: VirtualUser) -> None:
+    schedule_id = user.rng.choice(user.dataset.past_schedule_ids)
+    for game_no in (1, 2, 3):
+        await user.call(
+            "POST /schedules/{schedule_id}/scores",
+            "POST",
+            f"/api/schedules/{schedule_id}/scores",
+            json={"schedule_id": str(schedule_id), "game_no": game_no, "score": user.rng.randint(90, 260)},
+        )
+    await user.call("GET /schedules/{schedule_id}/scores", "GET", f"/api/schedules/{schedule_id}/scores")
+    await user.call("GET /schedules/{schedule_id}/stats", "GET", f"/api/schedules/{schedule_id}/stats")
+
+
+async def admin_matrix(user: VirtualUser) -> None:
+    schedule_id = user.rng.choice(user.dataset.upcoming_schedule_ids + user.dataset.past_schedule_ids)
+    await user.call("GET /schedules/{schedule_id}/full", "GET", f"/api/schedules/{schedule_id}/full")
+    for member_id in user.rng.sample(user.dataset.member_ids, k=min(3, len(user.dataset.member_ids))):
+        await user.call(
+            "PUT /schedules/{schedule_id}/attendance/{user_id}",
+            "PUT",
+            f"/api/schedules/{schedule_id}/attendance/{member_id}",
+            json={"status": user.rng.choice(("ATTEND", "ABSENT", "UNKNOWN"))},
+        )
+
+
+PERSONAS: dict[str, Persona] = {
+    "login_burst": login_burst,
+    "dashboard": dashboard,
+    "check_in": check_in,
+    "score_sheet": score_sheet,
+    "admin_matrix": admin_matrix,
+}
+DEFAULT_MIX = {"login_burst": 1, "dashboard": 5, "check_in": 3, "score_sheet": 2, "admin_matrix": 1}
+
+
+def parse_mix(raw: str | None) -> dict[str, int]:
+    if not raw:
+        return dict(DEFAULT_MIX)
+    mix: dict[str, int] = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in PERSONAS:
+            raise SystemExit(f"unknown persona {name!r}; choose from {', '.join(PERSONAS)}")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+async def run_user(user: VirtualUser, mix: dict[str, int], deadline: float) -> None:
+    # admin_matrix needs the admin token; members get a different persona instead.
+    names = [name for name in mix if name != "admin_matrix" or user.user_id == user.dataset.admin_id]
+    weights = [mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        await PERSONAS[user.rng.choices(names, weights)[0]](user)
+
+
+async def run(*, users: int, duration: float, mix: dict[str, int], seed: int) -> None:
+    async with async_session_factory() as db:
+        dataset = await ensure_dataset(db)
+
+    app = create_app()
+    recorder = Recorder()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            # One virtual user in ten is the admin, so the admin persona gets real concurrency too.
+            virtual_users = [
+                VirtualUser(client, recorder, dataset, random.Random(seed + i), dataset.admin_email, dataset.admin_id)
+                if i % 10 == 0
+                else VirtualUser(
+                    client,
+                    recorder,
+                    dataset,
+                    random.Random(seed + i),
+                    dataset.member_emails[i % len(dataset.member_emails)],
+                    dataset.member_ids[i % len(dataset.member_ids)],
+                )
+                for i in range(users)
+            ]
+            await asyncio.gather(*(user.login() for user in virtual_users))
+            recorder.samples.clear()
+            recorder.errors.clear()
+
+            started = time.perf_counter()
+            await asyncio.gather(*(run_user(user, mix, started + duration) for user in virtual_users))
+            elapsed = time.perf_counter() - started
+
+    total = sum(len(samples) for samples in recorder.samples.values())
+    print(f"{users} users x {duration:g}s, mix {mix}")
+    print(f"{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s), {sum(recorder.errors.values())} errors\n")
+    print_latency_table("route (ms)", recorder.samples, elapsed=elapsed, errors=recorder.errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--mix", help="comma-separated persona=weight, e.g. dashboard=5,check_in=3")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(users=args.users, duration=args.duration, mix=parse_mix(args.mix), seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import statistics
+from collections.abc import Mapping, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    return {
+        "count": len(samples),
+        "mean": statistics.fmean(samples) if samples else float("nan"),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+    }
+
+
+def print_latency_table(
+    title: str,
+    samples_by_name: Mapping[str, Sequence[float]],
+    *,
+    elapsed: float | None = None,
+    errors: Mapping[str, int] | None = None,
+    extra: Mapping[str, str] | None = None,
+) -> None:
+    """Print count, throughput and latency percentiles (samples in seconds, shown in ms) per name."""
+    width = max([len(name) for name in samples_by_name] + [len(title)])
+    print(f"{title:<{width}}  {'count':>7}  {'rps':>8}  {'mean':>8}  {'p50':>8}  {'p95':>8}  {'p99':>8}  {'err':>5}")
+    for name in sorted(samples_by_name):
+        stats = summarize(samples_by_name[name])
+        rps = f"{stats['count'] / elapsed:8.1f}" if elapsed else f"{'-':>8}"
+        line = (
+            f"{name:<{width}}  {stats['count']:>7}  {rps}  {stats['mean'] * 1000:8.2f}"
+            f"  {stats['p50'] * 1000:8.2f}  {stats['p95'] * 1000:8.2f}  {stats['p99'] * 1000:8.2f}"
+            f"  {(errors or {}).get(name, 0):>5}"
+        )
+        if extra and name in extra:
+            line += f"  {extra[name]}"
+        print(line)
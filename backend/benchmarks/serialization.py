@@ -0,0 +1,101 @@
+"""
+Compare the ORM + response_model path with the fast row path on large list responses.
+
+Usage:
+    python -m benchmarks.serialization [--rows 1000] [--requests 200]
+
+Both endpoints run inside one FastAPI app driven in-process, so transport overhead is
+identical and the difference is building objects, validating and encoding JSON. No
+database is needed: the ORM path builds mapped instances from raw column values on every
+request and the fast path builds dicts, approximating what each query result yields.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.serialization import dump_rows
+from app.models.schedule import Schedule
+from app.schemas.schedule import ScheduleRead
+
+def make_raw_rows(count: int) -> list[dict[str, object]]:
+    base = datetime(2026, 1, 3, 10, 0, tzinfo=timezone.utc)
+    admin_id = uuid.uuid4()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Weekly Bowling Session - Week {i + 1}",
+            "starts_at": base + timedelta(weeks=i),
+            "location": "Strike Bowling Center",
+            "notes": "Regular Saturday morning session.",
+            "created_by": admin_id,
+            "is_cancelled": i % 17 == 0,
+            "rule_id": None,
+            "created_at": base,
+            "updated_at": base,
+        }
+        for i in range(count)
+    ]
+
+
+def build_app(raw_rows: list[dict[str, object]]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/orm", response_model=list[ScheduleRead])
+    async def orm_path() -> list[Schedule]:
+        return [Schedule(**row) for row in raw_rows]
+
+    @app.get("/fast")
+    async def fast_path() -> Response:
+        rows = [dict(row) for row in raw_rows]
+        return Response(dump_rows(ScheduleRead, rows), media_type="application/json")
+
+    return app
+
+
+def measure(call: Callable[[], object], requests: int) -> dict[str, float]:
+    call()  # warm up adapters and route compilation
+    cpu_times: list[float] = []
+    for _ in range(requests):
+        started = time.process_time()
+        call()
+        cpu_times.append(time.process_time() - started)
+
+    tracemalloc.start()
+    call()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "cpu_ms_mean": statistics.fmean(cpu_times) * 1000,
+        "cpu_ms_p95": sorted(cpu_times)[int(len(cpu_times) * 0.95) - 1] * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    client = TestClient(build_app(make_raw_rows(args.rows)))
+    assert client.get("/orm").json() == client.get("/fast").json(), "paths must produce identical payloads"
+
+    print(f"{args.rows} rows x {args.requests} requests")
+    results = {name: measure(lambda path=path: client.get(path), args.requests) for name, path in (("orm", "/orm"), ("fast", "/fast"))}
+    for name, stats in results.items():
+        print(f"  {name:<5} cpu mean {stats['cpu_ms_mean']:7.2f} ms  p95 {stats['cpu_ms_p95']:7.2f} ms  peak {stats['peak_kib']:9.1f} KiB")
+    print(f"  speedup x{results['orm']['cpu_ms_mean'] / results['fast']['cpu_ms_mean']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Microbenchmarks for the service-layer hot paths against a local Postgres.
+
+Usage:
+    python -m benchmarks.services [--iterations 200] [--only trend,full]
+
+Each iteration opens a fresh session, as a request would, and times one service call. The report
+adds the number of SQL statements per call so query-count regressions show up next to latency.
+Response caching is bypassed: these numbers are the cost of a cache miss.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache
+from app.core.metrics import track_db
+from app.db.session import async_session_factory, dispose_engine
+from app.models.user import User
+from app.services.announcement_service import announcement_service
+from app.services.attendance_service import attendance_service
+from app.services.dashboard_service import dashboard_service
+from app.services.schedule_detail_service import SCHEDULE_SECTIONS, schedule_detail_service
+from app.services.schedule_service import schedule_service
+from app.services.score_service import score_service
+from benchmarks.dataset import Dataset, ensure_dataset
+from benchmarks.report import print_latency_table
+
+Operation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def operations(dataset: Dataset, member: User) -> dict[str, Operation]:
+    past = dataset.past_schedule_ids[-1]
+    return {
+        "schedules.list_rows": lambda db: schedule_service.list_schedule_rows(db),
+        "schedules.list_version": lambda db: schedule_service.get_list_version(db),
+        "announcements.list_rows": lambda db: announcement_service.list_announcement_rows(db),
+        "attendance.schedule_rows": lambda db: attendance_service.list_schedule_attendance_rows(db, schedule_id=past),
+        "scores.schedule_rows": lambda db: score_service.list_schedule_score_rows(db, schedule_id=past),
+        "scores.stats": lambda db: score_service.get_schedule_stats(db, schedule_id=past),
+        "scores.trend": lambda db: score_service.get_my_trend(db, user_id=member.id),
+        "schedules.full": lambda db: schedule_detail_service.get_schedule_full(db, schedule_id=past, include=SCHEDULE_SECTIONS),
+        # The dashboard opens its own sessions; the one passed in is unused.
+        "dashboard": lambda _db: dashboard_service.get_dashboard(user=member),
+    }
+
+
+async def run(*, iterations: int, only: list[str]) -> None:
+    async with async_session_factory() as db:
+        dataset = await ensure_dataset(db)
+        member = await db.get(User, dataset.member_ids[0])
+        assert member is not None
+
+    ops = {name: op for name, op in operations(dataset, member).items() if not only or any(key in name for key in only)}
+    samples: dict[str, list[float]] = {}
+    statements: dict[str, str] = {}
+    for name, op in ops.items():
+        timings: list[float] = []
+        for i in range(iterations + 5):
+            await response_cache.clear()
+            async with async_session_factory() as db:
+                with track_db() as stats:
+                    started = time.perf_counter()
+                    await op(db)
+                    elapsed = time.perf_counter() - started
+            if i >= 5:  # the first calls fill statement caches on fresh connections
+                timings.append(elapsed)
+        samples[name] = timings
+        statements[name] = f"{stats.statements} stmt, {stats.seconds * 1000:.2f} ms in SQL"
+
+    print(f"{iterations} iterations per operation\n")
+    print_latency_table("operation (ms)", samples, extra=statements)
+    await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--only", default="", help="comma-separated substrings of operation names")
+    args = parser.parse_args()
+    asyncio.run(run(iterations=args.iterations, only=[key for key in args.only.split(",") if key]))
+
+
+if __name__ == "__main__":
+    main()
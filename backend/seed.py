@@ -24,8 +24,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_password_hash
-from app.db.session import async_session_factory
-from app.models import Announcement, Attendance, AttendanceStatus, Schedule, Score, User, UserRole, MemberType
+from app.db.partitions import season_of, season_partitions
+from app.db.session import async_session_factory, dispose_engine
+from app.models import Announcement, AnnouncementReadState, Attendance, AttendanceStatus, Schedule, ScheduleRule, Score, User, UserRole, MemberType
+from app.services.announcement_service import summarize
 
 
 async def clear_all_data(session: AsyncSession) -> None:
@@ -33,10 +35,12 @@ async def clear_all_data(session: AsyncSession) -> None:
     print("🗑️  Clearing existing data...")
     
     # Delete in correct order to respect foreign keys
+    await session.execute(AnnouncementReadState.__table__.delete())
     await session.execute(Announcement.__table__.delete())
     await session.execute(Score.__table__.delete())
     await session.execute(Attendance.__table__.delete())
     await session.execute(Schedule.__table__.delete())
+    await session.execute(ScheduleRule.__table__.delete())
     await session.execute(User.__table__.delete())
     
     await session.commit()
@@ -86,11 +90,12 @@ async def create_users(session: AsyncSession) -> dict[str, User]:
         },
     ]
     
+    member_password_hash = get_password_hash("member1234")
     for idx, data in enumerate(member_data, 1):
         member = User(
             id=uuid.uuid4(),
             email=data["email"],
-            password_hash=get_password_hash("member1234"),
+            password_hash=member_password_hash,
             name=data["name"],
             role=UserRole.MEMBER,
             member_type=data["member_type"],
@@ -130,6 +135,9 @@ async def create_schedules(session: AsyncSession, admin: User) -> list[Schedule]
         "Strike Bowling Center",
     ]
     
+    # Attendance and scores of these schedules go to their seasons' partitions.
+    await season_partitions.ensure(*{season_of(base_date + timedelta(weeks=i)) for i in range(5)})
+
     for i in range(5):
         schedule_date = base_date + timedelta(weeks=i)
         schedule = Schedule(
@@ -185,6 +193,7 @@ async def create_attendance(session: AsyncSession, schedules: list[Schedule], me
             attendance = Attendance(
                 id=uuid.uuid4(),
                 schedule_id=schedule.id,
+                season=season_of(schedule.starts_at),
                 user_id=member.id,
                 status=status,
                 comment=comment,
@@ -226,6 +235,7 @@ async def create_scores(session: AsyncSession, schedules: list[Schedule], member
                 score = Score(
                     id=uuid.uuid4(),
                     schedule_id=schedule.id,
+                    season=season_of(schedule.starts_at),
                     user_id=member.id,
                     game_no=game_no,
                     score=score_value,
@@ -279,6 +289,8 @@ async def create_announcements(session: AsyncSession, admin: User, members: list
             id=uuid.uuid4(),
             title=data["title"],
             content=data["content"],
+            summary=summarize(data["content"]),
+            content_length=len(data["content"]),
             author_id=data["author"].id,
             is_pinned=data["is_pinned"],
             is_deleted=False,
@@ -311,6 +323,7 @@ async def seed_database() -> None:
         await create_attendance(session, schedules, members)
         await create_scores(session, schedules, members)
         await create_announcements(session, admin, members)
+    await dispose_engine()
     
     print("\n" + "=" * 60)
     print("✅ Database seeding completed successfully!")
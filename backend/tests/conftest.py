@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import os
+
+# Settings are read once, when the app modules are first imported, so the test environment is set here.
+# Tests that need Postgres run against TEST_DATABASE_DSN, a migrated database they are free to empty.
+if os.environ.get("TEST_DATABASE_DSN"):
+    os.environ["DATABASE_DSN"] = os.environ["TEST_DATABASE_DSN"]
+os.environ.setdefault("INVALIDATION_LISTEN", "false")
+os.environ.setdefault("RESPONSE_CACHE_BACKEND", "none")
+os.environ.setdefault("PROFILING_ENABLED", "false")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from app.models.announcement_read_state import AnnouncementReadState
+from app.models.user import User, UserRole
+from app.services.announcement_service import announcement_service
+
+READ_THROUGH = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    def __init__(self, newest: datetime | None) -> None:
+        self.newest = newest
+        self.statements: list[str] = []
+        self.committed = False
+
+    async def scalar(self, stmt: Any) -> datetime | None:
+        self.statements.append(str(stmt))
+        return self.newest
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+def _mark_all_read(monkeypatch: pytest.MonkeyPatch, newest: datetime | None) -> tuple[AnnouncementReadState, RecordingSession]:
+    user = User(id=uuid.uuid4(), email="member@test", name="Member", role=UserRole.MEMBER)
+    state = AnnouncementReadState(user_id=user.id, read_through=READ_THROUGH, read_ids=[uuid.uuid4()])
+
+    async def lock_read_state(db: Any, *, user: User) -> AnnouncementReadState:
+        return state
+
+    monkeypatch.setattr(announcement_service, "_lock_read_state", lock_read_state)
+    db = RecordingSession(newest)
+    asyncio.run(announcement_service.mark_all_read(db, user=user))  # type: ignore[arg-type]
+    return state, db
+
+
+def test_mark_all_read_stops_at_the_newest_visible_announcement(monkeypatch: pytest.MonkeyPatch) -> None:
+    newest = READ_THROUGH + timedelta(days=3)
+
+    state, db = _mark_all_read(monkeypatch, newest)
+
+    assert state.read_through == newest
+    assert state.read_ids == []
+    assert db.committed
+    assert "max(announcements.created_at)" in db.statements[0]
+    assert "now()" not in db.statements[0]
+
+
+def test_mark_all_read_without_new_announcements_keeps_the_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    state, db = _mark_all_read(monkeypatch, None)
+
+    assert state.read_through == READ_THROUGH
+    assert len(state.read_ids) == 1
+    assert db.committed
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import html
+
+import pytest
+from sqlalchemy import literal, select
+from sqlalchemy.dialects import postgresql
+
+from app.services.announcement_service import HTML_ENTITIES, html_escaped
+
+
+def test_html_escaped_replaces_ampersands_first() -> None:
+    stmt = select(html_escaped(literal("x")))
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    # The innermost replace() runs first.
+    assert sql.startswith("SELECT replace(replace(replace(replace(replace('x', '&', '&amp;'), '<', '&lt;')")
+
+
+@pytest.mark.parametrize("content", ['<img src=x onerror="alert(1)">', "Tom & Jerry's <b>lane</b>", "&lt;b&gt;"])
+def test_html_escaped_matches_html_escape(content: str) -> None:
+    escaped = content
+    for char, entity in HTML_ENTITIES:
+        escaped = escaped.replace(char, entity)
+
+    assert escaped == html.escape(content)
@@ -0,0 +1,255 @@
+"""Drives every budgeted route against Postgres and checks its statements against QUERY_BUDGETS.
+
+Needs TEST_DATABASE_DSN pointing at a migrated database whose data may be deleted; skipped otherwise.
+Ids are chosen for the worst case: a virtual rule occurrence for schedule routes, since it adds the
+rule fallback and the existence check for empty child lists.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.api.routers import (
+    admin,
+    announcements,
+    attendance,
+    auth,
+    calendar,
+    dashboard,
+    events,
+    schedule_rules,
+    schedules,
+    scores,
+    users,
+)
+from app.core.config import get_settings
+from app.core.events import schedule_events
+from app.core.metrics import route_template
+from app.core.query_budget import QUERY_BUDGETS, QueryBudgetExceeded, RecordedRequest, query_budget
+from app.core.security import create_access_token, create_stream_token
+from app.db.partitions import season_of, season_partitions
+from app.db.session import async_session_factory
+from app.main import app
+from app.models import (
+    Announcement,
+    AnnouncementReadState,
+    Attendance,
+    AttendanceStatus,
+    MemberType,
+    RecurrenceFrequency,
+    Schedule,
+    ScheduleRule,
+    Score,
+    User,
+    UserRole,
+)
+from app.services.schedule_rule_service import occurrence_id
+
+MONTH = datetime.now(timezone.utc).strftime("%Y-%m")
+
+# (budget key, path); ``{...}`` fields are filled from the seeded ids.
+CASES: list[tuple[str, str]] = [
+    ("GET /auth/me", "/auth/me"),
+    ("GET /profile", "/profile"),
+    ("GET /users", "/users"),
+    ("GET /users/search", "/users/search?q=mem&size=1"),
+    ("GET /users/{user_id}", "/users/{member_id}"),
+    ("GET /schedules", "/schedules"),
+    ("GET /schedules/calendar", f"/schedules/calendar?month={MONTH}"),
+    ("GET /schedules/{schedule_id}", "/schedules/{schedule_id}"),
+    ("GET /schedules/{schedule_id}", "/schedules/{virtual_id}"),
+    ("GET /schedules/{schedule_id}/full", "/schedules/{schedule_id}/full"),
+    ("GET /schedules/{schedule_id}/full", "/schedules/{virtual_id}/full"),
+    ("GET /schedules/{schedule_id}/attendance", "/schedules/{schedule_id}/attendance"),
+    ("GET /schedules/{schedule_id}/attendance", "/schedules/{virtual_id}/attendance"),
+    ("GET /schedules/{schedule_id}/scores", "/schedules/{schedule_id}/scores"),
+    ("GET /schedules/{schedule_id}/scores", "/schedules/{virtual_id}/scores"),
+    ("GET /schedules/{schedule_id}/stats", "/schedules/{schedule_id}/stats"),
+    ("GET /schedules/{schedule_id}/stats", "/schedules/{virtual_id}/stats"),
+    ("GET /schedules/{schedule_id}/events", "/schedules/{virtual_id}/events?token={stream_token}"),
+    ("GET /schedule-rules", "/schedule-rules"),
+    ("GET /schedule-rules/{rule_id}", "/schedule-rules/{rule_id}"),
+    ("GET /attendance/me", "/attendance/me"),
+    ("GET /announcements", "/announcements"),
+    ("GET /announcements/search", "/announcements/search?q=lane"),
+    ("GET /announcements/unread-count", "/announcements/unread-count"),
+    ("GET /announcements/{announcement_id}", "/announcements/{announcement_id}"),
+    ("GET /scores/me/trend", "/scores/me/trend"),
+    ("GET /scores/me/high", "/scores/me/high"),
+    ("GET /dashboard", "/dashboard"),
+    ("GET /calendar.ics", "/calendar.ics?token={calendar_token}"),
+    ("GET /calendar/token", "/calendar/token"),
+    ("GET /admin/cache", "/admin/cache"),
+    ("GET /admin/partitions", "/admin/partitions"),
+    ("GET /admin/slow-queries", "/admin/slow-queries"),
+    ("GET /admin/traces", "/admin/traces"),
+    ("GET /admin/profiles", "/admin/profiles"),
+    ("GET /admin/profiles/{profile_id}", "/admin/profiles/1"),
+]
+# Profiling is off in tests, so there is no profile to fetch; the lookup still runs the auth query.
+EXPECTED_STATUS = {"/admin/profiles/1": 404}
+ADMIN_ROUTES = ("GET /users", "GET /admin")
+
+requires_database = pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_DSN"), reason="TEST_DATABASE_DSN is not set"
+)
+
+
+def test_every_budget_has_a_case() -> None:
+    assert {route for route, _ in CASES} == set(QUERY_BUDGETS)
+
+
+def test_every_api_read_has_a_budget() -> None:
+    modules = (admin, announcements, attendance, auth, calendar, dashboard, events, schedule_rules, schedules, scores, users)
+    reads = {
+        f"GET {route.path}"
+        for module in modules
+        for route in module.router.routes
+        if isinstance(route, APIRoute) and "GET" in route.methods
+    }
+    assert reads == set(QUERY_BUDGETS)
+
+
+@pytest.mark.parametrize("path", ["/api/schedules/{schedule_id}", "/schedules/{schedule_id}"])
+def test_budget_label_is_the_same_with_or_without_the_prefix_on_the_route(path: str) -> None:
+    # Older FastAPI releases give included routes their full path, newer ones only the router's.
+    scope = {"method": "GET", "path": "/api/schedules/1", "route": APIRoute(path, lambda: None)}
+
+    assert route_template(scope) == "/schedules/{schedule_id}"
+
+
+def test_api_read_without_a_budget_is_reported() -> None:
+    request = RecordedRequest("GET /schedules/{schedule_id}/renamed", ["SELECT 1"], requires_budget=True)
+
+    with pytest.raises(QueryBudgetExceeded, match="has no query budget"):
+        query_budget.assert_within_budget([request])
+    # Routes outside the API (health checks, docs) are only checked when they have a budget.
+    query_budget.assert_within_budget([RecordedRequest("GET /health")])
+
+
+async def _seed() -> dict[str, Any]:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    await season_partitions.ensure(season_of(now))
+    async with async_session_factory() as db:
+        await db.execute(
+            text(
+                "TRUNCATE announcement_read_states, announcements, scores, attendance, schedules, schedule_rules, users"
+            )
+        )
+        admin = User(email="admin@budget.test", password_hash="-", name="Admin", role=UserRole.ADMIN)
+        member = User(
+            email="member@budget.test",
+            password_hash="-",
+            name="Member",
+            role=UserRole.MEMBER,
+            member_type=MemberType.FULL,
+            calendar_token="budget-calendar-token",
+        )
+        db.add_all([admin, member])
+        await db.flush()
+
+        rule = ScheduleRule(
+            title="Weekly league",
+            frequency=RecurrenceFrequency.WEEKLY,
+            interval=1,
+            starts_at=now - timedelta(weeks=3),
+            timezone="UTC",
+            created_by=admin.id,
+        )
+        schedule = Schedule(title="Friday session", starts_at=now - timedelta(days=1), created_by=admin.id)
+        db.add_all([rule, schedule])
+        await db.flush()
+        await db.refresh(rule, ["number"])
+        # One materialized occurrence, so rule lookups also check which occurrences are stored.
+        materialized = Schedule(
+            id=occurrence_id(rule.number, 1),
+            title=rule.title,
+            starts_at=rule.starts_at + timedelta(weeks=1),
+            created_by=admin.id,
+            rule_id=rule.id,
+            occurrence_index=1,
+        )
+        db.add(materialized)
+        await db.flush()
+
+        for stored in (schedule, materialized):
+            season = season_of(stored.starts_at)
+            for user in (admin, member):
+                db.add(Attendance(schedule_id=stored.id, season=season, user_id=user.id, status=AttendanceStatus.ATTEND))
+                db.add(Score(schedule_id=stored.id, season=season, user_id=user.id, game_no=1, score=180))
+        announcement = Announcement(title="Lane maintenance", content="Lane 3 is closed on Friday.", author_id=admin.id)
+        db.add(announcement)
+        db.add(AnnouncementReadState(user_id=member.id, read_through=now - timedelta(days=7)))
+        await db.commit()
+
+        virtual_id = occurrence_id(rule.number, 4)
+        return {
+            "admin_id": admin.id,
+            "member_id": member.id,
+            "schedule_id": schedule.id,
+            "virtual_id": virtual_id,
+            "rule_id": rule.id,
+            "announcement_id": announcement.id,
+            "calendar_token": member.calendar_token,
+            "stream_token": create_stream_token(member.id, virtual_id),
+        }
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    with TestClient(app, base_url="http://testserver/api") as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def seeded(client: TestClient) -> dict[str, Any]:
+    # Seeded through the client's event loop: pooled asyncpg connections cannot cross loops.
+    assert client.portal is not None
+    return client.portal.call(_seed)
+
+
+def _get(client: TestClient, path: str, headers: dict[str, str]) -> int:
+    if "/events" not in path:
+        return client.get(path, headers=headers).status_code
+    # An event stream only ends when the hub closes it.
+    done = threading.Event()
+
+    def close_streams() -> None:
+        while not done.wait(0.05):
+            assert client.portal is not None
+            client.portal.call(schedule_events.close)
+
+    closer = threading.Thread(target=close_streams, daemon=True)
+    closer.start()
+    try:
+        return client.get(path, headers=headers).status_code
+    finally:
+        done.set()
+        closer.join()
+
+
+@requires_database
+@pytest.mark.parametrize("fast_path", [True, False], ids=["fast", "orm"])
+@pytest.mark.parametrize("route, path", CASES, ids=[path for _, path in CASES])
+def test_route_stays_within_budget(
+    client: TestClient, seeded: dict[str, Any], monkeypatch: pytest.MonkeyPatch, fast_path: bool, route: str, path: str
+) -> None:
+    monkeypatch.setattr(get_settings(), "fast_path_serialization", fast_path)
+    # Admin routes need the admin; the member has the calendar token and unread announcements.
+    user_id = seeded["admin_id"] if route.startswith(ADMIN_ROUTES) else seeded["member_id"]
+    headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+
+    with query_budget.recording() as requests:
+        status_code = _get(client, path.format(**seeded), headers)
+
+    assert status_code == EXPECTED_STATUS.get(path, 200)
+    assert [request.route for request in requests] == [route]
+    query_budget.assert_within_budget(requests)
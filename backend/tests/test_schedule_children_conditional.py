@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.conditional import make_etag
+from app.core.deps import get_current_active_user, get_db_session
+from app.main import app
+from app.models.user import User, UserRole
+from app.services.attendance_service import attendance_service
+from app.services.score_service import score_service
+
+SCHEDULE_ID = uuid.uuid4()
+
+# (path, service, version method, ETag of an empty list)
+ROUTES = [
+    (
+        f"/api/schedules/{SCHEDULE_ID}/attendance",
+        attendance_service,
+        "get_schedule_attendance_version",
+        make_etag("attendance", SCHEDULE_ID, 0, None),
+    ),
+    (
+        f"/api/schedules/{SCHEDULE_ID}/scores",
+        score_service,
+        "get_schedule_scores_version",
+        make_etag("scores", SCHEDULE_ID, 0, None),
+    ),
+]
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    member = User(id=uuid.uuid4(), email="member@test", name="Member", role=UserRole.MEMBER, is_active=True)
+
+    async def no_db() -> None:
+        return None
+
+    app.dependency_overrides[get_db_session] = no_db
+    app.dependency_overrides[get_current_active_user] = lambda: member
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _stub(monkeypatch: pytest.MonkeyPatch, service: Any, version: str, *, exists: bool) -> None:
+    async def empty_version(db: Any, *, schedule_id: uuid.UUID) -> tuple[int, datetime | None]:
+        return 0, None
+
+    async def ensure_schedule_exists(db: Any, *, schedule_id: uuid.UUID) -> None:
+        if not exists:
+            raise HTTPException(status_code=404, detail="Schedule not found")
+
+    monkeypatch.setattr(service, version, empty_version)
+    monkeypatch.setattr(service, "ensure_schedule_exists", ensure_schedule_exists)
+
+
+@pytest.mark.parametrize("path, service, version, etag", ROUTES)
+def test_matching_etag_for_a_missing_schedule_is_404(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, path: str, service: Any, version: str, etag: str
+) -> None:
+    _stub(monkeypatch, service, version, exists=False)
+
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 404
+
+
+@pytest.mark.parametrize("path, service, version, etag", ROUTES)
+def test_empty_list_of_an_existing_schedule(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, path: str, service: Any, version: str, etag: str
+) -> None:
+    _stub(monkeypatch, service, version, exists=True)
+
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.json() == []
+    assert response.headers["etag"] == etag
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
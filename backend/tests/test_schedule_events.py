@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from app.core.events import ScheduleEventHub
+from app.core.invalidation import InvalidationListener, worker_id
+
+
+def _listener(hub: ScheduleEventHub) -> InvalidationListener:
+    listener = InvalidationListener(dsn="postgresql://unused")
+    listener.event_handlers.append(hub.publish_encoded)
+    return listener
+
+
+def test_events_from_other_workers_reach_local_subscribers() -> None:
+    async def scenario() -> list[bytes]:
+        hub = ScheduleEventHub(queue_size=8, heartbeat_seconds=60)
+        listener = _listener(hub)
+        schedule_id = uuid.uuid4()
+        stream = hub.subscribe(schedule_id)
+        frames = [await anext(stream)]
+
+        listener._on_event(None, 0, "", f"{worker_id()} {schedule_id} score {{}}")  # own write, already published
+        listener._on_event(None, 0, "", f"other {schedule_id} attendance {{\"status\": \"ATTEND\"}}")
+        frames.append(await anext(stream))
+        hub.close()
+        frames.extend([frame async for frame in stream])
+        assert (listener.own, listener.received) == (1, 1)
+        return frames
+
+    frames = asyncio.run(scenario())
+
+    assert frames[1] == b'id: 1\nevent: attendance\ndata: {"status": "ATTEND"}\n\n'
+    assert len(frames) == 2
+
+
+def test_resync_disconnects_every_stream() -> None:
+    async def scenario() -> list[bytes]:
+        hub = ScheduleEventHub(queue_size=8, heartbeat_seconds=60)
+        stream = hub.subscribe(uuid.uuid4())
+        await anext(stream)
+        hub.resync()
+        return [frame async for frame in stream]
+
+    assert asyncio.run(scenario()) == [b"event: resync\ndata: {}\n\n"]
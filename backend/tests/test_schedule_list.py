@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from app.models.schedule import Schedule
+from app.models.schedule_rule import RecurrenceFrequency, ScheduleRule
+from app.services.schedule_rule_service import list_day, schedule_rule_service
+from app.services.schedule_service import schedule_service
+
+TODAY = list_day()
+# Weekly on the day after tomorrow, started three weeks ago and never ending.
+RULE = ScheduleRule(
+    id=uuid.uuid4(),
+    number=3,
+    title="Weekly league",
+    frequency=RecurrenceFrequency.WEEKLY,
+    interval=1,
+    starts_at=TODAY - timedelta(weeks=3) + timedelta(days=2, hours=19),
+    until=None,
+    timezone="UTC",
+    exdates=[],
+    created_at=TODAY - timedelta(weeks=4),
+    updated_at=TODAY - timedelta(weeks=4),
+)
+STORED = Schedule(id=uuid.uuid4(), title="Friday session", starts_at=TODAY - timedelta(days=1, hours=-19))
+
+
+class StubResult:
+    def __init__(self, items: list[Any]) -> None:
+        self.items = items
+
+    def keys(self) -> tuple[str, ...]:
+        return ("id", "title", "starts_at")
+
+    def __iter__(self) -> Any:
+        return iter((item.id, item.title, item.starts_at) for item in self.items)
+
+    def scalars(self) -> StubResult:
+        return self
+
+    def all(self) -> list[Any]:
+        return self.items
+
+
+class StubSession:
+    """Answers the rule query with RULE and the stored-schedule query with STORED."""
+
+    async def execute(self, stmt: Any) -> StubResult:
+        return StubResult([RULE] if "FROM schedule_rules" in str(stmt) else [STORED])
+
+
+@pytest.fixture(autouse=True)
+def nothing_materialized(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def materialized(db: Any, keys: Any) -> set[tuple[uuid.UUID, int]]:
+        list(keys)
+        return set()
+
+    monkeypatch.setattr(schedule_rule_service, "_materialized", materialized)
+
+
+def _starts(fast_path: bool) -> list[datetime]:
+    if fast_path:  # the dashboard's schedules section uses the same rows
+        rows = asyncio.run(schedule_service.list_schedule_rows(StubSession(), size=5))  # type: ignore[arg-type]
+        return [row["starts_at"] for row in rows]  # type: ignore[misc]
+    items = asyncio.run(schedule_service.list_schedules(StubSession(), size=5))  # type: ignore[arg-type]
+    return [item.starts_at for item in items]
+
+
+@pytest.mark.parametrize("fast_path", [True, False], ids=["fast", "orm"])
+def test_open_ended_list_starts_with_the_next_session(fast_path: bool) -> None:
+    next_session = RULE.starts_at + timedelta(weeks=3)
+
+    starts = _starts(fast_path)
+
+    assert starts[0] == next_session
+    assert starts[1:] == [
+        STORED.starts_at,
+        next_session - timedelta(weeks=1),
+        next_session - timedelta(weeks=2),
+        next_session - timedelta(weeks=3),
+    ]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import itertools
+import uuid
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.models.schedule_rule import RecurrenceFrequency, ScheduleRule
+from app.services.schedule_rule_service import _index_bounds, expand, occurrence_id, occurrence_start, parse_occurrence_id
+
+SEOUL = ZoneInfo("Asia/Seoul")
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def make_rule(
+    starts_at: datetime,
+    *,
+    frequency: RecurrenceFrequency = RecurrenceFrequency.WEEKLY,
+    interval: int = 1,
+    until: datetime | None = None,
+    exdates: list[datetime] | None = None,
+) -> ScheduleRule:
+    tz = starts_at.tzinfo
+    return ScheduleRule(
+        id=uuid.uuid4(),
+        number=7,
+        title="Weekly session",
+        frequency=frequency,
+        interval=interval,
+        starts_at=starts_at.astimezone(timezone.utc),
+        until=until,
+        timezone=getattr(tz, "key", "UTC"),
+        exdates=exdates or [],
+    )
+
+
+@pytest.mark.parametrize("number, index", [(1, 0), (7, 52), ((1 << 30) - 1, (1 << 32) - 1)])
+def test_occurrence_id_round_trips(number: int, index: int) -> None:
+    value = occurrence_id(number, index)
+
+    assert value.version == 8
+    assert value.variant == uuid.RFC_4122
+    assert parse_occurrence_id(value) == (number, index)
+
+
+def test_parse_occurrence_id_rejects_other_ids() -> None:
+    assert parse_occurrence_id(uuid.uuid4()) is None
+    # Right prefix, wrong variant bits.
+    assert parse_occurrence_id(uuid.UUID(int=occurrence_id(1, 1).int ^ (1 << 63))) is None
+
+
+def test_monthly_rule_skips_months_without_the_day() -> None:
+    rule = make_rule(datetime(2026, 1, 31, 19, 0, tzinfo=SEOUL), frequency=RecurrenceFrequency.MONTHLY)
+
+    assert occurrence_start(rule, 1) is None  # no 31 February
+    assert occurrence_start(rule, 2) == datetime(2026, 3, 31, 19, 0, tzinfo=SEOUL)
+    occurrences = list(expand(rule, rule.starts_at, datetime(2026, 6, 1, tzinfo=SEOUL)))
+    assert [index for index, _ in occurrences] == [0, 2, 4]
+
+
+def test_weekly_rule_keeps_wall_clock_time_across_dst() -> None:
+    rule = make_rule(datetime(2026, 3, 1, 19, 0, tzinfo=NEW_YORK))
+
+    before, after = occurrence_start(rule, 0), occurrence_start(rule, 1)
+
+    assert before is not None and after is not None
+    assert after - before == timedelta(days=7, hours=-1)  # clocks go forward on 8 March
+    assert after.astimezone(NEW_YORK).hour == 19
+
+
+def test_expand_skips_exdates() -> None:
+    start = datetime(2026, 1, 3, 10, 0, tzinfo=SEOUL)
+    skipped = occurrence_start(make_rule(start), 1)
+    rule = make_rule(start, exdates=[skipped])
+
+    occurrences = list(expand(rule, rule.starts_at, rule.starts_at + timedelta(weeks=3)))
+
+    assert [index for index, _ in occurrences] == [0, 2, 3]
+
+
+def test_expand_stops_at_until() -> None:
+    start = datetime(2026, 1, 3, 10, 0, tzinfo=SEOUL)
+    rule = make_rule(start, interval=2, until=start + timedelta(weeks=4))
+
+    occurrences = list(expand(rule, rule.starts_at, start + timedelta(weeks=20)))
+
+    assert occurrences == [(index, occurrence_start(rule, index)) for index in range(3)]
+
+
+def test_expand_descending_with_a_limit_yields_the_newest_first() -> None:
+    rule = make_rule(datetime(2026, 1, 3, 10, 0, tzinfo=SEOUL))
+    end = rule.starts_at + timedelta(weeks=10, days=1)
+
+    newest = list(itertools.islice(expand(rule, rule.starts_at, end, descending=True), 3))
+
+    assert [index for index, _ in newest] == [10, 9, 8]
+    assert newest[0][1] == rule.starts_at + timedelta(weeks=10)
+
+
+def test_expand_clamps_the_range_to_the_rule_start() -> None:
+    rule = make_rule(datetime(2026, 1, 3, 10, 0, tzinfo=SEOUL))
+
+    occurrences = list(expand(rule, rule.starts_at - timedelta(weeks=5), rule.starts_at + timedelta(weeks=1)))
+
+    assert [index for index, _ in occurrences] == [0, 1]
+
+
+def test_index_bounds_widen_by_one_step_on_each_side() -> None:
+    weekly = make_rule(datetime(2026, 1, 3, 10, 0, tzinfo=SEOUL), interval=2)
+    start = weekly.starts_at + timedelta(weeks=6)
+
+    assert _index_bounds(weekly, start, start + timedelta(weeks=4)) == (2, 6)
+    assert _index_bounds(weekly, weekly.starts_at, weekly.starts_at) == (0, 1)
+
+    monthly = make_rule(datetime(2026, 1, 31, 19, 0, tzinfo=SEOUL), frequency=RecurrenceFrequency.MONTHLY)
+    assert _index_bounds(monthly, datetime(2026, 4, 1, tzinfo=timezone.utc), datetime(2026, 6, 30, tzinfo=timezone.utc)) == (2, 6)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.deps import get_current_admin, get_db_session
+from app.db import partitions
+from app.db.partitions import PartitionUnavailable, SeasonPartitions, season_partitions
+from app.main import app
+from app.models.user import User, UserRole
+
+
+def _unreachable_engine() -> Any:
+    raise OSError("lock timeout")
+
+
+def test_ensure_raises_when_the_partition_cannot_be_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(partitions, "get_engine", _unreachable_engine)
+    tracker = SeasonPartitions(check_interval_seconds=3600, lock_timeout_ms=100)
+
+    with pytest.raises(PartitionUnavailable):
+        asyncio.run(tracker.ensure(2031))
+    assert tracker.failures == 1
+    assert 2031 not in tracker.known
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    admin = User(id=uuid.uuid4(), email="admin@test", name="Admin", role=UserRole.ADMIN, is_active=True)
+
+    async def no_db() -> None:
+        return None
+
+    app.dependency_overrides[get_db_session] = no_db
+    app.dependency_overrides[get_current_admin] = lambda: admin
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_write_without_its_partition_is_503_not_409(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(partitions, "get_engine", _unreachable_engine)
+    monkeypatch.setattr(season_partitions, "known", set())
+
+    response = client.post("/api/schedules", json={"title": "Season opener", "starts_at": "2031-01-10T19:00:00+09:00"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
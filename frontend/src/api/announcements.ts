@@ -9,8 +9,19 @@ export interface Announcement {
   is_pinned: boolean;
 }
 
+// List rows carry a stored excerpt instead of the full content.
+export interface AnnouncementSummary {
+  id: string;
+  title: string;
+  summary: string;
+  content_length: number;
+  created_at: string;
+  updated_at: string;
+  is_pinned: boolean;
+}
+
 export const announcementsApi = {
-  getAnnouncements: async (): Promise<Announcement[]> => {
+  getAnnouncements: async (): Promise<AnnouncementSummary[]> => {
     const response = await apiClient.get('/announcements');
     return response.data;
   },
@@ -0,0 +1,18 @@
+import { apiClient } from './client';
+import { AnnouncementSummary } from './announcements';
+import { Schedule } from './schedules';
+import { ScoreTrend, UserProfile } from './users';
+
+export interface Dashboard {
+  me: UserProfile;
+  schedules: Schedule[];
+  announcements: AnnouncementSummary[];
+  score_trend: ScoreTrend[];
+}
+
+export const dashboardApi = {
+  getDashboard: async (): Promise<Dashboard> => {
+    const response = await apiClient.get('/dashboard');
+    return response.data;
+  },
+};
@@ -17,15 +17,74 @@ export interface Attendance {
   comment?: string;
 }
 
+export interface ScheduleScore {
+  id: string;
+  schedule_id: string;
+  user_id: string;
+  game_no: number;
+  score: number;
+  created_at: string;
+}
+
+export interface MemberScores {
+  user_id: string;
+  user_name: string;
+  games: ScheduleScore[];
+  average: number | null;
+  highest: number | null;
+}
+
+export interface ScheduleStats {
+  average: number | null;
+  min: number | null;
+  max: number | null;
+  count: number;
+}
+
+export interface ScheduleMonthEntry extends Schedule {
+  attend_count: number;
+  absent_count: number;
+  unknown_count: number;
+  score_average: number | null;
+  score_count: number;
+}
+
+export interface ScheduleFull {
+  schedule: Schedule;
+  attendance: (Attendance & { user_name: string })[] | null;
+  scores: MemberScores[] | null;
+  stats: ScheduleStats | null;
+}
+
+export const SCHEDULE_EVENT_TYPES = ['attendance', 'score', 'score_deleted', 'resync'] as const;
+
+export const openScheduleEvents = async (id: string): Promise<EventSource> => {
+  // EventSource cannot send an Authorization header, so the URL carries a short-lived token that only
+  // opens this schedule's stream instead of the access token.
+  const baseURL = (import.meta as any).env.VITE_API_URL || '/api';
+  const response = await apiClient.post(`/schedules/${id}/events/token`);
+  return new EventSource(`${baseURL}/schedules/${id}/events?token=${encodeURIComponent(response.data.token)}`);
+};
+
 export const schedulesApi = {
   getSchedules: async (): Promise<Schedule[]> => {
     const response = await apiClient.get('/schedules');
     return response.data;
   },
+  getMonthCalendar: async (month: string): Promise<ScheduleMonthEntry[]> => {
+    const response = await apiClient.get('/schedules/calendar', { params: { month } });
+    return response.data;
+  },
   getSchedule: async (id: string): Promise<Schedule> => {
     const response = await apiClient.get(`/schedules/${id}`);
     return response.data;
   },
+  getScheduleFull: async (id: string, include?: string[]): Promise<ScheduleFull> => {
+    const response = await apiClient.get(`/schedules/${id}/full`, {
+      params: include ? { include: include.join(',') } : undefined,
+    });
+    return response.data;
+  },
   getScheduleAttendance: async (id: string): Promise<Attendance[]> => {
     const response = await apiClient.get(`/schedules/${id}/attendance`);
     return response.data;
@@ -17,6 +17,36 @@ export interface ScoreTrend {
   highest: number;
 }
 
+export interface UserSearchParams {
+  q?: string;
+  role?: 'ADMIN' | 'MEMBER';
+  member_type?: 'FULL' | 'ASSOCIATE';
+  is_active?: boolean;
+  cursor?: string;
+  size?: number;
+}
+
+export interface UserSearchPage {
+  items: UserProfile[];
+  next_cursor: string | null;
+}
+
+export interface UserImportError {
+  row: number;
+  email: string | null;
+  detail: string;
+}
+
+export interface UserImportResult {
+  created: number;
+  users: UserProfile[];
+}
+
+export interface CalendarToken {
+  token: string;
+  url: string;
+}
+
 export const usersApi = {
   getMe: async (): Promise<UserProfile> => {
     const response = await apiClient.get('/auth/me');
@@ -41,10 +71,34 @@ export const usersApi = {
     const response = await apiClient.get('/attendance/me');
     return response.data;
   },
+  getCalendarToken: async (): Promise<CalendarToken | null> => {
+    try {
+      const response = await apiClient.get('/calendar/token');
+      return response.data;
+    } catch (err: any) {
+      if (err.response?.status === 404) return null;
+      throw err;
+    }
+  },
+  issueCalendarToken: async (): Promise<CalendarToken> => {
+    const response = await apiClient.post('/calendar/token');
+    return response.data;
+  },
+  revokeCalendarToken: async (): Promise<void> => {
+    await apiClient.delete('/calendar/token');
+  },
   getUsers: async (): Promise<UserProfile[]> => {
     const response = await apiClient.get('/users');
     return response.data;
   },
+  searchUsers: async (params: UserSearchParams): Promise<UserSearchPage> => {
+    const response = await apiClient.get('/users/search', { params });
+    return response.data;
+  },
+  importUsersCsv: async (csv: string): Promise<UserImportResult> => {
+    const response = await apiClient.post('/users/import', csv, { headers: { 'Content-Type': 'text/csv' } });
+    return response.data;
+  },
   getUser: async (id: string): Promise<UserProfile> => {
     const response = await apiClient.get(`/users/${id}`);
     return response.data;
@@ -38,7 +38,7 @@ const AnnouncementsPage: React.FC = () => {
               {notice.title}
             </h2>
             <p className="text-zinc-500 line-clamp-2 text-sm leading-relaxed">
-              {notice.content}
+              {notice.summary}
             </p>
           </Link>
         ))}
@@ -1,18 +1,17 @@
 import React from 'react';
 import { useQuery } from '@tanstack/react-query';
-import { schedulesApi } from '../api/schedules';
-import { announcementsApi } from '../api/announcements';
-import { usersApi } from '../api/users';
+import { dashboardApi } from '../api/dashboard';
 import { Link } from 'react-router-dom';
 import { format } from 'date-fns';
 import { Calendar, TrendingUp, Trophy, Megaphone, ArrowRight, User } from 'lucide-react';
 import { AreaChart, Area, ResponsiveContainer } from 'recharts';
 
 const DashboardPage: React.FC = () => {
-  const { data: user } = useQuery({ queryKey: ['me'], queryFn: usersApi.getMe });
-  const { data: schedules } = useQuery({ queryKey: ['schedules'], queryFn: schedulesApi.getSchedules });
-  const { data: announcements } = useQuery({ queryKey: ['announcements'], queryFn: announcementsApi.getAnnouncements });
-  const { data: scoreTrend } = useQuery({ queryKey: ['score-trend'], queryFn: usersApi.getScoreTrend });
+  const { data: dashboard } = useQuery({ queryKey: ['dashboard'], queryFn: dashboardApi.getDashboard });
+  const user = dashboard?.me;
+  const schedules = dashboard?.schedules;
+  const announcements = dashboard?.announcements;
+  const scoreTrend = dashboard?.score_trend;
 
   const nextSchedule = schedules?.[0];
   const latestNotice = announcements?.[0];
@@ -177,7 +176,7 @@ const DashboardPage: React.FC = () => {
                   {latestNotice.title}
                 </h4>
                 <p className="text-[#A3A3A3] line-clamp-2 text-base leading-relaxed max-w-2xl">
-                  {latestNotice.content}
+                  {latestNotice.summary}
                 </p>
               </div>
               <div className="mt-6 pt-6 border-t border-[#262626] flex items-center justify-between">
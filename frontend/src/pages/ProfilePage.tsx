@@ -6,6 +6,7 @@ import { toast } from 'sonner';
 const ProfilePage: React.FC = () => {
   const queryClient = useQueryClient();
   const { data: user } = useQuery({ queryKey: ['me'], queryFn: usersApi.getMe });
+  const { data: calendar } = useQuery({ queryKey: ['calendar-token'], queryFn: usersApi.getCalendarToken });
   
   const [name, setName] = useState(user?.name || '');
   const [description, setDescription] = useState(user?.description || '');
@@ -32,6 +33,30 @@ const ProfilePage: React.FC = () => {
     onError: (err: any) => toast.error(err.response?.data?.detail || 'CHANGE FAILED')
   });
 
+  const issueCalendarMutation = useMutation({
+    mutationFn: usersApi.issueCalendarToken,
+    onSuccess: (data) => {
+      queryClient.setQueryData(['calendar-token'], data);
+      toast.success('CALENDAR LINK CREATED');
+    },
+    onError: () => toast.error('LINK FAILED')
+  });
+
+  const revokeCalendarMutation = useMutation({
+    mutationFn: usersApi.revokeCalendarToken,
+    onSuccess: () => {
+      queryClient.setQueryData(['calendar-token'], null);
+      toast.success('CALENDAR LINK REVOKED');
+    },
+    onError: () => toast.error('REVOKE FAILED')
+  });
+
+  const copyCalendarUrl = async () => {
+    if (!calendar) return;
+    await navigator.clipboard.writeText(calendar.url);
+    toast.success('LINK COPIED');
+  };
+
   const handleProfileSubmit = (e: React.FormEvent) => {
     e.preventDefault();
     updateProfileMutation.mutate({ name, description });
@@ -140,6 +165,53 @@ const ProfilePage: React.FC = () => {
               {user?.role?.toUpperCase() || 'MEMBER'}
             </p>
           </div>
+
+          <div className="bg-zinc-900/50 p-6 rounded-2xl border border-zinc-800 space-y-4">
+            <div>
+              <h3 className="text-sm font-bold text-zinc-400 mb-2 uppercase tracking-wider">Calendar Subscription</h3>
+              <p className="text-zinc-500 text-sm">
+                Subscribe to this link in your phone calendar to see sessions and your attendance. Anyone with the link can read it.
+              </p>
+            </div>
+            {calendar && (
+              <input
+                type="text"
+                value={calendar.url}
+                readOnly
+                onFocus={(e) => e.target.select()}
+                className="w-full bg-zinc-900 border border-zinc-800 text-zinc-300 px-4 py-3 rounded-xl text-xs font-mono"
+              />
+            )}
+            <div className="flex gap-2">
+              {calendar && (
+                <button
+                  type="button"
+                  onClick={copyCalendarUrl}
+                  className="flex-1 bg-white text-black font-black py-2 rounded-xl hover:bg-zinc-200 transition-all"
+                >
+                  COPY
+                </button>
+              )}
+              <button
+                type="button"
+                onClick={() => issueCalendarMutation.mutate()}
+                disabled={issueCalendarMutation.isPending}
+                className="flex-1 bg-zinc-800 text-white font-black py-2 rounded-xl hover:bg-zinc-700 transition-all disabled:opacity-50"
+              >
+                {calendar ? 'NEW LINK' : 'CREATE LINK'}
+              </button>
+              {calendar && (
+                <button
+                  type="button"
+                  onClick={() => revokeCalendarMutation.mutate()}
+                  disabled={revokeCalendarMutation.isPending}
+                  className="flex-1 bg-zinc-800 text-red-400 font-black py-2 rounded-xl hover:bg-zinc-700 transition-all disabled:opacity-50"
+                >
+                  REVOKE
+                </button>
+              )}
+            </div>
+          </div>
         </section>
       </div>
     </div>
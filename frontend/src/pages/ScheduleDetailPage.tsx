@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { schedulesApi } from '../api/schedules';
+import { SCHEDULE_EVENT_TYPES, openScheduleEvents, schedulesApi } from '../api/schedules';
 import { usersApi } from '../api/users';
 import { format } from 'date-fns';
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
@@ -26,29 +26,53 @@ const ScheduleDetailPage: React.FC = () => {
 
   const { data: user } = useQuery({ queryKey: ['me'], queryFn: usersApi.getMe });
 
-  const { data: schedule, isLoading: isLoadingSchedule } = useQuery({
-    queryKey: ['schedule', id],
-    queryFn: () => schedulesApi.getSchedule(id!),
+  const { data: scheduleFull, isLoading: isLoadingSchedule } = useQuery({
+    queryKey: ['schedule-full', id],
+    queryFn: () => schedulesApi.getScheduleFull(id!),
     enabled: !!id,
   });
 
-  const { data: allAttendance } = useQuery({
-    queryKey: ['attendance', id],
-    queryFn: () => schedulesApi.getScheduleAttendance(id!),
-    enabled: !!id,
-  });
-
-  const { data: allScores } = useQuery({
-    queryKey: ['scores', id],
-    queryFn: () => schedulesApi.getScheduleScores(id!),
-    enabled: !!id,
-  });
+  useEffect(() => {
+    if (!id) return;
+    let source: EventSource | undefined;
+    let retry: ReturnType<typeof setTimeout> | undefined;
+    let stopped = false;
+    const refresh = () => queryClient.invalidateQueries({ queryKey: ['schedule-full', id] });
+    const reconnect = () => {
+      retry = setTimeout(connect, 3000);
+    };
+    const connect = async () => {
+      try {
+        source = await openScheduleEvents(id);
+      } catch {
+        if (!stopped) reconnect();
+        return;
+      }
+      if (stopped) {
+        source.close();
+        return;
+      }
+      SCHEDULE_EVENT_TYPES.forEach(type => source!.addEventListener(type, refresh));
+      // The stream token has expired by the time EventSource would retry, so reconnect with a new one
+      // and refetch whatever was missed in between.
+      source.onerror = () => {
+        source?.close();
+        refresh();
+        reconnect();
+      };
+    };
+    connect();
+    return () => {
+      stopped = true;
+      clearTimeout(retry);
+      source?.close();
+    };
+  }, [id, queryClient]);
 
-  const { data: scheduleStats } = useQuery({
-    queryKey: ['schedule-stats', id],
-    queryFn: () => id ? schedulesApi.getScheduleStats(id) : Promise.reject('No ID'),
-    enabled: !!id,
-  });
+  const schedule = scheduleFull?.schedule;
+  const allAttendance = scheduleFull?.attendance ?? undefined;
+  const allScores = scheduleFull?.scores?.flatMap(member => member.games);
+  const scheduleStats = scheduleFull?.stats ?? undefined;
 
   const { data: myHigh } = useQuery({
     queryKey: ['me-high'],
@@ -78,7 +102,7 @@ const ScheduleDetailPage: React.FC = () => {
   const attendanceMutation = useMutation({
     mutationFn: (status: string) => schedulesApi.updateMyAttendance(id!, status),
     onSuccess: (data: any) => {
-      queryClient.invalidateQueries({ queryKey: ['attendance', id] });
+      queryClient.invalidateQueries({ queryKey: ['schedule-full', id] });
       toast.success(`ATTENDANCE: ${data.status}`);
     },
     onError: () => toast.error('ATTENDANCE FAILED'),
@@ -88,8 +112,7 @@ const ScheduleDetailPage: React.FC = () => {
     mutationFn: async (scoreData: { score: number, game_no: number }) => 
       schedulesApi.submitScores(id!, scoreData.score, scoreData.game_no),
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['scores', id] });
-      queryClient.invalidateQueries({ queryKey: ['schedule-stats', id] });
+      queryClient.invalidateQueries({ queryKey: ['schedule-full', id] });
       queryClient.invalidateQueries({ queryKey: ['score-trend'] });
       queryClient.invalidateQueries({ queryKey: ['me-high'] });
     },
@@ -1,13 +1,13 @@
 import React, { useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { announcementsApi, Announcement } from '../../api/announcements';
+import { announcementsApi, Announcement, AnnouncementSummary } from '../../api/announcements';
 import { format } from 'date-fns';
 import { useForm } from 'react-hook-form';
 
 const AnnouncementsAdminPage: React.FC = () => {
   const queryClient = useQueryClient();
   const [isModalOpen, setIsModalOpen] = useState(false);
-  const [editingAnnouncement, setEditingAnnouncement] = useState<Announcement | null>(null);
+  const [editingAnnouncement, setEditingAnnouncement] = useState<AnnouncementSummary | null>(null);
 
   const { data: announcements, isLoading } = useQuery({
     queryKey: ['admin', 'announcements'],
@@ -50,10 +50,12 @@ const AnnouncementsAdminPage: React.FC = () => {
     }
   };
 
-  const openEditModal = (announcement: Announcement) => {
+  const openEditModal = async (announcement: AnnouncementSummary) => {
+    // The list only has the summary; load the full text for editing.
+    const full = await announcementsApi.getAnnouncement(announcement.id);
     setEditingAnnouncement(announcement);
-    setValue('title', announcement.title);
-    setValue('content', announcement.content);
+    setValue('title', full.title);
+    setValue('content', full.content);
     setIsModalOpen(true);
   };
 
@@ -101,7 +103,7 @@ const AnnouncementsAdminPage: React.FC = () => {
                 <span className="text-blue-500/50 text-[10px] font-black uppercase tracking-widest">Notice</span>
               </div>
               <h3 className="text-xl font-bold text-white group-hover:text-blue-400 transition-colors">{announcement.title}</h3>
-              <p className="text-[#A3A3A3] text-sm line-clamp-1 max-w-2xl">{announcement.content}</p>
+              <p className="text-[#A3A3A3] text-sm line-clamp-1 max-w-2xl">{announcement.summary}</p>
             </div>
             
             <div className="flex items-center gap-2">
@@ -1,16 +1,26 @@
-import React, { useState } from 'react';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { usersApi, UserProfile } from '../../api/users';
+import React, { useEffect, useState } from 'react';
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { usersApi, UserImportError, UserProfile } from '../../api/users';
 import { Link } from 'react-router-dom';
 
 const MembersPage: React.FC = () => {
   const queryClient = useQueryClient();
   const [searchTerm, setSearchTerm] = useState('');
-  
-  const { data: users, isLoading } = useQuery({
-    queryKey: ['admin', 'users'],
-    queryFn: usersApi.getUsers
+  const [query, setQuery] = useState('');
+
+  // Search on the server once typing pauses, instead of filtering a downloaded page.
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(searchTerm.trim()), 250);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  const { data, isLoading, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
+    queryKey: ['admin', 'users', 'search', query],
+    queryFn: ({ pageParam }) => usersApi.searchUsers({ q: query || undefined, cursor: pageParam, size: 50 }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined
   });
+  const filteredUsers = data?.pages.flatMap(page => page.items);
 
   const deleteMutation = useMutation({
     mutationFn: usersApi.deleteUser,
@@ -19,10 +29,29 @@ const MembersPage: React.FC = () => {
     }
   });
 
-  const filteredUsers = users?.filter(user => 
-    user.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    user.email.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  const importMutation = useMutation({
+    mutationFn: usersApi.importUsersCsv,
+    onSuccess: (result) => {
+      queryClient.invalidateQueries({ queryKey: ['admin', 'users'] });
+      window.alert(`Imported ${result.created} members.`);
+    },
+    onError: (err: any) => {
+      // The server checks every row first and reports each problem; nothing is imported then.
+      const detail = err.response?.data?.detail;
+      const message = Array.isArray(detail)
+        ? detail.map((e: UserImportError) => `Row ${e.row}${e.email ? ` (${e.email})` : ''}: ${e.detail}`).join('\n')
+        : detail ?? 'Import failed.';
+      window.alert(message);
+    }
+  });
+
+  const handleImport = async (e: React.ChangeEvent<HTMLInputElement>) => {
+    const file = e.target.files?.[0];
+    e.target.value = '';
+    if (file) {
+      importMutation.mutate(await file.text());
+    }
+  };
 
   const handleDelete = (id: string, name: string) => {
     if (window.confirm(`Are you sure you want to delete ${name}?`)) {
@@ -39,15 +68,24 @@ const MembersPage: React.FC = () => {
           </h1>
           <p className="text-[#A3A3A3] mt-1 font-medium">Manage and monitor club members.</p>
         </div>
-        <div className="flex items-center gap-2 bg-[#171717] border border-[#262626] rounded-2xl px-4 py-2 focus-within:border-blue-500 transition-colors">
-          <svg className="text-[#A3A3A3]" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round"><circle cx="11" cy="11" r="8"/><path d="m21 21-4.3-4.3"/></svg>
-          <input 
-            type="text" 
-            placeholder="Search members..." 
-            className="bg-transparent border-none focus:ring-0 text-white placeholder-zinc-600 text-sm w-64"
-            value={searchTerm}
-            onChange={(e) => setSearchTerm(e.target.value)}
-          />
+        <div className="flex items-center gap-3">
+          <label
+            title="CSV columns: email, password, name, role, member_type, description"
+            className={`px-4 py-2 rounded-2xl border border-[#262626] bg-[#171717] text-sm font-bold text-[#A3A3A3] hover:text-white hover:border-blue-500 transition-colors cursor-pointer ${importMutation.isPending ? 'opacity-50 pointer-events-none' : ''}`}
+          >
+            {importMutation.isPending ? 'Importing...' : 'Import CSV'}
+            <input type="file" accept=".csv,text/csv" className="hidden" onChange={handleImport} />
+          </label>
+          <div className="flex items-center gap-2 bg-[#171717] border border-[#262626] rounded-2xl px-4 py-2 focus-within:border-blue-500 transition-colors">
+            <svg className="text-[#A3A3A3]" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round"><circle cx="11" cy="11" r="8"/><path d="m21 21-4.3-4.3"/></svg>
+            <input 
+              type="text" 
+              placeholder="Search members..." 
+              className="bg-transparent border-none focus:ring-0 text-white placeholder-zinc-600 text-sm w-64"
+              value={searchTerm}
+              onChange={(e) => setSearchTerm(e.target.value)}
+            />
+          </div>
         </div>
       </header>
 
@@ -114,6 +152,17 @@ const MembersPage: React.FC = () => {
             </tbody>
           </table>
         </div>
+        {hasNextPage && (
+          <div className="border-t border-[#262626] px-8 py-4 text-center">
+            <button
+              onClick={() => fetchNextPage()}
+              disabled={isFetchingNextPage}
+              className="text-sm font-bold text-blue-500 hover:text-blue-400 disabled:text-[#A3A3A3] transition-colors"
+            >
+              {isFetchingNextPage ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );